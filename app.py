@@ -1,34 +1,45 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import re
-import unicodedata
-import time
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
+
+from search_core import LexicalIndex, ResultSet, BrowseResults, MergedResults, merge_results, rank_candidates
+from fts_backend import FtsLexicalIndex
+from sharded_index import ShardedIndex
+from reranker import CrossEncoderReranker
+from sheet_fetch import fetch_sheet, SheetSchemaError, STALE as SHEET_STALE
+from corpus_store import CorpusStore, prepare_corpus, compute_index_version, CORPUS_PREPARE_VERSION
+from refresher import BackgroundRefresher
+from collection_registry import CollectionRegistry
+from text_processing import clean_for_search
+from embedders import GEMINI_PROVIDER, embed_model_name, load_embedder, encode_corpus
+from keywords import EN_STOPWORDS, pick_english_source_column, extract_top_keywords, extract_hindi_keywords
+from catalog_watcher import CatalogWatcher
+from satsang_catalog import SHARE_LINK, share_text as build_share_text
+from archive_index import ArchiveIndex, build_archive_index
+from satsang_payload import PayloadCache, fragment_key, parse_fragment_key
+from cross_links import CrossLinks, CrossLinkCache
+from image_assets import ImageAssets
+from artifacts import load_artifacts, read_manifest, current_version as current_artifact_version
 
 # Gemini (same library style as your original code)
 import google.generativeai as genai
 
 
-import base64
-
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def get_base64_image(image_path):
-    # Use absolute path relative to script location
-    full_path = os.path.join(SCRIPT_DIR, image_path)
-    if os.path.exists(full_path):
-        with open(full_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    # Fallback: try original path
-    if os.path.exists(image_path):
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    return ""
+@st.cache_resource(show_spinner=False)
+def get_image_assets() -> ImageAssets:
+    # Resized WebP/JPEG variants, made once per image version (see image_assets.py);
+    # served as app/static URLs when static serving is on, else inlined once-encoded
+    static_url = "app/static" if st.get_option("server.enableStaticServing") else None
+    return ImageAssets(os.path.join(SCRIPT_DIR, "static"), static_url)
 
 # ============================================================
 # 1) PAGE CONFIG
@@ -322,12 +333,13 @@ st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 # ============================================================
 # Using Streamlit columns for proper image display
 # ============================================================
-# BRANDED HEADER WITH PHOTOS (Base64 Flexbox for Perfect Alignment)
+# BRANDED HEADER WITH PHOTOS (Flexbox for Perfect Alignment)
 # ============================================================
-img_left_b64 = get_base64_image("static/radha_krishna.jpg")
-img_right_b64 = get_base64_image("static/vinod_baba.jpg")
+HEADER_IMAGE_STYLE = "border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.2);"
+img_left = get_image_assets().img("radha_krishna.jpg", 110, HEADER_IMAGE_STYLE)
+img_right = get_image_assets().img("vinod_baba.jpg", 110, HEADER_IMAGE_STYLE)
 
-st.markdown(f"""<style>@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@400;600;700&display=swap');</style><div style="display: flex; align-items: center; justify-content: space-between; background: transparent; padding: 0; margin-bottom: 2rem; gap: 15px;"><div style="flex: 0 0 auto;"><img src="data:image/jpg;base64,{img_left_b64}" style="height: 110px; border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.2);"></div><div style="flex: 1; text-align: center; padding: 10px 15px; background: linear-gradient(135deg, rgba(255, 153, 51, 0.95), rgba(139, 0, 0, 0.95)); border-radius: 15px; box-shadow: 0 4px 15px rgba(139, 0, 0, 0.3); color: white; display: flex; align-items: center; justify-content: center; height: 110px;"><p style="margin: 0; font-weight: 700; font-size: 1.35rem; font-family: 'Poppins', sans-serif; letter-spacing: 0.5px; text-shadow: 1px 1px 3px rgba(0,0,0,0.3); line-height: 1.4;">🙏 श्री श्री 108 श्री विनोद बाबाजी महाराज<br><span style="font-size: 1.15rem;">Sri Sri 108 Sri Vinod Baba Ji Maharaj</span></p></div><div style="flex: 0 0 auto;"><img src="data:image/jpg;base64,{img_right_b64}" style="height: 110px; border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.2);"></div></div>""", unsafe_allow_html=True)
+st.markdown(f"""<style>@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@400;600;700&display=swap');</style><div style="display: flex; align-items: center; justify-content: space-between; background: transparent; padding: 0; margin-bottom: 2rem; gap: 15px;"><div style="flex: 0 0 auto;">{img_left}</div><div style="flex: 1; text-align: center; padding: 10px 15px; background: linear-gradient(135deg, rgba(255, 153, 51, 0.95), rgba(139, 0, 0, 0.95)); border-radius: 15px; box-shadow: 0 4px 15px rgba(139, 0, 0, 0.3); color: white; display: flex; align-items: center; justify-content: center; height: 110px;"><p style="margin: 0; font-weight: 700; font-size: 1.35rem; font-family: 'Poppins', sans-serif; letter-spacing: 0.5px; text-shadow: 1px 1px 3px rgba(0,0,0,0.3); line-height: 1.4;">🙏 श्री श्री 108 श्री विनोद बाबाजी महाराज<br><span style="font-size: 1.15rem;">Sri Sri 108 Sri Vinod Baba Ji Maharaj</span></p></div><div style="flex: 0 0 auto;">{img_right}</div></div>""", unsafe_allow_html=True)
 
 # ============================================================
 # GLOBAL TRANSLATE WIDGET
@@ -381,7 +393,16 @@ TRANSLATIONS = {
         "viewing_file": "Viewing: {file}",
         "nav_home": "Home",
         "nav_search": "Search Q&A",
-        "nav_satsang": "Satsang Notes"
+        "nav_satsang": "Satsang Notes",
+        "refining": "⏳ Showing word matches - refining with meaning-based search...",
+        "similar_questions": "+{count} similar",
+        "archive_search": "🔎 Search all satsangs...",
+        "archive_indexing": "⏳ The satsang archive is being indexed - search will be available shortly.",
+        "archive_no_results": "No satsang matched your search.",
+        "archive_long": "Detailed",
+        "archive_short": "Short",
+        "related_satsangs": "Related satsang",
+        "related_questions": "Related questions ({count})"
     },
     "Hindi": {
         "page_title": "प्रियाकुंज में आपका स्वागत है",
@@ -413,7 +434,16 @@ TRANSLATIONS = {
         "viewing_file": "देख रहे हैं: {file}",
         "nav_home": "मुख्य पृष्ठ",
         "nav_search": "प्रश्नोत्तर खोज",
-        "nav_satsang": "सत्संग नोट्स"
+        "nav_satsang": "सत्संग नोट्स",
+        "refining": "⏳ शब्द-मिलान दिखा रहे हैं - अर्थ-आधारित खोज से परिणाम बेहतर हो रहे हैं...",
+        "similar_questions": "+{count} मिलते-जुलते प्रश्न",
+        "archive_search": "🔎 सभी सत्संगों में खोजें...",
+        "archive_indexing": "⏳ सत्संग संग्रह की अनुक्रमणिका बन रही है - खोज शीघ्र उपलब्ध होगी।",
+        "archive_no_results": "आपकी खोज से कोई सत्संग नहीं मिला।",
+        "archive_long": "विस्तृत",
+        "archive_short": "संक्षिप्त",
+        "related_satsangs": "संबंधित सत्संग",
+        "related_questions": "संबंधित प्रश्न ({count})"
     }
 }
 
@@ -424,169 +454,14 @@ def get_text(key, target_lang="English", **kwargs):
         return t.format(**kwargs)
     return t
 
-# ============================================================
-# HELPER: SATSANG METADATA EXTRACTION
-# ============================================================
-def extract_satsang_metadata(file_path):
-    """
-    Parses HTML file to find:
-    1. Date (DD-MMM-YYYY or DD-MM-YYYY)
-    2. Strings like 'विषय :' or the main <h1> title to use as 'Vishay'
-    Returns dict: { 'date_obj': date|None, 'date_str': str, 'title': str }
-    """
-    import datetime
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            
-        # 1. Extract Date
-        # patterns: 11-DEC-2025, 11-Dec-2025, 11/12/2025, 11-12-2025
-        date_obj = None
-        date_str = ""
-        
-        # Regex for DD-MMM-YYYY (e.g., 11-DEC-2025)
-        match_date_text = re.search(r"(\d{1,2})-(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)-(\d{4})", content, re.IGNORECASE)
-        if match_date_text:
-            d, m, y = match_date_text.groups()
-            date_str = f"{d}-{m.upper()}-{y}"
-            try:
-                date_obj = datetime.datetime.strptime(date_str, "%d-%b-%Y").date()
-            except:
-                pass
-        
-        # Fallback date regex: DD-MM-YYYY
-        if not date_obj:
-            match_date_num = re.search(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})", content)
-            if match_date_num:
-                d, m, y = match_date_num.groups()
-                date_str = f"{d}-{m}-{y}"
-                try:
-                    date_obj = datetime.datetime.strptime(date_str, "%d-%m-%Y").date()
-                except:
-                    pass
-
-        # 2. Extract Title (Vishay)
-        # Priority 1: Line containing "विषय :" (Vishay :)
-        title = "Daily Satsang"
-        match_vishay = re.search(r"विषय\s*[:|-]\s*(.*?)<", content) 
-        if not match_vishay:
-            # try without < at end if just raw text
-            match_vishay = re.search(r"विषय\s*[:|-]\s*(.*)", content)
-            
-        if match_vishay:
-            title = match_vishay.group(1).strip()
-            # remove HTML tags if any slipped in
-            title = re.sub(r"<[^>]+>", "", title).strip()
-        else:
-            # Priority 2: content of first <h1>
-            match_h1 = re.search(r"<h1[^>]*>(.*?)</h1>", content, re.DOTALL | re.IGNORECASE)
-            if match_h1:
-                raw_h1 = match_h1.group(1)
-                # clean tags
-                title = re.sub(r"<[^>]+>", "", raw_h1).strip()
-        
-        # Final formatting: "Title | DD, MMM, YYYY"
-        # If we have a valid date object, format nicely
-        display_date = date_str
-        if date_obj:
-            display_date = date_obj.strftime("%d, %b, %Y")
-            
-        full_title = title
-        if display_date:
-            full_title = f"{title} | {display_date}"
-            
-        return {
-            "date_obj": date_obj,
-            "date_str": display_date,
-            "title": title,
-            "full_title": full_title
-        }
-        
-    except Exception as e:
-        print(f"Metadata parsing error for {file_path}: {e}")
-        return {"date_obj": None, "date_str": "", "title": "Satsang", "full_title": "Satsang"}
-
-WHATSAPP_PATTERNS = [
-    r"\b\d{1,2}/\d{1,2}/\d{2,4},\s*\d{1,2}:\d{2}\s*(AM|PM)\s*-\s*",  # "1/10/25, 7:11 PM -"
-    r"\b\d{1,2}:\d{2}\s*(AM|PM)\b",                                # "7:11 PM"
-]
-
-DEVOTIONAL_PHRASES_HI = [
-    "दंडवत प्रणाम", "दण्डवत प्रणाम", "दंडवत", "दण्डवत",
-    "प्रणाम", "प्रणाम जी", "प्रणामजी",
-    "जय गुरु", "जय गुरु।", "जय गुरुजी", "जय गुरुदेव",
-    "प्रभु जी", "प्रभुजी", "प्रभु जी।",
-    "राधे राधे", "जय श्री राधे", "श्री राधे",
-    "हरी बोल", "हरि बोल", "गौर हरि बोल", "निताई गौर हरि बोल",
-]
-
-DEVOTIONAL_PHRASES_ROMAN = [
-    "dandavat pranam", "dandavat", "pranam",
-    "jai guru", "jai gurudev",
-    "prabhu ji", "prabhuji",
-    "radhe radhe", "hari bol",
-    "nitai gaur hari bol", "gaur hari bol",
-]
-
-# English stopwords (prevents false lexical matches for English queries)
-EN_STOPWORDS = {
-    "a","an","and","are","as","at","be","but","by","for","from","has","have","he","her",
-    "his","i","if","in","into","is","it","its","me","my","not","of","on","or","our",
-    "she","so","that","the","their","them","then","there","these","they","this","to",
-    "was","we","were","what","when","where","which","who","will","with","you","your",
-    "am","able","can","cant","cannot","could","couldnt","do","does","doesnt","did","didnt",
-    "been","being","im","ive","id","ill","wont","dont","isnt","arent","wasnt","werent"
-}
-
-# ============================================================
-# SLICER STOPWORDS (strong filtering for UI only)
-# ============================================================
-SLICER_STOPWORDS = {
-    # generic English glue
-    "should", "how", "why", "when", "where", "which", "who",
-    "during", "since", "only", "also", "down", "up", "into",
-    "from", "about", "after", "before", "over", "under", "within",
-
-    # devotional / names (not search intents)
-    "radheshyam", "radhe", "shyam", "shri",
-    "baba", "babaji", "gurudev", "guru", "ji",
-    "lord", "prabhu", "dev",
-    "babashri", "maharaj",
-
-    # politeness / structure
-    "please", "kindly", "guide", "guidance",
-    "salutations", "bow", "feet", "ground",
-    "question",
-
-    # weak verbs / fillers
-    "do", "does", "did", "done", "make", "made",
-    "use", "using", "used", "get", "got",
-    "day", "month", "year", "time",
-    "want", "show", "everything", "full"
-}
-
-# Common Hindi stopwords to ignore in slicers
-HI_STOPWORDS = {
-    "के", "का", "एक", "में", "की", "है", "यह", "और", "से", "हैं", "को", "पर", "इस", "होता", "कि", "जो",
-    "कर", "मे", "गया", "करने", "किया", "लिये", "अपने", "ने", "बनी", "नहीं", "तो", "ही", "या", "एवं", "दिया",
-    "हो", "इसका", "था", "द्वारा", "हुआ", "तक", "साथ", "करना", "वाले", "बाद", "लिए", "आप", "कुछ", "सकते",
-    "किसी", "ये", "इसके", "सबसे", "इसमें", "थे", "दो", "मगर", "वह", "भी", "सकता", "हर", "जाने", "अपना",
-    "वे", "जिसे", "गई", "ऐसे", "जिसके", "लिए", "जाता", "बहुत", "कहा", "वर्ग", "कई", "करें", "होती", "वाले",
-    "कम", "से", "थी", "हुई", "जा", "न", "जिस", "किस", "तथा", "हूँ", "मै", "मैं", "मेरा", "मेरी", "मेरे",
-    "मुझे", "हम", "हमारा", "हमारे", "हमें", "तुम", "तुम्हारा", "तुम्हारे", "तुम्हें", "आपका", "आपकी", "आपके",
-    "क्या", "क्यों", "कैसे", "कब", "कहाँ", "कौन", "जी", "साहब", "सर", "श्री", "श्रीमती", "कुमार", "कुमारी",
-    "सवाल", "प्रश्न", "उत्तर", "जवाब", "चाहिए", "चाहता", "चाहती", "चाहते", "रहा", "रही", "रहे",
-    "बारे", "पास", "दूर", "सब", "सभी", "सारा", "पूरी", "पूरा",
-    # Specific removals requested
-    "जैसे", "बाबा", "राधे", "श्याम", "राधेश्याम", "कोई", "कृपया",
-    "मिल", "करते", "कल", "बताया", "लेना", "समय", "उसमें", "जय", "भगवान", "देव",
-    "गुरु",
-    # Additional removals
-    "कृपा", "मार्गदर्शन", "jae", "जाए", "जाएं", "वो", "करे", "करें", "कभी", "अगर",
-    "उसके", "उसकी", "उसे", "उनका", "उनकी", "उनके", "उन्हें",
-    "यहाँ", "वहाँ", "जहां", "अब", "जब", "तब"
-}
+def pick_display_text(row, view_lang: str) -> tuple[str, str]:
+    """(question, answer) to show for the selected view language."""
+    if view_lang == "English":
+        use_tq = bool(str(row.get("Translated Question", "")).strip())
+        use_ta = bool(str(row.get("Translated Answer", "")).strip())
+        return (str(row.get("Translated Question" if use_tq else "Question", "")).strip(),
+                str(row.get("Translated Answer" if use_ta else "Answer", "")).strip())
+    return str(row.get("Question", "")).strip(), str(row.get("Answer", "")).strip()
 
 # ============================================================
 # 2A) SYNONYM EXPANSION (COMMON SCENARIOS)
@@ -774,120 +649,6 @@ EN_STOPWORDS_UI = EN_STOPWORDS | {
     "radhe","shyam","pranam","thanks","thank"
 }
 
-def pick_english_source_column(df: pd.DataFrame) -> str | None:
-    # Preferred: English Text
-    for col in ["English Text", "English", "Translated Question", "Translated Answer"]:
-        if col in df.columns:
-            return col
-    return None
-
-def extract_top_keywords(df: pd.DataFrame, col: str, top_n: int = 30) -> list[str]:
-    """
-    Extract intent-worthy English keywords for slicers.
-    Rules:
-    - English alphabetic words only
-    - length >= 4
-    - remove EN_STOPWORDS + SLICER_STOPWORDS
-    - frequency-based ranking
-    """
-    freq = {}
-    series = df[col].fillna("").astype(str)
-
-    for text in series:
-        text = clean_for_search(text).lower()
-
-        # Only alphabetic English words, min length 4
-        tokens = re.findall(r"[a-z]{4,}", text)
-
-        for t in tokens:
-            if t in EN_STOPWORDS:
-                continue
-            if t in SLICER_STOPWORDS:
-                continue
-            freq[t] = freq.get(t, 0) + 1
-
-    ranked = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
-    return [k for k, _ in ranked[:top_n]]
-
-def extract_hindi_keywords(df: pd.DataFrame, top_n: int = 30) -> list[str]:
-    """
-    Extract useful Hindi keywords for slicers.
-    Rules:
-    - Tokenize using whitespace
-    - Remove HI_STOPWORDS
-    - Min length 2
-    - Frequency ranking
-    """
-    freq = {}
-    # Use "Question" column for source
-    series = df["Question"].fillna("").astype(str)
-
-    for text in series:
-        # Simple split by whitespace
-        # (For better Devanagari tokenization, we can use clean_for_search first)
-        text = clean_for_search(text)
-        tokens = text.split()
-
-        for t in tokens:
-            # Check if likely Devanagari
-            if not any("\u0900" <= ch <= "\u097F" for ch in t):
-                continue
-            
-            # Stopword filter
-            if t in HI_STOPWORDS:
-                continue
-            
-            # Length filter
-            if len(t) < 2:
-                continue
-                
-            freq[t] = freq.get(t, 0) + 1
-
-    ranked = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
-    return [k for k, _ in ranked[:top_n]]
-
-
-def normalize_text(s: str) -> str:
-    s = "" if s is None else str(s)
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("\u200c", "").replace("\u200d", "")  # ZWNJ/ZWJ
-    return s
-
-def remove_devotional_boilerplate(s: str) -> str:
-    s = normalize_text(s)
-    low = s.lower()
-
-    for p in DEVOTIONAL_PHRASES_ROMAN:
-        low = low.replace(p, " ")
-
-    for p in DEVOTIONAL_PHRASES_HI:
-        low = low.replace(p.lower(), " ")
-        low = re.sub(rf"\b{re.escape(p.lower())}\b[।.!?,;:]*", " ", low)
-
-    low = re.sub(r"\s+", " ", low).strip()
-    return low
-
-def clean_for_search(s: str) -> str:
-    s = normalize_text(s)
-
-    # Remove phone numbers
-    s = re.sub(r"\+?\d[\d\s\-]{8,}\d", " ", s)
-
-    # Remove WhatsApp timestamps
-    for pat in WHATSAPP_PATTERNS:
-        s = re.sub(pat, " ", s, flags=re.IGNORECASE)
-
-    # Remove WhatsApp system fragments
-    s = re.sub(r"\badded\b.*", " ", s, flags=re.IGNORECASE)
-
-    # Remove devotional boilerplate
-    s = remove_devotional_boilerplate(s)
-
-    # Keep letters/numbers/underscore/space + Devanagari
-    s = re.sub(r"[^\w\s\u0900-\u097F]", " ", s)
-
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
 
 def tokenize_hi_en(q: str) -> list[str]:
     """
@@ -970,108 +731,6 @@ def expand_tokens(tokens: list[str], query_text: str) -> list[str]:
     return [x for x in expanded if x]
 
 
-def lexical_score(query: str, text: str, phrase_boost: bool = True) -> float:
-    q_clean = clean_for_search(query).lower()
-    t = (text or "").lower()
-
-    base_toks = tokenize_hi_en(query)
-    toks = expand_tokens(base_toks, query)
-
-    if not toks:
-        return 0.0
-
-    hits = sum(1 for tok in toks if tok in t)
-    score = hits / len(toks)
-
-    # Phrase boost for short queries
-    if phrase_boost and len(base_toks) <= 2 and q_clean and (q_clean in t):
-        score = min(1.0, score + 0.5)
-
-    return float(score)
-
-
-# ============================================================
-# 3) EMBEDDERS
-# ============================================================
-class GoogleEmbedder:
-    """
-    Gemini embeddings using google.generativeai.
-    Robust parsing + retries; returns stable numpy arrays.
-    """
-    def __init__(self, api_key: str, model_name: str = "models/text-embedding-004"):
-        self.api_key = api_key
-        self.model_name = model_name
-        genai.configure(api_key=api_key)
-
-    @staticmethod
-    def _extract_embedding(result):
-        if isinstance(result, dict):
-            if "embedding" in result:
-                return result["embedding"]
-            if "embeddings" in result:
-                return result["embeddings"]
-        if hasattr(result, "embedding"):
-            return getattr(result, "embedding")
-        if hasattr(result, "embeddings"):
-            return getattr(result, "embeddings")
-        return None
-
-    def _embed_one(self, text: str, task_type: str, max_retries: int = 3):
-        last_err = None
-        for attempt in range(max_retries):
-            try:
-                r = genai.embed_content(
-                    model=self.model_name,
-                    content=text,
-                    task_type=task_type
-                )
-                emb = self._extract_embedding(r)
-
-                if isinstance(emb, list) and emb and isinstance(emb[0], (float, int)):
-                    return [float(x) for x in emb]
-
-                if isinstance(emb, dict) and "values" in emb:
-                    return [float(x) for x in emb["values"]]
-
-                if isinstance(emb, list) and emb and isinstance(emb[0], (list, tuple)):
-                    return [float(x) for x in emb[0]]
-
-                return None
-            except Exception as e:
-                last_err = e
-                time.sleep(0.6 * (2 ** attempt))
-
-        st.warning(f"Gemini embedding failed for a text: {last_err}")
-        return None
-
-    def encode(self, texts: list[str], task_type: str = "retrieval_document",
-               max_retries: int = 3) -> np.ndarray:
-        vectors: list[list[float] | None] = []
-        dim: int | None = None
-
-        for t in texts:
-            v = self._embed_one(t, task_type=task_type, max_retries=max_retries)
-            if v is not None and dim is None:
-                dim = len(v)
-            vectors.append(v)
-
-        if dim is None:
-            return np.array([])
-
-        fixed = []
-        for v in vectors:
-            if v is None or len(v) != dim:
-                fixed.append([0.0] * dim)
-            else:
-                fixed.append(v)
-
-        return np.array(fixed, dtype=np.float32)
-
-    def encode_query(self, text: str) -> np.ndarray:
-        vec = self.encode([text], task_type="retrieval_query")
-        return vec if vec.size else np.array([])
-
-
 # ============================================================
 # 3B) TRANSLATION BRIDGE (English -> Hindi) for better recall
 # ============================================================
@@ -1110,71 +769,396 @@ def translate_to_hindi_if_english(q: str, api_key: str) -> str:
 # ============================================================
 # 4) LOAD DATA (Google Sheet CSV)
 # ============================================================
-@st.cache_data(ttl=600)
-def load_data():
-    SHEET_ID = "1JtpDSVREK0pH2CwOMktqdQaS8zvBNox1444dkTfnjws"
-    GID = "1635748443"
-    url = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid={GID}"
+SHEET_ID = "1JtpDSVREK0pH2CwOMktqdQaS8zvBNox1444dkTfnjws"
+GID = "1635748443"
+SHEET_URL = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid={GID}"
+
+# Last good cleaned corpus (Parquet) + ETag/hash metadata
+SNAPSHOT_DIR = os.path.join(SCRIPT_DIR, ".cache", "sheet")
+# Prebuilt corpus + indexes from build_artifacts.py; used instead of the sheet when present
+ARTIFACT_DIR = os.path.join(SCRIPT_DIR, "artifacts")
+
+# Collections (e.g. per language, year or satsang series): each has its own
+# sheet, snapshot and artifacts and is loaded on first use (see 6C). The
+# default one keeps the top-level SNAPSHOT_DIR / ARTIFACT_DIR; others use a
+# subdirectory named after the collection.
+COLLECTIONS = {
+    "main": {"label": "Satsang Q&A", "sheet_url": SHEET_URL},
+}
+DEFAULT_COLLECTION = "main"
+ALL_COLLECTIONS = "__all__"
+# Loaded collections beyond this are evicted, least recently used first
+COLLECTION_MEMORY_CAP_MB = 1024
+
+def collection_dir(base: str, collection: str) -> str:
+    return base if collection == DEFAULT_COLLECTION else os.path.join(base, collection)
+
+def load_data(previous: CorpusStore | None = None, collection: str = DEFAULT_COLLECTION):
+    """
+    (corpus, error). Called by the search-state refresher (see 6C), not per
+    rerun. If the sheet did not change, `previous` is returned as-is, so the
+    caller can tell "nothing to rebuild" by identity.
+    """
+    snapshot_dir = collection_dir(SNAPSHOT_DIR, collection)
+    try:
+        df, source = fetch_sheet(COLLECTIONS[collection]["sheet_url"], snapshot_dir, prepare_corpus,
+                                 prepare_version=CORPUS_PREPARE_VERSION, reuse=previous)
+        if source == SHEET_STALE:
+            print(f"Sheet fetch failed; serving last snapshot from {snapshot_dir}")
+        if df is previous:
+            return previous, None
+        return CorpusStore.from_frame(df), None
+
+    except SheetSchemaError as e:
+        return None, f"Error: {e}"
+    except Exception as e:
+        return None, f"Could not load data. Error: {e}"
+
 
+# ============================================================
+# 5) BUILD EMBEDDING INDEX
+# ============================================================
+def build_index(provider: str, api_key: str, corpus: CorpusStore):
+    # Runs once per corpus version, on the refresher thread (see 6C)
     try:
-        df = pd.read_csv(url).fillna("")
+        if provider == GEMINI_PROVIDER and not api_key:
+            return None, None, "Please enter a Google API Key."
+        model = load_embedder(provider, api_key)
+        embeddings = encode_corpus(model, provider, corpus["embed_text"].tolist())
+        if embeddings.size == 0:
+            return None, None, "Failed to build Gemini embeddings index."
+        return model, embeddings, None
+
+    except Exception as e:
+        return None, None, f"Error initializing {provider}: {e}"
+
+
+# ============================================================
+# 6) SEARCH ENGINE
+# ============================================================
+SEARCH_MODES = ("Hybrid (Recommended)", "Semantic Only", "Literal Only")
 
-        if "Question" not in df.columns:
-            return pd.DataFrame(), "Error: 'Question' column missing from sheet."
-        if "Answer" not in df.columns:
-            df["Answer"] = ""
-        if "Translated Question" not in df.columns:
-            df["Translated Question"] = ""
-        if "Translated Answer" not in df.columns:
-            df["Translated Answer"] = ""
+# Hidden defaults - no UI exposed
+use_phrase_match = True
+top_k = 40          # semantic candidates
+lex_top_k = 40      # lexical candidates (unioned with the semantic ones in Hybrid)
+fusion_method = "weighted"  # or "rrf" (reciprocal rank fusion)
+lexical_backend = "memory"  # or "fts5": on-disk SQLite FTS5 index shared by processes
+LEXICAL_DB_DIR = os.path.join(SCRIPT_DIR, ".cache", "lexical")
+index_shards = 1    # >1 (memory backend): split rows into shards scored in parallel, see sharded_index.py
+short_query_requires_lex = True
+semantic_weight = 0.75
+HIGH_SEM_OVERRIDE = 0.62
 
-        df = df.reset_index(drop=True)
+# Optional second stage: cross-encoder rerank of the fused head (CPU)
+enable_rerank = False
+rerank_top_n = 50
+rerank_time_budget_s = 0.8  # stop reranking after this; the rest keeps fused order
 
-        # Clean fields
-        df["clean_question"] = df["Question"].apply(clean_for_search)
-        df["clean_translated_q"] = df["Translated Question"].apply(clean_for_search)
-        df["clean_answer"] = df["Answer"].apply(clean_for_search)
-        df["clean_translated_a"] = df["Translated Answer"].apply(clean_for_search)
+def build_lexical_index(version: str, backend: str, corpus: CorpusStore) -> LexicalIndex | FtsLexicalIndex:
+    if backend == "fts5":
+        return FtsLexicalIndex(LEXICAL_DB_DIR, version, corpus)
+    return LexicalIndex(corpus["lex_text"])
 
-        # Embedding corpus (question-centric)
-        df["embed_text"] = (df["clean_question"] + " " + df["clean_translated_q"]).str.strip()
+def build_shards(doc_embeddings, lex_index) -> ShardedIndex | None:
+    if index_shards <= 1 or not isinstance(lex_index, LexicalIndex):
+        return None
+    return ShardedIndex(doc_embeddings, lex_index, index_shards)
+
+def get_reranker(corpus: CorpusStore) -> CrossEncoderReranker:
+    # One per index version: its (query, row) score cache is only valid for this corpus.
+    # Scores the displayed question and answer: lex_text is lowercased, stripped of
+    # punctuation and carries near-duplicates' text, which would crowd the answer out of max_length.
+    return CrossEncoderReranker(corpus["Question"].str.cat(corpus["Answer"], sep="\n"))
+
+def embed_query(model, provider: str, text: str) -> np.ndarray:
+    if provider == "Google Gemini":
+        return model.encode_query(text)
+    return model.encode([text])
+
+def query_embeddings(query: str, query_hi: str, model, provider: str) -> tuple:
+    """(original, translated-or-None) query embeddings."""
+    q_embed_1 = embed_query(model, provider, query)
+    q_embed_2 = embed_query(model, provider, query_hi) if query_hi != query else None
+    return q_embed_1, q_embed_2
+
+def semantic_scores(query: str, query_hi: str, model, doc_embeddings, provider: str, q_embeds: tuple | None = None):
+    """Cosine similarity of every row against BOTH queries (max taken). None if unavailable."""
+    if doc_embeddings is None or len(doc_embeddings) == 0:
+        return None
 
-        # Lexical corpus (includes answer too)
-        df["lex_text"] = (df["clean_question"] + " " + df["clean_translated_q"] + " " + df["clean_answer"]).str.strip()
+    q_embed_1, q_embed_2 = q_embeds or query_embeddings(query, query_hi, model, provider)
 
-        # Drop near-empty rows after cleaning
-        df["embed_len"] = df["embed_text"].apply(lambda x: len((x or "").strip()))
-        df = df[df["embed_len"] >= 10].reset_index(drop=True)
+    sim_1 = cosine_similarity(q_embed_1, doc_embeddings)[0] if q_embed_1 is not None and q_embed_1.size > 0 else None
+    sim_2 = cosine_similarity(q_embed_2, doc_embeddings)[0] if q_embed_2 is not None and q_embed_2.size > 0 else None
 
-        return df, None
+    if sim_1 is None and sim_2 is None:
+        return None
+    if sim_2 is None:
+        return sim_1
+    if sim_1 is None:
+        return sim_2
+    return np.maximum(sim_1, sim_2)
+
+def lexical_scores(query: str, query_hi: str, lex_index: LexicalIndex) -> np.ndarray:
+    """Whole-corpus lexical scores; uses BOTH original + translated query and takes the max."""
+    def one(q: str) -> np.ndarray:
+        base_toks = tokenize_hi_en(q)
+        toks = expand_tokens(base_toks, q)
+        q_clean = clean_for_search(q).lower()
+        return lex_index.scores(toks, len(base_toks), q_clean, phrase_boost=use_phrase_match)
+
+    lex = one(query)
+    if query_hi != query:
+        lex = np.maximum(lex, one(query_hi))
+    return lex
+
+def query_weights(query: str) -> tuple[int, float, float]:
+    """(query token count, semantic weight, lexical weight) for one query."""
+    # Tokenization for weighting logic (use original query tokens)
+    q_toks = tokenize_hi_en(query)
 
-    except Exception as e:
-        return pd.DataFrame(), f"Could not load data. Error: {e}"
+    # --- weights ---
+    # short queries: slightly more lexical influence
+    if len(q_toks) <= 2:
+        sem_w, lex_w = 0.55, 0.45
+    else:
+        sem_w, lex_w = semantic_weight, 1.0 - semantic_weight
+
+    # English-only queries: semantic should dominate (prevents stopword-based false matches)
+    if q_toks and (not has_hindi_token(q_toks)):
+        sem_w, lex_w = 0.80, 0.20
+    return len(q_toks), sem_w, lex_w
+
+def rank_scored(sim, lex: np.ndarray, search_mode: str, weights: tuple[int, float, float]) -> ResultSet:
+    q_tok_count, sem_w, lex_w = weights
+    return rank_candidates(
+        sim, lex, search_mode, q_tok_count, sem_w, lex_w,
+        sem_top_n=top_k, lex_top_n=lex_top_k,
+        short_query_requires_lex=short_query_requires_lex,
+        high_sem_override=HIGH_SEM_OVERRIDE,
+        fusion=fusion_method,
+    )
+
+def rank_results(query: str, query_hi: str, sim, search_mode: str, lex_index: LexicalIndex) -> ResultSet:
+    """
+    Score rows for one query.
+    Returns a ResultSet (iterates as (i, final, sem, lex, method)) sorted by final score desc.
+    """
+    return rank_scored(sim, lexical_scores(query, query_hi, lex_index), search_mode, query_weights(query))
+
+def rank_results_sharded(query: str, query_hi: str, q_embeds: tuple | None, search_mode: str,
+                         shards: ShardedIndex) -> ResultSet:
+    """rank_results() with every shard scored in parallel; same ranking as the unsharded index."""
+    def score(shard):
+        sim = None
+        if q_embeds is not None and shard.embeddings is not None:
+            sim = semantic_scores(query, query_hi, None, shard.embeddings, provider, q_embeds=q_embeds)
+        return sim, lexical_scores(query, query_hi, shard.lex_index)
+
+    weights = query_weights(query)
+    return shards.search(score, lambda sim, lex: rank_scored(sim, lex, search_mode, weights),
+                         search_mode, sem_top_n=top_k, lex_top_n=lex_top_k)
+
+def rerank_results(query: str, results: ResultSet, reranker: CrossEncoderReranker,
+                   time_budget_s: float | None = None) -> ResultSet:
+    """Reorder the top rerank_top_n results by cross-encoder score (scores shown stay the fused ones)."""
+    head_ids = results.ids[:rerank_top_n].tolist()
+    if not head_ids:
+        return results
+    pos = {rid: p for p, rid in enumerate(head_ids)}
+    order, _ = reranker.rerank(query, head_ids, time_budget_s=time_budget_s)
+    return results.take([pos[rid] for rid in order] + list(range(len(head_ids), len(results))))
+
+def run_search(query: str, query_hi: str, search_mode: str, lex_index: LexicalIndex,
+               model, doc_embeddings, provider: str, reranker: CrossEncoderReranker | None = None,
+               shards: ShardedIndex | None = None) -> ResultSet:
+    # Literal mode never looks at semantic scores, so skip the query embeddings
+    if shards is not None:
+        q_embeds = None
+        if search_mode != "Literal Only" and doc_embeddings is not None and len(doc_embeddings) > 0:
+            q_embeds = query_embeddings(query, query_hi, model, provider)
+        results = rank_results_sharded(query, query_hi, q_embeds, search_mode, shards)
+    else:
+        sim = None
+        if search_mode != "Literal Only":
+            sim = semantic_scores(query, query_hi, model, doc_embeddings, provider)
+        results = rank_results(query, query_hi, sim, search_mode, lex_index)
+    if reranker is not None and search_mode != "Literal Only":
+        results = rerank_results(query, results, reranker, time_budget_s=rerank_time_budget_s)
+    return results
+
+
+# ============================================================
+# 6B) KEYWORD CHIPS (precomputed per index version)
+# ============================================================
+def build_chip_results(version: str, provider: str, api_key: str, corpus: CorpusStore, lex_index: LexicalIndex,
+                       model, doc_embeddings, reranker: CrossEncoderReranker | None = None,
+                       keywords: dict | None = None):
+    """
+    Chips are fixed for a given corpus, so rank every chip in every search mode
+    once, right after the index is built. A chip click is then a dict lookup:
+    no translation, embedding or scoring calls.
+    Returns { 'version', 'keywords': {lang: [kw]}, 'results': {(kw, mode): (kw_hi, results)} }
+    """
+    if keywords is None:
+        kw_col = pick_english_source_column(corpus)
+        keywords = {
+            "English": extract_top_keywords(corpus, kw_col, top_n=30) if kw_col else [],
+            "Hindi": extract_hindi_keywords(corpus, top_n=30),
+        }
+
+    results = {}
+    for kws in keywords.values():
+        for kw in kws:
+            # Chips are cached with the translation bridge ON (the default)
+            kw_hi = translate_to_hindi_if_english(kw, api_key)
+            sim = semantic_scores(kw, kw_hi, model, doc_embeddings, provider)
+            for mode in SEARCH_MODES:
+                ranked = rank_results(kw, kw_hi, sim, mode, lex_index)
+                if reranker is not None and mode != "Literal Only":
+                    # Build time: no budget, chips get the full rerank
+                    ranked = rerank_results(kw, ranked, reranker)
+                results[(kw, mode)] = (kw_hi, ranked)
+
+    return {"version": version, "keywords": keywords, "results": results}
 
 
 # ============================================================
-# 5) BUILD EMBEDDING INDEX (cached)
+# 6C) SEARCH STATE (background refresh, atomic swap)
 # ============================================================
+# Everything a search reads - corpus, embeddings, lexical index, reranker,
+# chip cache - is built together as one dict for one corpus version. The
+# refresher rebuilds it on a background thread every REFRESH_INTERVAL_S and
+# swaps the reference; reruns read whatever state is current and never wait
+# (only the very first load of a process does).
+REFRESH_INTERVAL_S = 600   # sheet re-check period (was load_data's cache ttl)
+REFRESH_RETRY_S = 60       # after a failed refresh, keep serving the old state this long
+
+def load_search_state_from_artifacts(provider: str, api_key: str, version: str,
+                                     artifact_dir: str = ARTIFACT_DIR) -> dict | None:
+    """
+    Search state from a build_artifacts.py build: corpus, embeddings (mmap),
+    lexical index file and chip keywords are loaded, not computed. Chip
+    rankings still need query embeddings, so they are filled in afterwards.
+    None if the build was made for another provider or embedding model, or
+    with other corpus cleaning rules (prepare_version).
+    """
+    # Manifest first: a build for another model is skipped before its corpus and embeddings are opened
+    manifest = read_manifest(artifact_dir, version)
+    if (manifest is None or manifest.get("provider") != provider
+            or manifest.get("embedding_model") != embed_model_name(provider)
+            or manifest.get("prepare_version") != CORPUS_PREPARE_VERSION):
+        print(f"Artifacts {version} not usable for {provider}; building from the sheet")
+        return None
+    art = load_artifacts(artifact_dir, version)
+    if art is None:
+        return None
+    if provider == GEMINI_PROVIDER and not api_key:
+        raise RuntimeError("Please enter a Google API Key.")
+
+    corpus = art["corpus"]
+    if lexical_backend == "fts5":
+        lex_index = FtsLexicalIndex(art["dir"], version, corpus)
+    else:
+        lex_index = LexicalIndex(corpus["lex_text"])
+    print(f"Search index {version} loaded from {art['dir']} ({len(corpus)} rows)")
+    return {
+        "version": version,
+        "corpus": corpus,
+        "model": load_embedder(provider, api_key),
+        "doc_embeddings": art["embeddings"],
+        "lex_index": lex_index,
+        "reranker": get_reranker(corpus) if enable_rerank else None,
+        "shards": build_shards(art["embeddings"], lex_index),
+        "chip_cache": {"version": version, "keywords": art["keywords"], "results": {}},
+        "satsang_catalog": art["catalog"],
+        "source": "artifacts",
+    }
+
+def warm_chip_results(state: dict, provider: str, api_key: str):
+    """Rank the chips of an artifact-loaded state; until done, chip clicks run as normal searches."""
+    chips = build_chip_results(state["version"], provider, api_key, state["corpus"], state["lex_index"],
+                               state["model"], state["doc_embeddings"], state["reranker"],
+                               keywords=state["chip_cache"]["keywords"])
+    state["chip_cache"] = chips  # reference swap, like the state itself
+
+def build_search_state(provider: str, api_key: str, previous: dict | None = None,
+                       collection: str = DEFAULT_COLLECTION) -> dict:
+    """New search state, or `previous` itself when nothing changed. Raises RuntimeError(message)."""
+    # Prebuilt artifacts pin the deployment: follow CURRENT, not the sheet
+    artifact_dir = collection_dir(ARTIFACT_DIR, collection)
+    artifact_version = current_artifact_version(artifact_dir)
+    if artifact_version:
+        if previous is not None and previous["version"] == artifact_version:
+            return previous
+        state = load_search_state_from_artifacts(provider, api_key, artifact_version, artifact_dir)
+        if state is not None:
+            threading.Thread(target=warm_chip_results, args=(state, provider, api_key), daemon=True,
+                             name="chip-warmup").start()
+            return state
+
+    # Only a sheet-built corpus can be handed back by fetch_sheet(reuse=...)
+    prev_corpus = previous["corpus"] if previous and previous["source"] == "sheet" else None
+    corpus, error_msg = load_data(prev_corpus, collection)
+    if error_msg:
+        raise RuntimeError(error_msg)
+    if prev_corpus is not None and corpus is prev_corpus:
+        return previous
+
+    version = compute_index_version(provider, corpus)
+    model, doc_embeddings, model_error = build_index(provider, api_key, corpus)
+    if model_error:
+        raise RuntimeError(model_error)
+    lex_index = build_lexical_index(version, lexical_backend, corpus)
+    reranker = get_reranker(corpus) if enable_rerank else None
+    chip_cache = build_chip_results(version, provider, api_key, corpus, lex_index, model, doc_embeddings, reranker)
+    print(f"Search index {version} ready ({collection}: {len(corpus)} rows)")
+    return {
+        "version": version,
+        "corpus": corpus,
+        "model": model,
+        "doc_embeddings": doc_embeddings,
+        "lex_index": lex_index,
+        "reranker": reranker,
+        "shards": build_shards(doc_embeddings, lex_index),
+        "chip_cache": chip_cache,
+        "satsang_catalog": None,
+        "source": "sheet",
+    }
+
+def search_state_bytes(state: dict) -> int:
+    """In-process size of a search state (memory-mapped embeddings and FTS5 files live in the page cache)."""
+    size = state["corpus"].memory_bytes()
+    if not isinstance(state["doc_embeddings"], np.memmap):
+        size += state["doc_embeddings"].nbytes
+    if isinstance(state["lex_index"], LexicalIndex):
+        size += int(state["lex_index"].texts.memory_usage(deep=True))
+    return size
+
 @st.cache_resource(show_spinner=False)
-def build_index(provider: str, api_key: str, texts_tuple: tuple[str, ...]):
-    try:
-        texts = list(texts_tuple)
-
-        if provider == "Google Gemini":
-            if not api_key:
-                return None, None, "Please enter a Google API Key."
-            model = GoogleEmbedder(api_key=api_key, model_name="models/text-embedding-004")
-            embeddings = model.encode(texts, task_type="retrieval_document")
-            if embeddings.size == 0:
-                return None, None, "Failed to build Gemini embeddings index."
-            return model, embeddings, None
-
-        model = SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2")
-        embeddings = model.encode(texts, show_progress_bar=False)
-        return model, embeddings, None
+def get_collection_registry(provider: str, api_key: str) -> CollectionRegistry:
+    # One per process: all sessions share the served states and one refresh thread per collection
+    def make_refresher(collection: str) -> BackgroundRefresher:
+        return BackgroundRefresher(
+            lambda previous: build_search_state(provider, api_key, previous, collection),
+            interval_s=REFRESH_INTERVAL_S, retry_s=REFRESH_RETRY_S, name=f"search-refresh-{collection}",
+        )
+    return CollectionRegistry(COLLECTIONS, make_refresher, search_state_bytes,
+                              memory_cap_bytes=COLLECTION_MEMORY_CAP_MB * 1024 * 1024)
 
-    except Exception as e:
-        return None, None, f"Error initializing {provider}: {e}"
+def search_collections(query: str, query_hi: str, search_mode: str, states: dict) -> MergedResults:
+    """
+    Scatter one query to every given collection's index (one thread each: the
+    embedding call and NumPy scoring release the GIL), gather by final score.
+    """
+    def search_one(state: dict) -> ResultSet:
+        return run_search(query, query_hi, search_mode, state["lex_index"], state["model"],
+                          state["doc_embeddings"], provider, state["reranker"], state.get("shards"))
+
+    with ThreadPoolExecutor(max_workers=max(1, len(states)), thread_name_prefix="collection-search") as pool:
+        parts = dict(zip(states, pool.map(search_one, states.values())))
+    return merge_results(parts)
 
 
 # ============================================================
@@ -1265,29 +1249,6 @@ def render_home_page(lang):
 import os
 
 
-def extract_share_content(html_content):
-    """Parses HTML content to extract headers and questions for sharing."""
-    import re
-    # Find h2, h3 headers
-    headers = re.findall(r'<h[23][^>]*>(.*?)</h[23]>', html_content)
-    # Find lines ending with ? inside p tags or just lines
-    questions = re.findall(r'<p[^>]*>(.*?\?)</p>', html_content)
-    
-    # Clean tags
-    cleaned = []
-    seen = set()
-    
-    # Prioritize headers then questions
-    raw_items = headers + questions
-    
-    for item in raw_items:
-        text = re.sub(r'<[^>]+>', '', item).strip()
-        if text and len(text) > 5 and text not in seen:
-            cleaned.append(text)
-            seen.add(text)
-            
-    return cleaned[:5]  # Return top 5 interesting points
-
 def preprocess_html_for_markdown(html_content: str) -> str:
     """
     Strips leading whitespace from each line to prevent Streamlit's Markdown parser
@@ -1297,7 +1258,198 @@ def preprocess_html_for_markdown(html_content: str) -> str:
     # lstrip() removes leading whitespace
     return "\n".join(line.lstrip() for line in lines)
 
-def render_satsang_page(view_lang):
+SATSANG_CONTENT_DIR = "satsang_content"
+
+# Parsed metadata of every satsang file, keyed by path + mtime + size (see satsang_catalog.py)
+SATSANG_CATALOG_CACHE = os.path.join(SCRIPT_DIR, ".cache", "satsang_catalog.json")
+SATSANG_DEBOUNCE_S = 2.0   # a new/changed file must be unchanged this long before it is parsed
+SATSANG_POLL_S = 5.0       # folder poll period when file events (watchdog) are unavailable
+
+@st.cache_resource(show_spinner=False)
+def get_satsang_watcher(content_dir: str, _seed: dict | None = None) -> CatalogWatcher:
+    # One per process; only the first page view waits for the initial scan, after
+    # that the listing is updated from file events and page views never scan
+    return CatalogWatcher(content_dir, SATSANG_CATALOG_CACHE, seed=_seed,
+                          debounce_s=SATSANG_DEBOUNCE_S, poll_s=SATSANG_POLL_S).start()
+
+# Iframe payloads of the satsang pages: in memory (LRU, bounded) and on disk
+SATSANG_PAYLOAD_DIR = os.path.join(SCRIPT_DIR, ".cache", "satsang_pages")
+SATSANG_PAYLOAD_CACHE_MB = 64
+
+@st.cache_resource(show_spinner=False)
+def get_satsang_payloads() -> PayloadCache:
+    return PayloadCache(SATSANG_PAYLOAD_DIR, SATSANG_PAYLOAD_CACHE_MB * 1024 * 1024)
+
+def select_satsang_fragment(fragments: list[str], view_lang: str) -> str:
+    """Length / language picker for a split page (keys like 'long' or 'hi/short', see satsang_payload.py)."""
+    parts = [parse_fragment_key(key) for key in fragments]
+    langs = list(dict.fromkeys(lang for lang, _ in parts))
+    variants = list(dict.fromkeys(variant for _, variant in parts))
+    lang, variant = langs[0], variants[0]
+    cols = st.columns([1, 1] if len(langs) > 1 and variants != [""] else [1])
+    if variants != [""]:
+        with cols[0]:
+            variant = st.radio("satsang_variant", variants, horizontal=True, key="satsang_variant",
+                               format_func=lambda v: get_text(f"archive_{v}", view_lang),
+                               label_visibility="collapsed")
+    if len(langs) > 1:
+        with cols[-1]:
+            lang = st.selectbox("satsang_lang", langs, key=f"satsang_lang_{'_'.join(langs)}",
+                                label_visibility="collapsed")
+    key = fragment_key(lang, variant)
+    return key if key in fragments else fragments[0]
+
+# Full-text index over the archive pages (see archive_index.py); per-file blocks cached here
+ARCHIVE_INDEX_DIR = os.path.join(SCRIPT_DIR, ".cache", "archive")
+ARCHIVE_REFRESH_S = 5      # how often the index catches up with the catalog (unchanged files cost a dict lookup)
+ARCHIVE_RESULTS = 10
+
+def embedder_key(model) -> str:
+    """Cache key for resources built with `model`: provider + a hash of the API key ("" without a model)."""
+    if model is None:
+        return ""
+    return f"{provider}:{hashlib.sha1(api_key.encode('utf-8')).hexdigest()[:12]}"
+
+@st.cache_resource(show_spinner=False)
+def get_archive_index(content_dir: str, provider: str, model_key: str, _watcher: CatalogWatcher, _model) -> BackgroundRefresher:
+    """One refresher per embedder (model_key = embedder_key(_model)), so a new or changed API key takes effect."""
+    # Embeddings share the Q&A model, so the cache is per embedding model; blocks indexed
+    # without one are kept apart so they are not reused once a model is available
+    model_dir = embed_model_name(provider) if _model is not None else "no_embedder"
+    cache_dir = os.path.join(ARCHIVE_INDEX_DIR, re.sub(r"[^\w.-]+", "_", model_dir))
+    embed = (lambda texts: encode_corpus(_model, provider, texts)) if _model is not None else None
+    return BackgroundRefresher(
+        lambda previous: build_archive_index(content_dir, cache_dir, _watcher.catalog, embed, previous),
+        interval_s=ARCHIVE_REFRESH_S, retry_s=ARCHIVE_REFRESH_S * 12, name="archive-index",
+    )
+
+# Q&A <-> satsang links (see cross_links.py), rebuilt in the background when either side changes
+CROSS_LINKS_DIR = os.path.join(SCRIPT_DIR, ".cache", "cross_links")
+
+@st.cache_resource(show_spinner=False)
+def get_cross_links() -> CrossLinkCache:
+    return CrossLinkCache(CROSS_LINKS_DIR)
+
+@st.cache_resource(show_spinner=False)
+def get_started_archives() -> dict:
+    """embedder_key -> archive refresher started by the satsang view (Q&A results only read it)."""
+    return {}
+
+def satsang_archive() -> BackgroundRefresher:
+    """The archive index (and its folder watcher), created on first use; satsang view only."""
+    watcher = get_satsang_watcher(SATSANG_CONTENT_DIR, search_state.get("satsang_catalog"))
+    key = embedder_key(search_state["model"])
+    archive = get_archive_index(SATSANG_CONTENT_DIR, provider, key, watcher, search_state["model"])
+    get_started_archives()[key] = archive
+    return archive
+
+def related_links(state: dict) -> tuple[CrossLinks | None, ArchiveIndex | None]:
+    """
+    Satsang view: cross links of a state's rows with the archive, starting the
+    archive / link builds as needed; (None, None) until both are built.
+    """
+    archive = satsang_archive()
+    if not archive.ready:
+        archive.trigger()
+        return None, None
+    index = archive.get()
+    return get_cross_links().get(state["version"], state["doc_embeddings"], index), index
+
+def built_related_links(state: dict) -> tuple[CrossLinks | None, ArchiveIndex | None]:
+    """
+    Q&A results: the links the satsang view has already built, if any. Never
+    scans the satsang folder or starts an archive (embedding) or link build.
+    """
+    archive = get_started_archives().get(embedder_key(search_state["model"]))
+    index = archive.peek() if archive is not None else None
+    if index is None:
+        return None, None
+    return get_cross_links().peek(state["version"]), index
+
+def render_related_satsangs(row_id: int, links: CrossLinks | None, archive: ArchiveIndex | None, view_lang: str):
+    if links is None:
+        return
+    import html as html_lib
+    import urllib.parse
+    items = []
+    for rel_path, section, _score in links.satsangs_for(row_id):
+        entry, block = archive.catalog.get(rel_path), archive.blocks.get(rel_path)
+        if entry is None or block is None or section >= len(block.fragments):
+            continue  # file changed since the links were built
+        heading = block.fragments[section]["heading"]
+        items.append(
+            f'<a href="?satsang={urllib.parse.quote(entry["filename"])}" target="_self">{html_lib.escape(entry["full_title"])}</a>'
+            + (f" · {html_lib.escape(heading)}" if heading else "")
+        )
+    if items:
+        st.markdown(f"<div class='answer-meta'>📖 {get_text('related_satsangs', view_lang)}: {' | '.join(items)}</div>",
+                    unsafe_allow_html=True)
+
+def render_related_questions(rel_path: str, view_lang: str):
+    links, _archive = related_links(search_state)
+    if links is None:
+        return
+    related = [row_id for row_id, _score in links.questions_for(rel_path)]
+    if not related:
+        return
+    with st.expander(get_text("related_questions", view_lang, count=len(related))):
+        for row in search_state["corpus"].rows(related):
+            q, a = pick_display_text(row, view_lang)
+            st.markdown(f"**{q}**\n\n{a}")
+
+def search_archive(query: str, index: ArchiveIndex, model) -> list[int]:
+    """Fragment row ids of the best-matching fragment of each file, best first."""
+    query_hi = translate_to_hindi_if_english(query, api_key)
+    sim = None
+    if index.embeddings is not None and model is not None:
+        sim = semantic_scores(query, query_hi, model, index.embeddings, provider)
+    mode = "Hybrid (Recommended)" if sim is not None else "Literal Only"
+    results = rank_scored(sim, lexical_scores(query, query_hi, index.lex_index), mode, query_weights(query))
+    hits, seen = [], set()
+    for row_id in results.ids.tolist():
+        rel_path = index.rel_paths[row_id]
+        if rel_path not in seen:
+            seen.add(rel_path)
+            hits.append(row_id)
+            if len(hits) >= ARCHIVE_RESULTS:
+                break
+    return hits
+
+def render_archive_search(view_lang: str, archive: BackgroundRefresher):
+    query = st.text_input("archive_search", placeholder=get_text("archive_search", view_lang),
+                          label_visibility="collapsed", key="archive_query").strip()
+    if not query:
+        return
+    if not archive.ready:
+        archive.trigger()  # first build runs in the background; never block the page on it
+        st.info(get_text("archive_indexing", view_lang))
+        return
+    import html as html_lib
+    import urllib.parse
+    index = archive.get()
+    hits = search_archive(query, index, search_state["model"])
+    if not hits:
+        st.caption(get_text("archive_no_results", view_lang))
+        return
+    for row_id in hits:
+        entry = index.entry(row_id)
+        frag = index.fragments[row_id]
+        badge = ""
+        if frag["variant"]:
+            badge = f'<span style="font-size: 0.75em; color: #888;"> · {get_text("archive_" + frag["variant"], view_lang)}</span>'
+        link = f"?satsang={urllib.parse.quote(entry['filename'])}"
+        snippet = frag["text"] if len(frag["text"]) <= 220 else frag["text"][:220].rsplit(" ", 1)[0] + "…"
+        st.markdown(
+            f'''<div class="answer-card" style="padding: 10px 14px; margin-bottom: 8px;">
+<a href="{link}" target="_self" style="font-weight: 600; color: #8B0000;">{html_lib.escape(entry["full_title"])}</a>
+<div style="font-weight: 500; margin-top: 4px;">{html_lib.escape(frag["heading"])}
+{badge}</div>
+<div style="font-size: 0.9em; color: #444; margin-top: 2px;">{html_lib.escape(snippet)}</div>
+</div>''',
+            unsafe_allow_html=True
+        )
+
+def render_satsang_page(view_lang, catalog: dict | None = None):
     # Check for Deep Link
     if "satsang" in st.query_params:
         target_satsang = st.query_params["satsang"]
@@ -1352,65 +1504,25 @@ def render_satsang_page(view_lang):
 
     st.markdown("---")
     
-    BASE_DIR = "satsang_content"
+    BASE_DIR = SATSANG_CONTENT_DIR
     CONTENT_DIR = BASE_DIR
     
     if not os.path.exists(CONTENT_DIR):
         os.makedirs(CONTENT_DIR, exist_ok=True)
         
-    # 1. SCAN & PARSE METADATA
-    all_files = []
-    
-    for root, cols, files in os.walk(CONTENT_DIR):
-        for file in files:
-            if file.endswith(".html"):
-                full_path = os.path.join(root, file)
-                meta = extract_satsang_metadata(full_path)
-                
-                # Determine sorting key (Date object > Date string > Filename)
-                sort_key = meta["date_str"] if meta["date_str"] else file
-                try:
-                    if meta["date_obj"]: sort_key = meta["date_obj"].isoformat()
-                except: pass
-                
-                # Determine Group (Month YYYY)
-                group_label = "Uncategorized"
-                if meta["date_obj"]:
-                    group_label = meta["date_obj"].strftime("%B %Y") # e.g., December 2025
-                elif meta["date_str"]:
-                     # If string but no obj, try to just grab rightmost chunk
-                     # but let's stick to Uncategorized for safety if parsing failed
-                     pass
-
-                all_files.append({
-                    "path": full_path,
-                    "filename": file,
-                    "title": meta["title"],
-                    "full_title": meta["full_title"],
-                    "date_obj": meta["date_obj"],
-                    "group": group_label,
-                    "sort_key": sort_key
-                })
-
-    if not all_files:
+    # 1.-2. CATALOG: sorted + grouped listing, kept per process and updated as files change
+    watcher = get_satsang_watcher(CONTENT_DIR, catalog)
+    listing = watcher.listing
+    groups = listing["groups"]
+    files_by_group = listing["files_by_group"]
+
+    if not groups:
         st.info(get_text("no_satsang_files", view_lang, lang=view_lang))
         return
-
-    # 2. SORT & GROUP
-    # Sort descending by date
-    all_files.sort(key=lambda x: x["sort_key"], reverse=True)
-    
-    # Get unique groups in order of appearance (since we sorted files by date, groups will be chronological desc)
-    groups = []
-    files_by_group = {}
-    
-    for f in all_files:
-        g = f["group"]
-        if g not in files_by_group:
-            groups.append(g)
-            files_by_group[g] = []
-        files_by_group[g].append(f)
         
+    # Full-text search over every satsang; results deep-link with ?satsang=<filename>
+    render_archive_search(view_lang, satsang_archive())
+
     # 3. ARCHIVE SELECTOR UI
     
     # Check for Deep Link Match
@@ -1419,18 +1531,12 @@ def render_satsang_page(view_lang):
     
     if "deep_linked_satsang" in st.session_state:
         target = st.session_state["deep_linked_satsang"]
-        for g_idx, group_name in enumerate(groups):
-            g_files = files_by_group[group_name]
-            for f_idx, f in enumerate(g_files):
-                if f["filename"] == target:
-                    default_group_idx = g_idx
-                    default_file_idx = f_idx
-                    # Clear it so navigation works normally after
-                    del st.session_state["deep_linked_satsang"]
-                    break
-            else:
-                continue
-            break
+        if target in listing["locate"]:
+            target_group = listing["locate"][target]
+            default_group_idx = groups.index(target_group)
+            default_file_idx = next(i for i, f in enumerate(files_by_group[target_group]) if f["filename"] == target)
+            # Clear it so navigation works normally after
+            del st.session_state["deep_linked_satsang"]
             
     c_month, c_topic = st.columns([1, 2])
     
@@ -1464,116 +1570,24 @@ def render_satsang_page(view_lang):
     
     # 4. RENDER CONTENT
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            raw_content = f.read()
-            
+        # Page HTML with the resize script injected, minified and with its height
+        # estimated - built once per file version (see satsang_payload.py)
+        payloads = get_satsang_payloads()
+        payload = payloads.get(file_path)
+        highlights = payload["highlights"]
+        if payload["fragments"]:
+            # Multi-variant page: send only the selected length / language
+            payload = payloads.get(file_path, select_satsang_fragment(payload["fragments"], view_lang))
+        raw_content = payload["html"]
+
         # 4. RENDER CONTENT (IFRAME ISOLATION - Dynamic Height)
         # Using components.html creates a sandboxed iframe. 
         # This solves ALL scope issues (const redeclaration), ID collisions, and script execution failures.
         import streamlit.components.v1 as components
-        
-        # ENHANCED resize script - aggressively monitors for content changes
-        # This ensures minimal white space for both Short and Long options
-        auto_resize_script = """
-<script>
-(function() {
-    var lastHeight = 0;
-    var resizeAttempts = 0;
-    var maxAttempts = 15;
-    
-    function notifyResize() {
-        // Ensure body/html allow expansion
-        document.body.style.height = 'auto';
-        document.documentElement.style.height = 'auto';
-        
-        // Get actual content height with generous padding
-        var body = document.body;
-        var html = document.documentElement;
-        var height = Math.max(
-            body.scrollHeight,
-            body.offsetHeight,
-            html.clientHeight,
-            html.scrollHeight,
-            html.offsetHeight
-        ) + 100;  // Extra padding to prevent cutoff
-        
-        // Only notify if height changed significantly
-        if (Math.abs(height - lastHeight) > 10) {
-            lastHeight = height;
-            window.parent.postMessage({
-                type: "streamlit:setFrameHeight",
-                height: height
-            }, "*");
-            console.log("Resized to:", height);
-        }
-        
-        resizeAttempts++;
-    }
-    
-    // MutationObserver to detect DOM changes (Short/Long toggle)
-    var observer = new MutationObserver(function(mutations) {
-        // Reset attempts counter on mutation
-        resizeAttempts = 0;
-        setTimeout(notifyResize, 100);
-        setTimeout(notifyResize, 400);
-        setTimeout(notifyResize, 800);
-    });
-    
-    // Observe entire body for changes including subtrees
-    observer.observe(document.body, {
-        childList: true,
-        subtree: true,
-        attributes: true,
-        characterData: true
-    });
-    
-    // Click handler for toggle buttons
-    document.addEventListener('click', function(e) {
-        resizeAttempts = 0;
-        setTimeout(notifyResize, 200);
-        setTimeout(notifyResize, 500);
-        setTimeout(notifyResize, 1000);
-    }, true);
-    
-    // Window resize handler
-    window.addEventListener('resize', function() {
-        setTimeout(notifyResize, 100);
-    });
-    
-    // Force initial resize
-    notifyResize();
-    setTimeout(notifyResize, 500);
-    setTimeout(notifyResize, 1500);
-    setTimeout(notifyResize, 3000);
-    
-    // Periodic check (backup)
-    var periodicCheck = setInterval(function() {
-        if (resizeAttempts < maxAttempts) {
-            notifyResize();
-        } else {
-            clearInterval(periodicCheck);
-        }
-    }, 1000);
-})();
-</script>
-</body>
-"""
-        
-        # Inject script before closing body tag
-        if "</body>" in raw_content:
-            raw_content = raw_content.replace("</body>", auto_resize_script)
-        
-        # Estimate height - balanced to fit content without scrolling or excess whitespace
-        import re
-        text_only = re.sub(r'<[^>]+>', '', raw_content)
-        text_length = len(text_only)
-        
-        # Lower multiplier to minimize whitespace
-        # Minimum 600px (for image visibility), Maximum 2500px
-        estimated_height = max(600, min(2500, int(text_length * 0.15)))
-        
-        # 0.15 multiplier with scrolling for overflow
-        components.html(raw_content, height=estimated_height, scrolling=True)
+        components.html(raw_content, height=payload["height"], scrolling=True)
+
+        # Sheet questions on the same topic (precomputed, see cross_links.py)
+        render_related_questions(selected_file_data["rel_path"], view_lang)
         
         # 5. SOCIAL / ENGAGEMENT UI (Below the content)
         st.markdown("---")
@@ -1591,28 +1605,15 @@ def render_satsang_page(view_lang):
                 
         # Social Share Links - Enhanced Format
         with c_share:
-            # Rich metadata for cross-platform compatibility
-            content_highlights = extract_share_content(raw_content)
-            highlights_text = "\n".join([f"✨ {h}" for h in content_highlights])
-            
             # Construct Deep Link
             # TODO: Update this URL after deploying to Streamlit Cloud
             # For local testing, use localhost; for production, use your deployed URL
             base_url = "http://localhost:8502"  # Change to your Streamlit Cloud URL after deployment
             share_link = f"{base_url}/?satsang={selected_file_data['filename']}"
             
-            share_text = f"""🙏 *{selected_file_data['full_title']}*
-
-📅 {selected_file_data.get('date_str', '')}
-📍 प्रियाकुंज आश्रम, बरसाना
-
-🔍 *मुख्य अंश / Highlights:*
-{highlights_text}
-
-🔗 *पूरा सत्संग पढ़ें / Read Full:*
-{share_link}
-
-🕉️ जय श्री राधे""".strip()
+            # Title and date from the catalog, highlights from the page payload (built once per file version)
+            share_text = build_share_text(selected_file_data["full_title"], selected_file_data["date_str"],
+                                          highlights).replace(SHARE_LINK, share_link)
             import urllib.parse
             safe_text = urllib.parse.quote(share_text)
             
@@ -1792,26 +1793,56 @@ view_lang = st.session_state["view_lang"]
 # ============================================================
 # GLOBAL DATA & INDEX LOADING (Optimization)
 # ============================================================
-# Load data immediately so it's ready for any view
-df, error_msg = load_data()
-if error_msg:
-    st.error(error_msg)
+# Load data + indexes immediately so they're ready for any view. Only the first
+# use of a collection in a process waits here; later refreshes happen in the background.
+collection_registry = get_collection_registry(provider, api_key)
+active_collection = DEFAULT_COLLECTION
+if len(COLLECTIONS) > 1:
+    active_collection = st.sidebar.selectbox(
+        "Collection", list(COLLECTIONS) + [ALL_COLLECTIONS], key="collection",
+        format_func=lambda c: "All collections" if c == ALL_COLLECTIONS else COLLECTIONS[c]["label"],
+    )
+# "All": browse/chips/satsang use the default collection, searches scatter to every loaded one
+state_collection = DEFAULT_COLLECTION if active_collection == ALL_COLLECTIONS else active_collection
+try:
+    if collection_registry.ready(state_collection):
+        search_state = collection_registry.get(state_collection)
+    else:
+        with st.spinner("Building search index..."):
+            search_state = collection_registry.get(state_collection)
+except Exception as e:
+    st.error(str(e))
     st.stop()
 
-# Build embeddings index globally (prevents delay on first search)
-embed_texts = tuple(df["embed_text"].tolist())
-with st.spinner("Building search index..."):
-    model, doc_embeddings, model_error = build_index(provider, api_key, embed_texts)
+# One consistent snapshot for this whole rerun, even if a refresh swaps in meanwhile
+index_version = search_state["version"]
+corpus = search_state["corpus"]
+model = search_state["model"]
+doc_embeddings = search_state["doc_embeddings"]
+lex_index = search_state["lex_index"]
+reranker = search_state["reranker"]
+chip_cache = search_state["chip_cache"]
+
+if active_collection == ALL_COLLECTIONS:
+    search_states = collection_registry.loaded()
+    search_states.setdefault(state_collection, search_state)
+    # Merged result ids are only valid while every collection keeps its version
+    results_key = "|".join(f"{name}:{search_states[name]['version']}" for name in sorted(search_states))
+else:
+    search_states = {state_collection: search_state}
+    results_key = index_version
 
-if model_error:
-    st.error(model_error)
-    st.stop()
+def search_active(query: str, query_hi: str, search_mode: str) -> ResultSet | MergedResults:
+    if active_collection == ALL_COLLECTIONS:
+        return search_collections(query, query_hi, search_mode, search_states)
+    return run_search(query, query_hi, search_mode, lex_index, model, doc_embeddings, provider, reranker,
+                      search_state.get("shards"))
     
 if st.session_state["current_view"] == "home":
     render_home_page(st.session_state["view_lang"])
     st.stop()
 elif st.session_state["current_view"] == "satsang":
-    render_satsang_page(st.session_state["view_lang"])
+    render_satsang_page(st.session_state["view_lang"], search_state.get("satsang_catalog"))
     st.stop()
 
 # ============================================================
@@ -1826,13 +1857,9 @@ elif st.session_state["current_view"] == "satsang":
 # ============================================================
 # All technical settings are now hidden - using optimal defaults
 
-# Hidden defaults - no UI exposed
+# Hidden defaults - no UI exposed (scoring knobs live in 6) SEARCH ENGINE)
 search_mode = "Hybrid (Recommended)"  # Best balance
-use_phrase_match = True
-top_k = 40
-short_query_requires_lex = True
-semantic_weight = 0.75
-HIGH_SEM_OVERRIDE = 0.62
+progressive_search = True  # render local lexical results first, refine with semantic after
 
 lbl_translate = get_text("translate_toggle", view_lang)
 enable_translation_bridge = st.sidebar.checkbox(lbl_translate, value=True)
@@ -1842,7 +1869,8 @@ debug_mode = st.sidebar.checkbox(lbl_debug, value=False)
 
 # Load data
 # Load data and Index build (Moved to global scope)
-lbl_loaded = get_text("conversations_loaded", view_lang, count=len(df))
+# Count includes near-duplicates collapsed into canonical rows
+lbl_loaded = get_text("conversations_loaded", view_lang, count=len(corpus) + int(corpus.similar_counts.sum()))
 st.sidebar.info(lbl_loaded)
 
 # Session keys used for auto-search
@@ -1850,6 +1878,10 @@ if "query" not in st.session_state:
     st.session_state["query"] = ""
 if "trigger_search" not in st.session_state:
     st.session_state["trigger_search"] = False
+if "chip_query" not in st.session_state:
+    st.session_state["chip_query"] = None
+if "refine_pending" not in st.session_state:
+    st.session_state["refine_pending"] = None
 
 # ============================================================
 # Search Page Header: Title + Navigation Buttons + Language Toggle
@@ -1890,13 +1922,11 @@ view_lang = st.session_state["view_lang"]
 st.markdown("---")
 
 # --- QUICK FILTERS (below navigation) ---
+# Keyword lists come from the chip cache built alongside the index
+keywords = chip_cache["keywords"].get(view_lang, [])
 if view_lang == "English":
-    kw_col = pick_english_source_column(df)
-    keywords = extract_top_keywords(df, kw_col, top_n=30) if kw_col else []
     slicer_label = get_text("slicer_label_en", view_lang)
 else:
-    # Hindi keywords
-    keywords = extract_hindi_keywords(df, top_n=30)
     slicer_label = get_text("slicer_label_hi", view_lang)
 
 if keywords:
@@ -1907,6 +1937,7 @@ if keywords:
                 if st.button(kw, key=f"kw_{i}_{kw}", use_container_width=True):
                     st.session_state["query"] = kw
                     st.session_state["trigger_search"] = True
+                    st.session_state["chip_query"] = kw
 else:
     if view_lang == "English":
         st.caption("No English keyword column found for slicers.")
@@ -1957,11 +1988,11 @@ auto_clicked = st.session_state.get("trigger_search", False)
 if browse_clicked:
     st.session_state["mode"] = "browse"
     st.session_state["page"] = 1
-    # Create artificial results list (index, score=1, semantic=0, lexical=0, method="Browse")
-    # We use index same as dataframe index
-    all_indices = list(range(len(df)))
-    browse_results = [(i, 0.0, 0.0, 0.0, "Browse") for i in all_indices]
-    st.session_state["search_results"] = browse_results
+    # Lazy "all rows" view (index, score=0, semantic=0, lexical=0, method="Browse")
+    # Row ids are corpus positions
+    st.session_state["search_results"] = BrowseResults(len(corpus))
+    st.session_state["results_version"] = results_key
+    st.session_state["refine_pending"] = None
     st.session_state["search_executed"] = True
     st.rerun()
 
@@ -1975,100 +2006,66 @@ if (search_clicked or auto_clicked) and query:
 
     st.markdown("---")
 
-    # Translation bridge (English -> Hindi), used for semantic and lexical
-    query_hi = translate_to_hindi_if_english(query, api_key) if enable_translation_bridge else query
-    if debug_mode and query_hi != query:
-        st.caption(f"Translated query (Hindi): {query_hi}")
-
-    # Tokenization for weighting logic (use original query tokens)
-    q_toks = tokenize_hi_en(query)
-    phrase_boost = use_phrase_match
-
-    # Lexical uses BOTH original + translated query; take max lexical score
-    def row_lex(i: int) -> float:
-        text = df.iloc[i]["lex_text"]
-        s1 = lexical_score(query, text, phrase_boost=phrase_boost)
-        s2 = lexical_score(query_hi, text, phrase_boost=phrase_boost) if query_hi != query else 0.0
-        return max(s1, s2)
-
-    # --- semantic candidates (Top-K), compute using BOTH queries and take max similarity ---
-    semantic_candidates = []
-    if doc_embeddings is not None and len(doc_embeddings) > 0:
-        # Build query embeddings
-        if provider == "Google Gemini":
-            q_embed_1 = model.encode_query(query)
-            q_embed_2 = model.encode_query(query_hi) if query_hi != query else None
-        else:
-            q_embed_1 = model.encode([query])
-            q_embed_2 = model.encode([query_hi]) if query_hi != query else None
-
-        sim_1 = cosine_similarity(q_embed_1, doc_embeddings)[0] if q_embed_1 is not None and q_embed_1.size > 0 else None
-        sim_2 = cosine_similarity(q_embed_2, doc_embeddings)[0] if q_embed_2 is not None and q_embed_2.size > 0 else None
-
-        if sim_1 is None and sim_2 is None:
-            sim = None
-        elif sim_2 is None:
-            sim = sim_1
-        elif sim_1 is None:
-            sim = sim_2
-        else:
-            sim = np.maximum(sim_1, sim_2)
-
-        if sim is not None:
-            top_idx = np.argsort(sim)[::-1][:top_k]
-            semantic_candidates = [(int(i), float(sim[i])) for i in top_idx]
-
-    # --- weights ---
-    # short queries: slightly more lexical influence
-    if len(q_toks) <= 2:
-        sem_w, lex_w = 0.55, 0.45
-    else:
-        sem_w, lex_w = semantic_weight, 1.0 - semantic_weight
-
-    # English-only queries: semantic should dominate (prevents stopword-based false matches)
-    if q_toks and (not has_hindi_token(q_toks)):
-        sem_w, lex_w = 0.80, 0.20
-
-    results = []  # (i, final, sem, lex, method)
-
-    if search_mode == "Literal Only":
-        for i in range(len(df)):
-            ls = row_lex(i)
-            if ls > 0:
-                results.append((i, ls, 0.0, ls, "Literal"))
-
-    elif search_mode == "Semantic Only":
-        for i, ss in semantic_candidates:
-            ls = row_lex(i)
-            if short_query_requires_lex and len(q_toks) <= 2 and ls == 0 and ss < HIGH_SEM_OVERRIDE:
-                continue
-            results.append((i, ss, ss, ls, "Semantic"))
-
+    # Keyword chip: serve the ranking precomputed at index build time
+    chip_hit = None
+    if (auto_clicked and enable_translation_bridge and st.session_state.get("chip_query") == query
+            and active_collection != ALL_COLLECTIONS):
+        chip_hit = chip_cache["results"].get((query, search_mode))
+    st.session_state["chip_query"] = None
+
+    st.session_state["refine_pending"] = None
+    search_notes = []
+
+    if chip_hit is not None:
+        query_hi, results = chip_hit
+        search_notes.append(f"Served from chip cache (index {chip_cache['version']})")
+    elif progressive_search:
+        # Local lexical preview (original query only: no API calls). Translation,
+        # query embeddings and fusion run after the cards render - see 8) below.
+        query_hi = query
+        results = search_active(query, query, "Literal Only")
+        st.session_state["refine_pending"] = {
+            "query": query,
+            "search_mode": search_mode,
+            "translate": enable_translation_bridge,
+        }
     else:
-        # Hybrid
-        for i, ss in semantic_candidates:
-            ls = row_lex(i)
-
-            # Short query: require lexical grounding unless semantic is very high
-            if short_query_requires_lex and len(q_toks) <= 2 and ls == 0 and ss < HIGH_SEM_OVERRIDE:
-                continue
+        # Translation bridge (English -> Hindi), used for semantic and lexical
+        query_hi = translate_to_hindi_if_english(query, api_key) if enable_translation_bridge else query
+        results = search_active(query, query_hi, search_mode)
 
-            final = (sem_w * ss) + (lex_w * ls)
-            method = "Hybrid" if ls > 0 else "Semantic"
-            results.append((i, final, ss, ls, method))
+    if query_hi != query:
+        search_notes.append(f"Translated query (Hindi): {query_hi}")
 
-    results.sort(key=lambda x: x[1], reverse=True)
+    st.session_state["search_notes"] = search_notes
     st.session_state["search_results"] = results
+    st.session_state["results_version"] = results_key
+    st.session_state["last_search"] = {"query": query, "search_mode": search_mode, "translate": enable_translation_bridge}
     st.session_state["search_executed"] = True
 
 
 # --- Retrieve Results from Session State ---
 if st.session_state.get("search_executed", False):
-    results = st.session_state.get("search_results", [])
+    results = st.session_state.get("search_results", ResultSet.empty())
+    if st.session_state.get("results_version", results_key) != results_key:
+        # Index was refreshed since these ids were ranked: redo against the new corpus
+        if st.session_state.get("mode") == "browse":
+            results = BrowseResults(len(corpus))
+            st.session_state["search_results"] = results
+            st.session_state["results_version"] = results_key
+        elif st.session_state.get("last_search"):
+            results = ResultSet.empty()
+            st.session_state["search_results"] = results
+            st.session_state["refine_pending"] = dict(st.session_state["last_search"])
 else:
-    results = []
+    results = ResultSet.empty()
     
 current_mode = st.session_state.get("mode", "search")
+refine_pending = st.session_state.get("refine_pending")
+
+if debug_mode:
+    for note in st.session_state.get("search_notes", []):
+        st.caption(note)
 
 # ============================================================
 # SEMANTIC VISUALIZATION HELPERS
@@ -2134,14 +2131,15 @@ def generate_relevance_heatmap_html(sentences_with_scores, max_sentences=5):
     
     return "".join(html_parts)
 
-def render_result_card(idx_num, row, final, sem, lex, method, show_translated_answer: bool, debug_mode: bool, view_lang: str):
+def render_result_card(idx_num, row, final, sem, lex, method, show_translated_answer: bool, debug_mode: bool, view_lang: str,
+                       row_id: int | None = None, state: dict | None = None, related: tuple = (None, None)):
+    # state: the search state row_id belongs to (merged results span collections)
+    # related: (CrossLinks, ArchiveIndex) for that state, resolved once per page (built_related_links)
+    card_corpus = (state or search_state)["corpus"]
+    card_lex_index = (state or search_state)["lex_index"]
+
     # Determine text based on language selection
-    if view_lang == "English":
-        q_text = str(row.get("Translated Question", "")).strip() or str(row.get("Question", "")).strip()
-        a_text = str(row.get("Translated Answer", "")).strip() or str(row.get("Answer", "")).strip()
-    else:
-        q_text = str(row.get("Question", "")).strip()
-        a_text = str(row.get("Answer", "")).strip()
+    q_text, a_text = pick_display_text(row, view_lang)
 
     # Light formatting: keep answer clean but readable
     # (Do not remove Hindi punctuation; keep line breaks)
@@ -2173,11 +2171,17 @@ def render_result_card(idx_num, row, final, sem, lex, method, show_translated_an
                 highlighted = pattern.sub(r'<mark style="background: #FFEB3B; padding: 1px 3px; border-radius: 3px;">\1</mark>', highlighted)
             return highlighted
         
-        # Apply highlighting
-        if found_in_q:
-            q_text = highlight_keywords(q_text, found_in_q)
-        if found_in_a:
-            safe_a = highlight_keywords(safe_a, found_in_a)
+        # Apply highlighting (FTS5 backend: highlight() from the index, same <mark> style)
+        fts_marked = None
+        if row_id is not None and isinstance(card_lex_index, FtsLexicalIndex):
+            fts_marked = card_lex_index.highlight(row_id, query_words)
+        if fts_marked:
+            q_text, safe_a = pick_display_text(fts_marked, view_lang)
+        else:
+            if found_in_q:
+                q_text = highlight_keywords(q_text, found_in_q)
+            if found_in_a:
+                safe_a = highlight_keywords(safe_a, found_in_a)
         
         context_str = ""
         context_str_hi = ""
@@ -2294,6 +2298,18 @@ def render_result_card(idx_num, row, final, sem, lex, method, show_translated_an
         unsafe_allow_html=True
     )
 
+    # Near-duplicate questions collapsed into this row at load time (dedup.py)
+    n_similar = int(card_corpus.similar_counts[row_id]) if row_id is not None else 0
+    if n_similar:
+        with st.expander(get_text("similar_questions", view_lang, count=n_similar)):
+            for sim_row in card_corpus.similar_rows(row_id):
+                sim_q, sim_a = pick_display_text(sim_row, view_lang)
+                st.markdown(f"**{sim_q}**\n\n{sim_a}")
+
+    # Satsangs on the same topic (precomputed, see cross_links.py)
+    if row_id is not None:
+        render_related_satsangs(row_id, *related, view_lang)
+
     # If debug mode, show metadata
     if debug_mode and method != "Browse":
         st.markdown(
@@ -2303,8 +2319,13 @@ def render_result_card(idx_num, row, final, sem, lex, method, show_translated_an
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+if refine_pending:
+    st.caption(get_text("refining", view_lang))
+
 if not results:
-    if st.session_state.get("search_executed", False):
+    if refine_pending:
+        pass  # semantic refinement may still find something
+    elif st.session_state.get("search_executed", False):
          st.info("No relevant results found.")
     elif current_mode == "browse":
          st.info("No records loaded.")
@@ -2326,10 +2347,26 @@ else:
     # Calculate starting number based on page
     start_num = start + 1
     
-    for relative_idx, (i, final, sem, lex, method) in enumerate(page_slice):
-        row = df.iloc[i]
+    # Card fields for the whole page, fetched column by column (per collection for merged results)
+    if isinstance(page_slice, MergedResults):
+        page_states = [search_states[page_slice.collection_of(k)] for k in range(len(page_slice))]
+        page_rows = [None] * len(page_slice)
+        for source in np.unique(page_slice.sources):
+            at = np.flatnonzero(page_slice.sources == source)
+            rows = search_states[page_slice.collections[source]]["corpus"].rows(page_slice.ids[at])
+            for k, row in zip(at.tolist(), rows):
+                page_rows[k] = row
+    else:
+        page_states = [search_state] * len(page_slice)
+        page_rows = corpus.rows(page_slice.ids)
+
+    # Related satsangs: looked up once per state for the whole page, never built from here
+    page_related = {id(s): built_related_links(s) for s in page_states}
+
+    for relative_idx, ((i, final, sem, lex, method), row) in enumerate(zip(page_slice, page_rows)):
     # Pass show_translated_answer=False since we removed the checkbox
-        render_result_card(start_num + relative_idx, row, final, sem, lex, method, False, debug_mode, view_lang)
+        render_result_card(start_num + relative_idx, row, final, sem, lex, method, False, debug_mode, view_lang, row_id=i,
+                           state=page_states[relative_idx], related=page_related[id(page_states[relative_idx])])
 
     # Controls row
     st.markdown("---")
@@ -2354,3 +2391,21 @@ else:
         if goto != page:
             st.session_state["page"] = int(goto)
             st.rerun()
+
+# ============================================================
+# 8) PROGRESSIVE REFINEMENT
+# ============================================================
+# The lexical preview above is already on screen; now run translation, query
+# embeddings and fusion, then rerun so the final ranking replaces it in place.
+if refine_pending:
+    q = refine_pending["query"]
+    q_hi = translate_to_hindi_if_english(q, api_key) if refine_pending["translate"] else q
+    refined = search_active(q, q_hi, refine_pending["search_mode"])
+
+    # Only apply if no newer search replaced this one meanwhile
+    if st.session_state.get("refine_pending") is refine_pending:
+        st.session_state["search_results"] = refined
+        st.session_state["results_version"] = results_key
+        st.session_state["search_notes"] = [f"Translated query (Hindi): {q_hi}"] if q_hi != q else []
+        st.session_state["refine_pending"] = None
+        st.rerun()
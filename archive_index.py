@@ -0,0 +1,392 @@
+"""
+Full-text index over the satsang HTML archive (satsang_content/).
+
+Each page is split into sections (a card, a Q&A pair, the closing quote);
+pages whose content is rendered from a `const contentData = {...}` block give
+one fragment per section *and* per short/long variant (and per language when
+the block holds several). Fragments are cleaned with clean_for_search() and
+indexed like the Q&A corpus: a LexicalIndex plus document embeddings, ranked
+by the same scoring code in app.py.
+
+Incremental: parsed fragments and their embeddings are cached per file under
+cache_dir (keyed by path, checked against mtime + size), and an update reuses
+every unchanged file's block, so adding one satsang parses and embeds that
+one file only. An ArchiveIndex is immutable; build_archive_index() returns a
+new one (or `previous` itself when nothing changed).
+"""
+import hashlib
+import json
+import os
+import re
+from html.parser import HTMLParser
+from typing import Callable
+
+import numpy as np
+
+from search_core import LexicalIndex
+from text_processing import clean_for_search
+
+# Fragments shorter than this (after cleaning) are not indexed
+MIN_FRAGMENT_CHARS = 10
+
+CONTENT_DATA_RE = re.compile(r"\bcontentData\s*=\s*\{")
+
+
+# ============================================================
+# SECTION EXTRACTION
+# ============================================================
+def content_data_span(html: str) -> tuple[int, int] | None:
+    """(start, stop) of the `contentData = {...}` literal in html (balanced braces, strings skipped)."""
+    m = CONTENT_DATA_RE.search(html)
+    if not m:
+        return None
+    start = m.end() - 1
+    depth, i, n = 0, start, len(html)
+    while i < n:
+        ch = html[i]
+        if ch in "\"'`":
+            i = _skip_string(html, i)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+        i += 1
+    return None
+
+def _skip_string(src: str, i: int) -> int:
+    """Index just past the JS string literal starting at src[i]."""
+    quote = src[i]
+    i += 1
+    while i < len(src):
+        if src[i] == "\\":
+            i += 2
+            continue
+        if src[i] == quote:
+            return i + 1
+        i += 1
+    return i
+
+def js_literal_to_json(src: str) -> str:
+    """
+    JSON text for a plain JS object literal: bare keys quoted, '/` strings
+    re-quoted, comments and trailing commas dropped. Enough for data blocks;
+    no expressions.
+    """
+    out = []
+    i, n = 0, len(src)
+    while i < n:
+        ch = src[i]
+        if ch in "\"'`":
+            j = _skip_string(src, i)
+            body = src[i + 1:j - 1].replace("\\'", "'").replace("\\`", "`")
+            if ch != '"':
+                body = re.sub(r'(?<!\\)"', '\\"', body)
+            out.append('"' + body.replace("\n", "\\n") + '"')
+            i = j
+        elif src.startswith("//", i):
+            end = src.find("\n", i)
+            i = n if end < 0 else end
+        elif src.startswith("/*", i):
+            end = src.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+        elif ch == "_" or ch == "$" or ch.isalpha():
+            j = i
+            while j < n and (src[j].isalnum() or src[j] in "_$"):
+                j += 1
+            word = src[i:j]
+            k = j
+            while k < n and src[k].isspace():
+                k += 1
+            if k < n and src[k] == ":":
+                out.append(json.dumps(word))
+            else:
+                out.append(word)  # true / false / null
+            i = j
+        elif ch == ",":
+            k = i + 1
+            while k < n and src[k].isspace():
+                k += 1
+            if k < n and src[k] in "}]":
+                i += 1  # trailing comma
+                continue
+            out.append(ch)
+            i += 1
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+def _variant_text(item: dict, variant: str, field: str) -> str:
+    """item['short']['text'] / item['shortText'] style lookups."""
+    nested = item.get(variant)
+    if isinstance(nested, dict):
+        return str(nested.get(field) or "")
+    return str(item.get(variant + field[:1].upper() + field[1:]) or "")
+
+def _data_sections(data: dict, lang: str = "") -> list[dict]:
+    """One fragment per card / Q&A pair and variant; the short and long fragments of a section share its number."""
+    sections = []
+    section = 0
+    for card in data.get("cards", []):
+        if not isinstance(card, dict):
+            continue
+        variants = [v for v in ("short", "long") if isinstance(card.get(v), dict)]
+        for variant in variants or [""]:
+            part = card[variant] if variant else card
+            sections.append({"section": section, "variant": variant, "lang": lang,
+                             "heading": str(part.get("title") or ""), "text": str(part.get("text") or "")})
+        section += 1
+    for qa in data.get("qa", []):
+        if not isinstance(qa, dict):
+            continue
+        question = str(qa.get("question") or "")
+        answers = [(v, _variant_text(qa, v, "ans")) for v in ("short", "long")]
+        answers = [(v, a) for v, a in answers if a] or [("", str(qa.get("answer") or qa.get("ans") or ""))]
+        for variant, answer in answers:
+            sections.append({"section": section, "variant": variant, "lang": lang,
+                             "heading": question, "text": answer})
+        section += 1
+    return sections
+
+def parse_content_data(html: str) -> tuple[int, int, dict] | None:
+    """(start, stop, data) of the page's contentData block; None if it has no parseable one."""
+    span = content_data_span(html)
+    if span is None:
+        return None
+    try:
+        data = json.loads(js_literal_to_json(html[span[0]:span[1]]))
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return span[0], span[1], data
+
+def _is_content(block) -> bool:
+    return isinstance(block, dict) and ("cards" in block or "qa" in block)
+
+def content_languages(data: dict) -> list[str]:
+    """Language keys of a multi-language block ({"hi": {cards, qa}, "en": {...}}); [""] for a single-language one."""
+    if _is_content(data):
+        return [""]
+    return [lang for lang, block in data.items() if _is_content(block)]
+
+def data_block_sections(html: str) -> list[dict] | None:
+    """Sections of a contentData page; None if the page has no (parseable) data block."""
+    parsed = parse_content_data(html)
+    if parsed is None:
+        return None
+    data = parsed[2]
+    sections = []
+    for lang in content_languages(data):
+        sections.extend(_data_sections(data[lang] if lang else data, lang=lang))
+    return sections
+
+
+class _StaticSectionParser(HTMLParser):
+    """Sections of a static page: card headings (<h2>) with their <p>s, Q&A pairs, the quote box."""
+    VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+    SKIP_TAGS = {"script", "style", "a", "svg", "head"}
+    SKIP_CLASSES = {"footer", "disclaimer-box"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections = []
+        self._stack = []        # (tag, skipped, target before it opened)
+        self._target = None     # "heading" | "text" | None: where text goes
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID:
+            return
+        attrs = dict(attrs)
+        classes = set((attrs.get("class") or "").split())
+        skipped = tag in self.SKIP_TAGS or bool(classes & self.SKIP_CLASSES) or attrs.get("id") == "google_translate_element"
+        self._stack.append((tag, skipped, self._target))
+        self._skip += skipped
+        if tag == "h2" or (tag == "span" and "qa-q" in classes):
+            # The question of a qa-box belongs to the section the box opened
+            if not (self.sections and self._is_empty(self.sections[-1]) and tag == "span"):
+                self.sections.append({"heading": [], "text": []})
+            self._target = "heading"
+        elif tag == "div" and classes & {"quote-box", "qa-box"}:
+            # Text directly inside the box (an answer after the question span, the quote)
+            self.sections.append({"heading": [], "text": []})
+            self._target = "text"
+        elif tag == "p" and self.sections:
+            self._target = "text"
+
+    @staticmethod
+    def _is_empty(section: dict) -> bool:
+        return not "".join(section["heading"] + section["text"]).strip()
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID or not any(t == tag for t, _s, _tg in self._stack):
+            return
+        while self._stack:
+            open_tag, skipped, target = self._stack.pop()
+            self._skip -= skipped
+            self._target = target
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._target is not None and self.sections and not self._skip:
+            self.sections[-1][self._target].append(data)
+
+def static_sections(html: str) -> list[dict]:
+    parser = _StaticSectionParser()
+    parser.feed(html)
+    parser.close()
+    out = []
+    for s in parser.sections:
+        heading = " ".join(" ".join(s["heading"]).split())
+        text = " ".join(" ".join(s["text"]).split())
+        if text:
+            out.append({"section": len(out), "variant": "", "lang": "", "heading": heading, "text": text})
+    return out
+
+def extract_sections(html: str) -> list[dict]:
+    """[{section, variant ('short'|'long'|''), lang, heading, text}] for one satsang page."""
+    sections = data_block_sections(html)
+    return sections if sections is not None else static_sections(html)
+
+
+# ============================================================
+# PER-FILE BLOCKS + INDEX
+# ============================================================
+class EmbeddingError(RuntimeError):
+    """The embedder returned no usable vectors for a file (e.g. every API call failed)."""
+
+
+def embeddings_match(embeddings, n_fragments: int) -> bool:
+    """True for a [fragments, dim] matrix (dim 0 = indexed without an embedder)."""
+    return isinstance(embeddings, np.ndarray) and embeddings.ndim == 2 and len(embeddings) == n_fragments
+
+
+class FileBlock:
+    """Indexed fragments of one file + their embeddings."""
+    __slots__ = ("rel_path", "signature", "fragments", "embeddings")
+
+    def __init__(self, rel_path: str, signature: tuple[int, int], fragments: list[dict], embeddings: np.ndarray):
+        self.rel_path = rel_path
+        self.signature = signature
+        self.fragments = fragments
+        self.embeddings = embeddings
+
+def _block_paths(cache_dir: str, rel_path: str) -> tuple[str, str]:
+    key = hashlib.sha1(rel_path.encode("utf-8")).hexdigest()[:20]
+    return os.path.join(cache_dir, key + ".json"), os.path.join(cache_dir, key + ".npy")
+
+def load_block(cache_dir: str, rel_path: str, signature: tuple[int, int]) -> FileBlock | None:
+    meta_path, emb_path = _block_paths(cache_dir, rel_path)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("rel_path") != rel_path or tuple(meta.get("signature", ())) != tuple(signature):
+            return None
+        embeddings = np.load(emb_path)
+    except (OSError, ValueError):
+        return None
+    if not embeddings_match(embeddings, len(meta["fragments"])):
+        return None  # written by a failed embedding run: parse and embed the file again
+    return FileBlock(rel_path, tuple(signature), meta["fragments"], embeddings)
+
+def save_block(cache_dir: str, block: FileBlock):
+    os.makedirs(cache_dir, exist_ok=True)
+    meta_path, emb_path = _block_paths(cache_dir, block.rel_path)
+    np.save(emb_path + ".tmp.npy", block.embeddings)
+    os.replace(emb_path + ".tmp.npy", emb_path)
+    # Metadata last: a block counts as cached only once its embeddings are in place
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"rel_path": block.rel_path, "signature": list(block.signature),
+                   "fragments": block.fragments}, f, ensure_ascii=False)
+    os.replace(meta_path + ".tmp", meta_path)
+
+def index_file(content_dir: str, entry: dict, embed: Callable[[list[str]], np.ndarray] | None) -> FileBlock:
+    """Parse, clean and embed one catalog entry's file; EmbeddingError when embedding fails."""
+    with open(os.path.join(content_dir, entry["rel_path"]), "r", encoding="utf-8", errors="replace") as f:
+        html = f.read()
+    fragments = []
+    for s in extract_sections(html):
+        clean = clean_for_search(f"{s['heading']}\n{s['text']}")
+        if len(clean) >= MIN_FRAGMENT_CHARS:
+            fragments.append({**s, "clean": clean})
+    embeddings = np.zeros((len(fragments), 0), dtype=np.float32)
+    if embed is not None and fragments:
+        embeddings = np.asarray(embed([f["clean"] for f in fragments]), dtype=np.float32)
+        if not embeddings_match(embeddings, len(fragments)) or embeddings.shape[1] == 0:
+            raise EmbeddingError(f"{entry['rel_path']}: embeddings of shape {embeddings.shape} "
+                                 f"for {len(fragments)} fragments")
+    return FileBlock(entry["rel_path"], (entry["mtime_ns"], entry["size"]), fragments, embeddings)
+
+
+class ArchiveIndex:
+    """
+    Fragments of every file, in one LexicalIndex + one embedding matrix.
+    Row ids index `fragments`; `file_of[row]` is the catalog entry of its file.
+    """
+    def __init__(self, blocks: dict[str, FileBlock], catalog: dict):
+        # A block whose embeddings do not line up with its fragments would break the matrix below
+        self.blocks = {k: b for k, b in blocks.items() if embeddings_match(b.embeddings, len(b.fragments))}
+        blocks = self.blocks
+        self.catalog = catalog
+        self.fragments = [frag for b in blocks.values() for frag in b.fragments]
+        self.rel_paths = np.array([b.rel_path for b in blocks.values() for _ in b.fragments], dtype=object)
+        self.lex_index = LexicalIndex([frag["clean"] for frag in self.fragments])
+        # Fingerprint of the indexed file versions (for data derived from this index)
+        h = hashlib.sha1()
+        for rel_path, block in blocks.items():
+            h.update(f"{rel_path}:{block.signature[0]}:{block.signature[1]}|".encode("utf-8"))
+        self.key = h.hexdigest()[:20]
+        dims = {b.embeddings.shape[1] for b in blocks.values() if len(b.fragments)}
+        if len(dims) == 1 and 0 not in dims:
+            self.embeddings = np.concatenate([b.embeddings for b in blocks.values() if len(b.fragments)])
+        else:
+            self.embeddings = None  # no embedder, or blocks from different models
+
+    def __len__(self):
+        return len(self.fragments)
+
+    def entry(self, row_id: int) -> dict:
+        return self.catalog[self.rel_paths[row_id]]
+
+def build_archive_index(content_dir: str, cache_dir: str, catalog: dict,
+                        embed: Callable[[list[str]], np.ndarray] | None,
+                        previous: ArchiveIndex | None = None) -> ArchiveIndex:
+    """
+    Index for `catalog` (satsang_catalog entries). Blocks are taken from
+    `previous`, then from cache_dir, and only files matching neither are
+    parsed and embedded. A file whose embedding fails is left out (and never
+    cached), so the next build tries it again. Returns `previous` when
+    nothing changed.
+    """
+    old_blocks = previous.blocks if previous is not None else {}
+    blocks, built, failed = {}, 0, 0
+    for rel_path, entry in catalog.items():
+        signature = (entry["mtime_ns"], entry["size"])
+        block = old_blocks.get(rel_path)
+        if block is None or block.signature != signature:
+            block = load_block(cache_dir, rel_path, signature)
+        if block is None:
+            try:
+                block = index_file(content_dir, entry, embed)
+            except OSError:
+                continue
+            except EmbeddingError as e:
+                # Not cached: the file is left out and parsed again on the next build
+                print(f"Archive index: skipping {e}")
+                failed += 1
+                continue
+            save_block(cache_dir, block)
+            built += 1
+        blocks[rel_path] = block
+
+    if previous is not None and blocks.keys() == old_blocks.keys() and all(
+            blocks[k] is old_blocks[k] for k in blocks):
+        return previous
+    index = ArchiveIndex(blocks, catalog)
+    print(f"Archive index: {len(index)} fragments from {len(blocks)} files ({built} parsed, {failed} failed)")
+    return index
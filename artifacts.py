@@ -0,0 +1,125 @@
+"""
+Versioned search artifacts, written by build_artifacts.py and loaded by the app.
+
+Layout (one directory per index version, CURRENT names the live one):
+
+    artifacts/
+      CURRENT                      -> "<version>"
+      <version>/
+        manifest.json              provider, embedding model, rows, source, ...
+        corpus.parquet             CorpusStore columns
+        embeddings.npy             float32 [rows, dim], loaded with mmap_mode="r"
+        lexical_<version>.sqlite   FtsLexicalIndex file
+        keywords.json              keyword-chip lists per language
+        satsang_catalog.json       satsang_catalog.scan_catalog() output
+
+A version directory is written under a temp name and renamed into place, then
+CURRENT is replaced, so a reader never sees a partial build.
+"""
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from corpus_store import CorpusStore
+from fts_backend import FtsLexicalIndex
+from satsang_catalog import save_catalog, load_catalog
+
+ARTIFACT_FORMAT = 1
+
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+CORPUS_FILE = "corpus.parquet"
+EMBEDDINGS_FILE = "embeddings.npy"
+KEYWORDS_FILE = "keywords.json"
+CATALOG_FILE = "satsang_catalog.json"
+
+
+def _write_json(path: str, obj):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
+def _read_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def current_version(root: str) -> str | None:
+    """Version named by root/CURRENT, if that build exists."""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), "r", encoding="utf-8") as f:
+            version = f.read().strip()
+    except OSError:
+        return None
+    if version and os.path.exists(os.path.join(root, version, MANIFEST_FILE)):
+        return version
+    return None
+
+def set_current(root: str, version: str):
+    tmp = os.path.join(root, CURRENT_FILE + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(version + "\n")
+    os.replace(tmp, os.path.join(root, CURRENT_FILE))
+
+def write_artifacts(root: str, version: str, corpus: CorpusStore, embeddings: np.ndarray,
+                    keywords: dict, catalog: dict, manifest: dict, make_current: bool = True) -> str:
+    """Write one version directory (atomically) and optionally point CURRENT at it. Returns its path."""
+    final_dir = os.path.join(root, version)
+    tmp_dir = f"{final_dir}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    corpus.to_parquet(os.path.join(tmp_dir, CORPUS_FILE))
+    np.save(os.path.join(tmp_dir, EMBEDDINGS_FILE), np.ascontiguousarray(embeddings, dtype=np.float32))
+    FtsLexicalIndex(tmp_dir, version, corpus)
+    _write_json(os.path.join(tmp_dir, KEYWORDS_FILE), keywords)
+    save_catalog(os.path.join(tmp_dir, CATALOG_FILE), catalog)
+    _write_json(os.path.join(tmp_dir, MANIFEST_FILE), {
+        **manifest,
+        "format": ARTIFACT_FORMAT,
+        "version": version,
+        "fingerprint": corpus.fingerprint,
+        "rows": len(corpus),
+        "embedding_dim": int(embeddings.shape[1]) if embeddings.ndim == 2 else 0,
+        "built_at": time.time(),
+    })
+
+    if os.path.exists(final_dir):
+        shutil.rmtree(final_dir)
+    os.replace(tmp_dir, final_dir)
+    if make_current:
+        set_current(root, version)
+    return final_dir
+
+def read_manifest(root: str, version: str) -> dict | None:
+    """One version's manifest only (None if missing or another format): enough to decide whether to load it."""
+    try:
+        manifest = _read_json(os.path.join(root, version, MANIFEST_FILE))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("format") == ARTIFACT_FORMAT else None
+
+def load_artifacts(root: str, version: str | None = None) -> dict | None:
+    """
+    Open one version (default: CURRENT). Embeddings are memory-mapped and the
+    corpus is read from Parquet, so this is a load, not a build.
+    Returns {'version', 'dir', 'manifest', 'corpus', 'embeddings', 'keywords', 'catalog'} or None.
+    """
+    version = version or current_version(root)
+    if not version:
+        return None
+    vdir = os.path.join(root, version)
+    manifest = read_manifest(root, version)
+    if manifest is None:
+        return None
+    return {
+        "version": version,
+        "dir": vdir,
+        "manifest": manifest,
+        "corpus": CorpusStore.from_parquet(os.path.join(vdir, CORPUS_FILE), fingerprint=manifest.get("fingerprint")),
+        "embeddings": np.load(os.path.join(vdir, EMBEDDINGS_FILE), mmap_mode="r"),
+        "keywords": _read_json(os.path.join(vdir, KEYWORDS_FILE)),
+        "catalog": load_catalog(os.path.join(vdir, CATALOG_FILE)),
+    }
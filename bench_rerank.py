@@ -0,0 +1,83 @@
+"""
+Benchmark: latency cost of the cross-encoder rerank stage per query (CPU).
+
+Usage:
+    python bench_rerank.py sheet.csv [--top-n 50] [--batch-size 16] [--budget 0.8]
+
+Candidates are picked from the CSV (Question + Answer) and reranked for a set
+of sample queries. Prints cold (model + empty cache), warm (cache hit) and
+budgeted timings so the rerank_* defaults in app.py can be tuned per host.
+"""
+import argparse
+import os
+import statistics
+import time
+
+import pandas as pd
+
+from reranker import CrossEncoderReranker, DEFAULT_RERANK_MODEL
+
+SAMPLE_QUERIES = [
+    "I am Sick",
+    "छीन लेना",
+    "नाम जप नहीं हो रहा",
+    "how to control anger",
+    "भगवान सब कुछ ले लेते हैं",
+    "mind does not stay in chanting",
+]
+
+def percentile(values, p):
+    values = sorted(values)
+    k = max(0, min(len(values) - 1, int(round(p / 100 * (len(values) - 1)))))
+    return values[k]
+
+def report(label, timings_ms):
+    print(f"{label:<28} p50={statistics.median(timings_ms):8.1f} ms   "
+          f"p95={percentile(timings_ms, 95):8.1f} ms   max={max(timings_ms):8.1f} ms")
+
+def bench_rerank(csv_path, top_n, batch_size, budget, model_name):
+    df = pd.read_csv(csv_path).fillna("")
+    answers = df["Answer"].astype(str) if "Answer" in df.columns else ""
+    texts = (df["Question"].astype(str) + " " + answers).str.strip().tolist()
+    row_ids = list(range(min(top_n, len(texts))))
+    print(f"Rows: {len(texts)} | candidates/query: {len(row_ids)} | batch={batch_size} | "
+          f"model={model_name} | cpus={os.cpu_count()}")
+
+    rr = CrossEncoderReranker(texts, model_name=model_name, batch_size=batch_size)
+    t = time.perf_counter()
+    _ = rr.model
+    print(f"Model load: {(time.perf_counter() - t) * 1000:.0f} ms")
+
+    cold, warm, budgeted, coverage = [], [], [], []
+    for q in SAMPLE_QUERIES:
+        t = time.perf_counter()
+        rr.rerank(q, row_ids)
+        cold.append((time.perf_counter() - t) * 1000)
+
+        t = time.perf_counter()
+        rr.rerank(q, row_ids)
+        warm.append((time.perf_counter() - t) * 1000)
+
+    # Budgeted run on a fresh cache
+    rr_b = CrossEncoderReranker(texts, model_name=model_name, batch_size=batch_size)
+    rr_b._model = rr.model
+    for q in SAMPLE_QUERIES:
+        t = time.perf_counter()
+        _, scores = rr_b.rerank(q, row_ids, time_budget_s=budget)
+        budgeted.append((time.perf_counter() - t) * 1000)
+        coverage.append(len(scores) / max(1, len(row_ids)))
+
+    report("cold (full rerank)", cold)
+    report("warm (cached pairs)", warm)
+    report(f"budget={budget:.2f}s", budgeted)
+    print(f"Budgeted coverage: mean {statistics.mean(coverage):.0%} of candidates reranked")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("csv", help="Sheet CSV export (needs a Question column)")
+    ap.add_argument("--top-n", type=int, default=50)
+    ap.add_argument("--batch-size", type=int, default=16)
+    ap.add_argument("--budget", type=float, default=0.8, help="Time budget in seconds")
+    ap.add_argument("--model", default=DEFAULT_RERANK_MODEL)
+    args = ap.parse_args()
+    bench_rerank(args.csv, args.top_n, args.batch_size, args.budget, args.model)
@@ -0,0 +1,95 @@
+"""
+Benchmark: query throughput of the sharded index by shard count (CPU).
+
+Usage:
+    python bench_sharding.py [sheet.csv] [--rows 300000] [--dim 768] [--shards 1,2,4,8] [--queries 30]
+
+Builds a synthetic corpus of --rows rows (texts sampled from the CSV's
+Question/Answer columns if given, random embeddings of --dim) and runs the
+same queries unsharded and with each shard count, one shard per worker
+thread. Prints queries/s and the speed-up over unsharded, and checks that
+every shard count returns exactly the unsharded ranking.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from search_core import LexicalIndex, rank_candidates
+from sharded_index import ShardedIndex
+
+SAMPLE_QUERIES = [
+    "naam jap", "नाम जप नहीं हो रहा", "anger", "भगवान", "mind does not stay in chanting",
+    "सेवा", "guru kripa", "मन",
+]
+
+def corpus_texts(csv_path: str | None, rows: int, seed: int = 0) -> list[str]:
+    if csv_path:
+        df = pd.read_csv(csv_path).fillna("")
+        answers = df["Answer"].astype(str) if "Answer" in df.columns else ""
+        base = (df["Question"].astype(str) + " " + answers).str.strip().tolist()
+    else:
+        base = [f"{q} sample answer text {i}" for i, q in enumerate(SAMPLE_QUERIES * 50)]
+    rng = np.random.default_rng(seed)
+    return [base[i] for i in rng.integers(0, len(base), size=rows)]
+
+def make_queries(n: int, dim: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    out = []
+    for k in range(n):
+        q = SAMPLE_QUERIES[k % len(SAMPLE_QUERIES)]
+        emb = rng.standard_normal(dim).astype(np.float32)
+        out.append((q, emb / np.linalg.norm(emb)))
+    return out
+
+def lexical(lex_index: LexicalIndex, q: str) -> np.ndarray:
+    toks = q.lower().split()
+    return lex_index.scores(toks, len(toks), q.lower())
+
+def rank(sim, lex, q: str):
+    return rank_candidates(sim, lex, "Hybrid (Recommended)", len(q.split()), 0.75, 0.25)
+
+def run_unsharded(embeddings, lex_index, queries):
+    return [rank(embeddings @ emb, lexical(lex_index, q), q) for q, emb in queries]
+
+def run_sharded(index: ShardedIndex, queries):
+    out = []
+    for q, emb in queries:
+        score = lambda shard, q=q, emb=emb: (shard.embeddings @ emb, lexical(shard.lex_index, q))
+        out.append(index.search(score, lambda sim, lex, q=q: rank(sim, lex, q), "Hybrid (Recommended)"))
+    return out
+
+def timed(fn, n_queries):
+    t = time.perf_counter()
+    results = fn()
+    dt = time.perf_counter() - t
+    return results, n_queries / dt
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("csv", nargs="?", help="Sheet CSV export (Question/Answer); synthetic texts if omitted")
+    ap.add_argument("--rows", type=int, default=300_000)
+    ap.add_argument("--dim", type=int, default=768)
+    ap.add_argument("--shards", default="1,2,4,8")
+    ap.add_argument("--queries", type=int, default=30)
+    args = ap.parse_args()
+
+    t = time.perf_counter()
+    lex_index = LexicalIndex(corpus_texts(args.csv, args.rows))
+    rng = np.random.default_rng(2)
+    embeddings = rng.standard_normal((args.rows, args.dim), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    queries = make_queries(args.queries, args.dim)
+    print(f"Rows: {args.rows} | dim: {args.dim} | queries: {len(queries)} | cpus={os.cpu_count()} | "
+          f"setup {time.perf_counter() - t:.1f}s")
+
+    baseline, base_qps = timed(lambda: run_unsharded(embeddings, lex_index, queries), len(queries))
+    print(f"{'unsharded':<12} {base_qps:8.1f} q/s")
+    for n in [int(x) for x in args.shards.split(",")]:
+        index = ShardedIndex(embeddings, lex_index, n, workers=n)
+        results, qps = timed(lambda: run_sharded(index, queries), len(queries))
+        same = all(np.array_equal(a.ids, b.ids) for a, b in zip(baseline, results))
+        print(f"{f'{n} shards':<12} {qps:8.1f} q/s   x{qps / base_qps:4.2f}   "
+              f"{'same ranking' if same else 'RANKING DIFFERS'}")
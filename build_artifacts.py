@@ -0,0 +1,87 @@
+"""
+Build the app's search artifacts ahead of time (see artifacts.py for the layout).
+
+Usage:
+    python build_artifacts.py SOURCE [--out artifacts] [--provider "Google Gemini"]
+                              [--api-key KEY] [--satsang-dir satsang_content] [--no-current]
+
+SOURCE is a sheet CSV export: a local path or an http(s) URL. The corpus is
+cleaned with the same prepare_corpus() the app uses, embedded, indexed, and
+written to <out>/<index version>/; CURRENT is then pointed at it and a running
+app swaps it in on its next background refresh.
+"""
+import argparse
+import os
+import sys
+import time
+import urllib.request
+
+from artifacts import write_artifacts
+from corpus_store import CorpusStore, prepare_corpus, compute_index_version, CORPUS_PREPARE_VERSION
+from embedders import GEMINI_PROVIDER, LOCAL_PROVIDER, embed_model_name, load_embedder, encode_corpus
+from keywords import pick_english_source_column, extract_top_keywords, extract_hindi_keywords
+from satsang_catalog import scan_catalog
+from sheet_fetch import parse_sheet_csv
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def read_source(source: str, timeout: float = 60.0) -> bytes:
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=timeout) as resp:
+            return resp.read()
+    with open(source, "rb") as f:
+        return f.read()
+
+def step(label: str, t0: float):
+    print(f"{label:<28} {time.perf_counter() - t0:7.2f}s")
+
+def build_artifacts(source: str, out_dir: str, provider: str, api_key: str, satsang_dir: str,
+                    make_current: bool = True) -> str:
+    t = time.perf_counter()
+    corpus = CorpusStore.from_frame(prepare_corpus(parse_sheet_csv(read_source(source))))
+    version = compute_index_version(provider, corpus)
+    step(f"corpus ({len(corpus)} rows)", t)
+
+    t = time.perf_counter()
+    model = load_embedder(provider, api_key)
+    embeddings = encode_corpus(model, provider, corpus["embed_text"].tolist())
+    if embeddings.size == 0:
+        raise RuntimeError(f"Failed to build {provider} embeddings.")
+    step(f"embeddings {embeddings.shape}", t)
+
+    t = time.perf_counter()
+    kw_col = pick_english_source_column(corpus)
+    keywords = {
+        "English": extract_top_keywords(corpus, kw_col, top_n=30) if kw_col else [],
+        "Hindi": extract_hindi_keywords(corpus, top_n=30),
+    }
+    catalog = scan_catalog(satsang_dir) if os.path.isdir(satsang_dir) else {}
+    step(f"keywords + catalog ({len(catalog)} files)", t)
+
+    t = time.perf_counter()
+    path = write_artifacts(out_dir, version, corpus, embeddings, keywords, catalog, {
+        "provider": provider,
+        "embedding_model": embed_model_name(provider),
+        "prepare_version": CORPUS_PREPARE_VERSION,
+        "source": source,
+    }, make_current=make_current)
+    step("write (incl. lexical index)", t)
+    return path
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("source", help="Sheet CSV export: file path or URL")
+    ap.add_argument("--out", default=os.path.join(SCRIPT_DIR, "artifacts"))
+    ap.add_argument("--provider", default=GEMINI_PROVIDER, choices=[GEMINI_PROVIDER, LOCAL_PROVIDER],
+                    help="Must match the app's provider for the artifacts to be used")
+    ap.add_argument("--api-key", default=os.environ.get("GOOGLE_API_KEY", ""))
+    ap.add_argument("--satsang-dir", default=os.path.join(SCRIPT_DIR, "satsang_content"))
+    ap.add_argument("--no-current", action="store_true", help="Build without pointing CURRENT at it")
+    args = ap.parse_args()
+
+    if args.provider == GEMINI_PROVIDER and not args.api_key:
+        sys.exit("Gemini embeddings need --api-key (or GOOGLE_API_KEY).")
+    out = build_artifacts(args.source, args.out, args.provider, args.api_key, args.satsang_dir,
+                          make_current=not args.no_current)
+    print(f"Artifacts written to {out}")
@@ -0,0 +1,202 @@
+"""
+Keeps the satsang catalog and archive listing up to date as files are
+added, changed or removed under satsang_content/ (e.g. satsang_content/<Language>/).
+
+Change notifications come from watchdog (inotify on Linux, FSEvents / ReadDirectoryChanges
+elsewhere) when it is installed; otherwise a background poll compares file
+signatures every poll_s. Either way, requests never scan: they read
+`watcher.listing` / `watcher.catalog`, which are replaced together (one
+reference assignment of the pair) after each batch of changes.
+
+Debounce: a changed path is applied only once its mtime/size has stayed the
+same for debounce_s, so a file still being copied is not parsed half-written.
+"""
+import os
+import threading
+import time
+
+from satsang_catalog import (file_signature, catalog_entry, refresh_catalog, save_catalog,
+                             archive_listing, update_listing)
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+DEBOUNCE_S = 2.0
+POLL_S = 5.0
+
+_UNSEEN = object()   # pending path whose signature has not been read yet
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "CatalogWatcher"):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            # A folder moved / copied in: its files may not get their own events
+            if event.event_type in ("created", "moved", "deleted"):
+                self.watcher.request_resync()
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self.watcher.notify(path)
+
+
+class CatalogWatcher:
+    def __init__(self, content_dir: str, cache_path: str, seed: dict | None = None,
+                 debounce_s: float = DEBOUNCE_S, poll_s: float = POLL_S):
+        self.content_dir = content_dir
+        self.cache_path = cache_path
+        self.debounce_s = debounce_s
+        self.poll_s = poll_s
+        # Initial state: one scan against the saved catalog (only new/changed files are parsed)
+        catalog = refresh_catalog(content_dir, cache_path, seed=seed)
+        self._state = (catalog, archive_listing(content_dir, catalog))
+        self.mode = None
+        self._pending = {}      # rel_path -> (signature | None | _UNSEEN, since)
+        self._resync = False
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._observer = None
+
+    @property
+    def catalog(self) -> dict:
+        return self._state[0]
+
+    @property
+    def listing(self) -> dict:
+        return self._state[1]
+
+    def snapshot(self) -> tuple[dict, dict]:
+        """(catalog, listing) of the same batch of changes."""
+        return self._state
+
+    def start(self) -> "CatalogWatcher":
+        if Observer is not None:
+            try:
+                self._observer = Observer()
+                self._observer.schedule(_EventHandler(self), self.content_dir, recursive=True)
+                self._observer.daemon = True
+                self._observer.start()
+                self.mode = "events"
+            except Exception as e:
+                print(f"Satsang watcher: file events unavailable ({e}); polling every {self.poll_s:g}s")
+                self._observer = None
+        if self._observer is None:
+            self.mode = "polling"
+        threading.Thread(target=self._run, daemon=True, name="satsang-watcher").start()
+        return self
+
+    # --- change intake (observer thread / poll) ---
+    def notify(self, path: str):
+        if not path.endswith(".html"):
+            return
+        rel_path = os.path.relpath(path, self.content_dir)
+        with self._lock:
+            self._pending[rel_path] = (_UNSEEN, time.monotonic())
+        self._wake.set()
+
+    def request_resync(self):
+        self._resync = True
+        self._wake.set()
+
+    def _queue_changes(self):
+        """Notify every path whose signature differs from the catalog (added, changed or removed)."""
+        catalog = self.catalog
+        with self._lock:
+            pending = set(self._pending)
+        seen = set()
+        for root, _dirs, files in os.walk(self.content_dir):
+            for file in files:
+                if not file.endswith(".html"):
+                    continue
+                path = os.path.join(root, file)
+                rel_path = os.path.relpath(path, self.content_dir)
+                seen.add(rel_path)
+                if rel_path in pending:
+                    continue    # already being debounced
+                old = catalog.get(rel_path)
+                try:
+                    if old is not None and (old["mtime_ns"], old["size"]) == file_signature(path):
+                        continue
+                except OSError:
+                    pass
+                self.notify(path)
+        for rel_path in catalog.keys() - seen - pending:
+            self.notify(os.path.join(self.content_dir, rel_path))
+
+    # --- debounce + apply (watcher thread) ---
+    def _signature(self, rel_path: str):
+        try:
+            return file_signature(os.path.join(self.content_dir, rel_path))
+        except OSError:
+            return None
+
+    def _settled(self) -> list[tuple[str, object]]:
+        """Pending paths whose signature has not changed for debounce_s: [(rel_path, signature | None)]."""
+        now = time.monotonic()
+        with self._lock:
+            pending = list(self._pending.items())
+        ready = []
+        for rel_path, item in pending:
+            sig, since = item
+            current = self._signature(rel_path)
+            with self._lock:
+                if self._pending.get(rel_path) is not item:
+                    continue    # a newer event came in meanwhile
+                if sig is _UNSEEN or current != sig:
+                    # First look, or still being written: (re)start the quiet period
+                    self._pending[rel_path] = (current, now)
+                elif now - since >= self.debounce_s:
+                    del self._pending[rel_path]
+                    ready.append((rel_path, current))
+        return ready
+
+    def _apply(self, changes: list[tuple[str, object]]):
+        old_catalog, old_listing = self._state
+        catalog = dict(old_catalog)
+        removed, added = [], []
+        for rel_path, sig in changes:
+            old = catalog.get(rel_path)
+            if old is not None and sig is not None and (old["mtime_ns"], old["size"]) == tuple(sig):
+                continue
+            if old is not None:
+                removed.append(catalog.pop(rel_path))
+            if sig is not None:
+                try:
+                    entry = catalog_entry(self.content_dir, rel_path)
+                except OSError:
+                    continue
+                catalog[rel_path] = entry
+                added.append(entry)
+        if not removed and not added:
+            return
+        # Both built first, then published in one assignment
+        self._state = (catalog, update_listing(old_listing, self.content_dir, removed, added))
+        save_catalog(self.cache_path, catalog)
+        print(f"Satsang catalog: +{len(added)} / -{len(removed)} files ({len(catalog)} total)")
+
+    def _run(self):
+        last_poll = time.monotonic()
+        while True:
+            if self._pending:
+                timeout = self.debounce_s / 2
+            else:
+                timeout = self.poll_s if self.mode == "polling" else None
+            self._wake.wait(timeout)
+            self._wake.clear()
+            try:
+                now = time.monotonic()
+                if self._resync or (self.mode == "polling" and now - last_poll >= self.poll_s):
+                    self._resync = False
+                    last_poll = now
+                    self._queue_changes()
+                ready = self._settled()
+                if ready:
+                    self._apply(ready)
+            except Exception as e:
+                print(f"Satsang watcher error: {e}")
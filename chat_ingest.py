@@ -0,0 +1,164 @@
+"""
+Streaming WhatsApp chat-export ingester: exported chat .txt -> Q&A rows in
+the sheet schema (Question / Answer / Translated Question / Translated Answer),
+ready to paste into the sheet or to pass to build_artifacts.py. --with-date
+adds the question's chat date as an extra "Date" column (not part of the
+sheet schema; the app ignores it).
+
+Usage:
+    python chat_ingest.py CHAT.txt --responder "Babaji" [--responder ...] [--out rows.csv] [--with-date]
+
+The file is read line by line; only the message being assembled, the current
+question/answer pair and one cleaning batch are held in memory, so multi-year
+exports run in constant memory.
+
+Pairing: messages from a --responder form the answer; the question is the
+run of messages from the last other sender right before it. A row is emitted
+when someone else speaks after the answer (or at end of file). Questions that
+clean to fewer than MIN_QUESTION_CHARS (greetings, "Radhe Radhe 🙏", media)
+are skipped, using the same clean_for_search() as the search corpus.
+"""
+import argparse
+import csv
+import re
+import sys
+import time
+from collections import deque
+
+from text_processing import clean_series_for_search, PHONE_RE
+
+SHEET_COLUMNS = ("Question", "Answer", "Translated Question", "Translated Answer")
+# Opt-in extra column (--with-date); rows always carry it, the CSV only on request
+DATE_COLUMN = "Date"
+
+# Same minimum as prepare_corpus' embed_text filter
+MIN_QUESTION_CHARS = 10
+# Messages kept per side of a pair (keeps memory bounded on long monologues)
+MAX_RUN_MESSAGES = 20
+# Rows cleaned together (vectorized) before the length filter
+CLEAN_BATCH_ROWS = 5000
+
+# Android: "1/10/25, 7:11 PM - Name: text"   iOS: "[1/10/25, 7:11:05 PM] Name: text"
+_TIME = r"\d{1,2}:\d{2}(?::\d{2})?(?:\s?[AaPp]\.?[Mm]\.?)?"
+ANDROID_RE = re.compile(rf"^(\d{{1,2}}/\d{{1,2}}/\d{{2,4}}),\s*{_TIME}\s*-\s*(.*)$")
+IOS_RE = re.compile(rf"^\[(\d{{1,2}}/\d{{1,2}}/\d{{2,4}}),\s*{_TIME}\]\s*(.*)$")
+SENDER_RE = re.compile(r"^([^:]{1,80}?):\s(.*)$")
+
+SKIP_MESSAGES = {
+    "<media omitted>", "image omitted", "video omitted", "audio omitted", "sticker omitted",
+    "document omitted", "gif omitted", "this message was deleted", "you deleted this message",
+    "<this message was edited>", "null",
+}
+
+
+def iter_messages(lines):
+    """
+    (date, sender, text) per chat message; continuation lines are joined to
+    their message, system lines (no "Sender:") are dropped.
+    """
+    current = None
+    for line in lines:
+        # \ufeff: byte order mark at the start of many exports (would hide the first message)
+        line = line.rstrip("\r\n").replace("\ufeff", "").replace("\u200e", "").replace("\u202f", " ")
+        m = ANDROID_RE.match(line) or IOS_RE.match(line)
+        if m is None:
+            if current is not None:
+                current[2].append(line)
+            continue
+        if current is not None:
+            yield current[0], current[1], "\n".join(current[2]).strip()
+        date, rest = m.groups()
+        sm = SENDER_RE.match(rest)
+        current = (date, sm.group(1).strip(), [sm.group(2)]) if sm else None
+    if current is not None:
+        yield current[0], current[1], "\n".join(current[2]).strip()
+
+def _is_content(text: str) -> bool:
+    return bool(text) and text.lower() not in SKIP_MESSAGES
+
+def iter_pairs(lines, responders):
+    """Every question/answer pair as a sheet-schema row dict (+ DATE_COLUMN), in chat order (unfiltered)."""
+    responders = {r.strip() for r in responders}
+    q_sender, q_parts, q_date = None, deque(maxlen=MAX_RUN_MESSAGES), ""
+    a_parts = deque(maxlen=MAX_RUN_MESSAGES)
+
+    def row():
+        return {
+            "Question": PHONE_RE.sub(" ", "\n".join(q_parts)).strip(),
+            "Answer": PHONE_RE.sub(" ", "\n".join(a_parts)).strip(),
+            "Translated Question": "",
+            "Translated Answer": "",
+            DATE_COLUMN: q_date,
+        }
+
+    for date, sender, text in iter_messages(lines):
+        if not _is_content(text):
+            continue
+        if sender in responders:
+            if q_parts:
+                a_parts.append(text)
+            continue
+        # A non-responder speaks: close the answered pair, or extend / restart the question
+        if a_parts:
+            yield row()
+            q_sender = None
+            q_parts.clear()
+            a_parts.clear()
+        if sender != q_sender:
+            q_sender, q_date = sender, date
+            q_parts.clear()
+        q_parts.append(text)
+
+    if a_parts:
+        yield row()
+
+def iter_qa_rows(lines, responders):
+    """
+    Sheet-schema row dicts, in chat order, without the pairs whose question
+    is too short after clean_for_search (cleaned in vectorized batches).
+    """
+    batch = []
+
+    def flush():
+        clean = clean_series_for_search([r["Question"] for r in batch])
+        keep = [r for r, c in zip(batch, clean.tolist()) if len(c) >= MIN_QUESTION_CHARS]
+        batch.clear()
+        return keep
+
+    for r in iter_pairs(lines, responders):
+        batch.append(r)
+        if len(batch) >= CLEAN_BATCH_ROWS:
+            yield from flush()
+    if batch:
+        yield from flush()
+
+def ingest_chat(path: str, responders, out_path: str | None = None, encoding: str = "utf-8",
+                with_date: bool = False) -> int:
+    """Stream one export into a CSV (stdout if out_path is None). Returns the number of rows."""
+    n = 0
+    columns = SHEET_COLUMNS + (DATE_COLUMN,) if with_date else SHEET_COLUMNS
+    out = open(out_path, "w", newline="", encoding="utf-8") if out_path else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        with open(path, "r", encoding=encoding, errors="replace") as f:
+            for r in iter_qa_rows(f, responders):
+                writer.writerow(r)
+                n += 1
+    finally:
+        if out_path:
+            out.close()
+    return n
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("chat", help="WhatsApp 'Export chat' .txt file")
+    ap.add_argument("--responder", action="append", required=True,
+                    help="Sender name (as shown in the export) whose messages are answers; repeatable")
+    ap.add_argument("--out", help="CSV to write (default: stdout)")
+    ap.add_argument("--with-date", action="store_true", help="Add the question's chat date as a Date column")
+    args = ap.parse_args()
+
+    t = time.perf_counter()
+    rows = ingest_chat(args.chat, args.responder, args.out, with_date=args.with_date)
+    print(f"{rows} Q&A rows in {time.perf_counter() - t:.2f}s", file=sys.stderr)
@@ -0,0 +1,69 @@
+"""
+Named collections (e.g. per language, year or satsang series), each with its
+own corpus and index, loaded lazily on first use.
+
+Every collection is served by its own BackgroundRefresher, created the first
+time the collection is asked for. Loaded collections are kept in LRU order;
+when their combined size goes over memory_cap_bytes the least recently used
+ones are dropped (the next use loads them again).
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from refresher import BackgroundRefresher
+
+
+class CollectionRegistry:
+    def __init__(self, names, make_refresher: Callable[[str], BackgroundRefresher],
+                 size_of: Callable[[object], int], memory_cap_bytes: int):
+        self.names = tuple(names)
+        self.memory_cap_bytes = memory_cap_bytes
+        self._make_refresher = make_refresher
+        self._size_of = size_of
+        self._lru: OrderedDict[str, BackgroundRefresher] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _refresher(self, name: str) -> BackgroundRefresher:
+        if name not in self.names:
+            raise KeyError(f"Unknown collection: {name}")
+        with self._lock:
+            refresher = self._lru.get(name)
+            if refresher is None:
+                refresher = self._make_refresher(name)
+                self._lru[name] = refresher
+            self._lru.move_to_end(name)
+            return refresher
+
+    def ready(self, name: str) -> bool:
+        with self._lock:
+            refresher = self._lru.get(name)
+        return refresher is not None and refresher.ready
+
+    def get(self, name: str):
+        """Current value of a collection; blocks only on its first load."""
+        value = self._refresher(name).get()
+        self._evict(keep=name)
+        return value
+
+    def loaded(self) -> dict:
+        """{name: value} of the collections currently in memory, most recently used first."""
+        with self._lock:
+            refreshers = list(reversed(self._lru.items()))
+        return {name: r.get() for name, r in refreshers if r.ready}
+
+    def memory_bytes(self) -> dict[str, int]:
+        return {name: self._size_of(value) for name, value in self.loaded().items()}
+
+    def _evict(self, keep: str):
+        sizes = self.memory_bytes()
+        total = sum(sizes.values())
+        with self._lock:
+            for name in list(self._lru):
+                if total <= self.memory_cap_bytes:
+                    break
+                if name == keep or name not in sizes:   # never drop one that is still loading
+                    continue
+                self._lru.pop(name)
+                total -= sizes.get(name, 0)
+                print(f"Evicted collection '{name}' ({sizes.get(name, 0) / 1e6:.1f} MB, cap {self.memory_cap_bytes / 1e6:.0f} MB)")
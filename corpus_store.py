@@ -0,0 +1,190 @@
+"""
+Compact columnar corpus: only the fields search and render use, stored as
+Arrow-backed string columns (pandas "string[pyarrow]", falls back to the
+python string dtype when pyarrow is missing). Rows are addressed by integer
+row id = position, and card data for a page is fetched column by column.
+
+prepare_corpus() (raw sheet -> cleaned corpus frame) lives here too so the
+offline artifact builder produces exactly what the app would.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from dedup import near_duplicate_groups
+from sheet_fetch import SheetSchemaError
+from text_processing import clean_series_for_search, clean_series_parallel, PARALLEL_CLEAN_MIN_ROWS
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    STRING_DTYPE = pd.StringDtype("python")
+
+# What result cards display
+RENDER_COLUMNS = ("Question", "Answer", "Translated Question", "Translated Answer")
+# What the indexes are built from
+SEARCH_COLUMNS = ("embed_text", "lex_text")
+# English keyword-chip source (first one present is kept, see pick_english_source_column)
+ENGLISH_SOURCE_COLUMNS = ("English Text", "English", "Translated Question", "Translated Answer")
+
+
+# Bump when prepare_corpus changes so old snapshots are re-cleaned
+CORPUS_PREPARE_VERSION = "5"
+
+def prepare_corpus(df: pd.DataFrame) -> pd.DataFrame:
+    """Raw sheet -> search corpus (cleaned + derived columns). Only runs when the sheet changed."""
+    if "Question" not in df.columns:
+        raise SheetSchemaError("'Question' column missing from sheet.")
+    if "Answer" not in df.columns:
+        df["Answer"] = ""
+    if "Translated Question" not in df.columns:
+        df["Translated Question"] = ""
+    if "Translated Answer" not in df.columns:
+        df["Translated Answer"] = ""
+
+    df = df.reset_index(drop=True)
+
+    # Clean fields (vectorized; same output as clean_for_search row by row)
+    clean = clean_series_parallel if len(df) >= PARALLEL_CLEAN_MIN_ROWS else clean_series_for_search
+    df["clean_question"] = clean(df["Question"])
+    df["clean_translated_q"] = clean(df["Translated Question"])
+    df["clean_answer"] = clean(df["Answer"])
+    df["clean_translated_a"] = clean(df["Translated Answer"])
+
+    # Embedding corpus (question-centric)
+    df["embed_text"] = (df["clean_question"] + " " + df["clean_translated_q"]).str.strip()
+
+    # Lexical corpus (includes answer too)
+    df["lex_text"] = (df["clean_question"] + " " + df["clean_translated_q"] + " " + df["clean_answer"]).str.strip()
+
+    # Drop near-empty rows after cleaning
+    df["embed_len"] = df["embed_text"].str.strip().str.len()
+    df = df[df["embed_len"] >= 10].reset_index(drop=True)
+
+    # Near-duplicate questions (MinHash + LSH): row -> its group's canonical row, -1 = canonical
+    canonical = near_duplicate_groups(df["embed_text"])
+    df["dup_of"] = np.where(canonical == np.arange(len(df)), -1, canonical)
+
+    # Near-duplicates are not indexed as rows, but their wording (and answers, which
+    # may differ) stays findable by literal search: each distinct lexical text of a
+    # group is appended to its canonical row's, so a hit on it returns that row.
+    dups = df.loc[df["dup_of"] >= 0, ["dup_of", "lex_text"]].drop_duplicates()
+    dups = dups[dups["lex_text"].to_numpy() != df["lex_text"].to_numpy()[dups["dup_of"].to_numpy()]]
+    if len(dups):
+        extra = dups.groupby("dup_of", sort=False)["lex_text"].agg("\n".join)
+        df.loc[extra.index, "lex_text"] = df.loc[extra.index, "lex_text"] + "\n" + extra
+
+    return df
+
+def compute_index_version(provider: str, corpus: "CorpusStore") -> str:
+    """Stable fingerprint of the indexed corpus; derived caches are keyed by it."""
+    return hashlib.sha1(f"{provider}\0{corpus.fingerprint}".encode("utf-8")).hexdigest()[:16]
+
+
+def _string_columns(df: pd.DataFrame, names) -> dict[str, pd.Series]:
+    return {c: pd.Series(df[c].fillna("").astype(str).to_numpy(), dtype=STRING_DTYPE) for c in names}
+
+
+class CorpusStore:
+    """
+    Read-only column store. Supports the small DataFrame surface the app
+    uses (`store[col]`, `col in store.columns`, `len(store)`) plus
+    rows(ids) for rendering a page of result cards.
+
+    Only canonical rows are stored as rows (and indexed); near-duplicates of
+    a row are kept aside for display: similar_counts[i] and similar_rows(i).
+    A canonical row's lex_text also holds its near-duplicates' (see
+    prepare_corpus), so literal search still finds them through it.
+    """
+    def __init__(self, columns: dict[str, pd.Series], fingerprint: str | None = None,
+                 similar: dict[str, pd.Series] | None = None, similar_parent: np.ndarray | None = None):
+        self._cols = columns
+        self.columns = list(columns)
+        self._n = len(next(iter(columns.values()))) if columns else 0
+        self._fingerprint = fingerprint
+        # Near-duplicates: render columns, sorted by parent (canonical row id)
+        self._similar = similar or {}
+        self._similar_parent = similar_parent if similar_parent is not None else np.zeros(0, dtype=np.int32)
+        self.similar_counts = np.bincount(self._similar_parent, minlength=self._n).astype(np.int32)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, fingerprint: str | None = None) -> "CorpusStore":
+        keep = [c for c in RENDER_COLUMNS + SEARCH_COLUMNS if c in df.columns]
+        eng = next((c for c in ENGLISH_SOURCE_COLUMNS if c in df.columns), None)
+        if eng and eng not in keep:
+            keep.append(eng)
+        df = df.reset_index(drop=True)
+        if "dup_of" not in df.columns:
+            return cls(_string_columns(df, keep), fingerprint=fingerprint)
+
+        dup_of = pd.to_numeric(df["dup_of"]).to_numpy(dtype=np.int64)
+        canon = np.flatnonzero(dup_of < 0)
+        new_id = np.full(len(df), -1, dtype=np.int64)
+        new_id[canon] = np.arange(len(canon))
+        dups = np.flatnonzero(dup_of >= 0)
+        parent = new_id[dup_of[dups]]
+        order = np.argsort(parent, kind="stable")
+        dups, parent = dups[order], parent[order]
+        return cls(
+            _string_columns(df.iloc[canon], keep), fingerprint=fingerprint,
+            similar=_string_columns(df.iloc[dups], [c for c in RENDER_COLUMNS if c in df.columns]),
+            similar_parent=parent.astype(np.int32),
+        )
+
+    @classmethod
+    def from_parquet(cls, path: str, fingerprint: str | None = None) -> "CorpusStore":
+        """Load a store written by to_parquet() (memory-mapped read, no re-cleaning)."""
+        return cls.from_frame(pd.read_parquet(path, memory_map=True), fingerprint=fingerprint)
+
+    def to_parquet(self, path: str):
+        """Canonical rows first, then near-duplicates with dup_of = their canonical row id."""
+        df = pd.DataFrame(self._cols)
+        df["dup_of"] = -1
+        if len(self._similar_parent):
+            sim = pd.DataFrame(self._similar)
+            sim["dup_of"] = self._similar_parent
+            df = pd.concat([df, sim], ignore_index=True)
+        df.to_parquet(path, index=False)
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, name: str) -> pd.Series:
+        return self._cols[name]
+
+    def rows(self, ids, columns=RENDER_COLUMNS) -> list[dict]:
+        """Card data for the given row ids, gathered per column (one take() per column)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.size == 0:
+            return []
+        gathered = {c: self._cols[c].take(ids).tolist() for c in columns if c in self._cols}
+        return [{c: vals[k] for c, vals in gathered.items()} for k in range(len(ids))]
+
+    def similar_rows(self, row_id: int, columns=RENDER_COLUMNS) -> list[dict]:
+        """Card data of the near-duplicates collapsed into canonical row `row_id`."""
+        lo, hi = np.searchsorted(self._similar_parent, [row_id, row_id + 1])
+        if lo == hi:
+            return []
+        gathered = {c: self._similar[c].iloc[lo:hi].tolist() for c in columns if c in self._similar}
+        return [{c: vals[k] for c, vals in gathered.items()} for k in range(hi - lo)]
+
+    @property
+    def fingerprint(self) -> str:
+        """SHA-1 over the search columns (computed once); index caches are keyed by it."""
+        if self._fingerprint is None:
+            h = hashlib.sha1()
+            for c in SEARCH_COLUMNS:
+                if c not in self._cols:
+                    continue
+                for t in self._cols[c].tolist():
+                    h.update(t.encode("utf-8"))
+                    h.update(b"\0")
+                h.update(b"\1")
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    def memory_bytes(self) -> int:
+        series = list(self._cols.values()) + list(self._similar.values())
+        return int(sum(s.memory_usage(deep=True, index=False) for s in series))
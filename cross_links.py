@@ -0,0 +1,225 @@
+"""
+Cross links between Q&A rows and satsang pages, from the embeddings both
+sides already have (the Q&A corpus and archive_index.ArchiveIndex are
+embedded with the same model).
+
+For every Q&A row: its top-k satsang files, each with its best-matching
+section; for every satsang file: its top-k Q&A rows. Both are fixed-width
+kNN adjacency arrays (int32 ids, -1 = no link; float16 scores), built in the
+background once per (Q&A index version, archive contents) and saved under
+cache_dir, so showing links at render time is an array lookup.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from archive_index import ArchiveIndex
+
+K_LINKS = 3
+# Cosine similarity below which two texts are not linked
+MIN_LINK_SCORE = 0.55
+# Q&A rows scored per step (the step's score block is rows x archive fragments)
+BLOCK_ROWS = 512
+# Link sets kept in memory (one per served Q&A index version)
+MAX_LINK_SETS = 4
+# Link files kept in cache_dir
+MAX_CACHED_FILES = 8
+
+
+class CrossLinks:
+    def __init__(self, key: str, qa_version: str, rel_paths: list[str],
+                 qa_files, qa_sections, qa_scores, file_rows, file_scores):
+        self.key = key
+        self.qa_version = qa_version
+        self.rel_paths = list(rel_paths)
+        self.qa_files = qa_files          # int32 [qa rows, k]: index into rel_paths
+        self.qa_sections = qa_sections    # int32 [qa rows, k]: fragment index within that file's block
+        self.qa_scores = qa_scores        # float16 [qa rows, k]
+        self.file_rows = file_rows        # int32 [files, k]: Q&A row ids
+        self.file_scores = file_scores    # float16 [files, k]
+        self._file_ids = {p: i for i, p in enumerate(self.rel_paths)}
+
+    def satsangs_for(self, row_id: int) -> list[tuple[str, int, float]]:
+        """[(rel_path, section index, score)] related to a Q&A row, best first."""
+        if not 0 <= row_id < len(self.qa_files):
+            return []
+        return [(self.rel_paths[f], int(s), float(sc))
+                for f, s, sc in zip(self.qa_files[row_id], self.qa_sections[row_id], self.qa_scores[row_id])
+                if f >= 0]
+
+    def questions_for(self, rel_path: str) -> list[tuple[int, float]]:
+        """[(Q&A row id, score)] related to a satsang file, best first."""
+        f = self._file_ids.get(rel_path)
+        if f is None:
+            return []
+        return [(int(r), float(sc)) for r, sc in zip(self.file_rows[f], self.file_scores[f]) if r >= 0]
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, key=self.key, qa_version=self.qa_version, rel_paths=np.array(self.rel_paths, dtype=str),
+                 qa_files=self.qa_files, qa_sections=self.qa_sections, qa_scores=self.qa_scores,
+                 file_rows=self.file_rows, file_scores=self.file_scores)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, key: str) -> "CrossLinks | None":
+        try:
+            with np.load(path) as z:
+                if str(z["key"]) != key:
+                    return None
+                return cls(key, str(z["qa_version"]), z["rel_paths"].tolist(), z["qa_files"], z["qa_sections"],
+                           z["qa_scores"], z["file_rows"], z["file_scores"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def links_key(qa_version: str, archive: ArchiveIndex, k: int, min_score: float) -> str:
+    return hashlib.sha1(f"{qa_version}|{k}|{min_score}|{archive.key}".encode("utf-8")).hexdigest()[:20]
+
+def _normalized(block) -> np.ndarray:
+    block = np.asarray(block, dtype=np.float32)
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    return block / np.maximum(norms, 1e-12)
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of each row's k best scores, best first."""
+    k = min(k, scores.shape[1])
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+def build_cross_links(qa_version: str, qa_embeddings, archive: ArchiveIndex,
+                      k: int = K_LINKS, min_score: float = MIN_LINK_SCORE) -> CrossLinks | None:
+    """None when either side has no embeddings or they come from different models (dimensions differ)."""
+    if qa_embeddings is None or len(qa_embeddings) == 0 or archive.embeddings is None:
+        return None
+    if qa_embeddings.shape[1] != archive.embeddings.shape[1]:
+        return None
+
+    # Fragments are stored file by file: file f owns columns starts[f]:starts[f + 1]
+    blocks = [b for b in archive.blocks.values() if b.fragments]
+    if not blocks:
+        return None
+    rel_paths = [b.rel_path for b in blocks]
+    sizes = np.array([len(b.fragments) for b in blocks], dtype=np.int64)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    local = np.arange(int(sizes.sum())) - np.repeat(starts, sizes)
+    file_of = np.repeat(np.arange(len(blocks)), sizes)
+    frags = _normalized(archive.embeddings)
+
+    n, n_files = len(qa_embeddings), len(blocks)
+    qa_files = np.full((n, k), -1, dtype=np.int32)
+    qa_sections = np.full((n, k), -1, dtype=np.int32)
+    qa_scores = np.zeros((n, k), dtype=np.float16)
+    file_rows = np.full((n_files, k), -1, dtype=np.int32)
+    file_best = np.full((n_files, k), -np.inf, dtype=np.float32)
+
+    for lo in range(0, n, BLOCK_ROWS):
+        hi = min(n, lo + BLOCK_ROWS)
+        sim = _normalized(qa_embeddings[lo:hi]) @ frags.T                 # rows x fragments
+        per_file = np.maximum.reduceat(sim, starts, axis=1)               # rows x files (best section)
+        # First section reaching its file's best score
+        is_best = sim >= per_file[:, file_of]
+        best_section = np.minimum.reduceat(np.where(is_best, local, np.iinfo(np.int64).max), starts, axis=1)
+
+        # Q&A row -> satsang files
+        top = _top_k(per_file, k)
+        top_scores = np.take_along_axis(per_file, top, axis=1)
+        keep = top_scores >= min_score
+        width = top.shape[1]
+        qa_files[lo:hi, :width] = np.where(keep, top, -1)
+        qa_sections[lo:hi, :width] = np.where(keep, np.take_along_axis(best_section, top, axis=1), -1)
+        qa_scores[lo:hi, :width] = np.where(keep, top_scores, 0)
+
+        # Satsang file -> Q&A rows: merge this block's best rows into the running top-k
+        cand_rows = np.concatenate([file_rows, _top_k(per_file.T, k) + lo], axis=1)
+        block_scores = per_file.T[np.arange(n_files)[:, None], cand_rows[:, k:] - lo]
+        cand_scores = np.concatenate([file_best, block_scores], axis=1)
+        best = _top_k(cand_scores, k)
+        file_rows = np.take_along_axis(cand_rows, best, axis=1)
+        file_best = np.take_along_axis(cand_scores, best, axis=1)
+
+    keep = file_best >= min_score
+    return CrossLinks(links_key(qa_version, archive, k, min_score), qa_version, rel_paths,
+                      qa_files, qa_sections, qa_scores,
+                      np.where(keep, file_rows, -1).astype(np.int32), np.where(keep, file_best, 0).astype(np.float16))
+
+
+class CrossLinkCache:
+    """
+    Current CrossLinks per Q&A index version. get() never blocks: a missing
+    or outdated link set is loaded from cache_dir or built on a background
+    thread, and until then the previous set for that Q&A version (its row
+    ids are still valid) or None is returned.
+    """
+    def __init__(self, cache_dir: str | None, k: int = K_LINKS, min_score: float = MIN_LINK_SCORE):
+        self.cache_dir = cache_dir
+        self.k = k
+        self.min_score = min_score
+        self._links: OrderedDict[str, CrossLinks] = OrderedDict()
+        self._pending = set()
+        self._unusable = set()    # keys whose two sides cannot be linked (e.g. different models)
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cross-links")
+
+    def get(self, qa_version: str, qa_embeddings, archive: ArchiveIndex | None) -> CrossLinks | None:
+        if archive is None or archive.embeddings is None or qa_embeddings is None:
+            return None
+        key = links_key(qa_version, archive, self.k, self.min_score)
+        with self._lock:
+            links = self._links.get(qa_version)
+            if links is not None:
+                self._links.move_to_end(qa_version)
+                if links.key == key:
+                    return links
+            if key not in self._pending and key not in self._unusable:
+                self._pending.add(key)
+                self._pool.submit(self._build, key, qa_version, qa_embeddings, archive)
+        return links
+
+    def peek(self, qa_version: str) -> CrossLinks | None:
+        """Latest link set built for a Q&A version (as get() returns it); never starts a build."""
+        with self._lock:
+            return self._links.get(qa_version)
+
+    def _path(self, key: str) -> str | None:
+        return os.path.join(self.cache_dir, key + ".npz") if self.cache_dir else None
+
+    def _build(self, key: str, qa_version: str, qa_embeddings, archive: ArchiveIndex):
+        try:
+            path = self._path(key)
+            links = CrossLinks.load(path, key) if path and os.path.exists(path) else None
+            if links is None:
+                links = build_cross_links(qa_version, qa_embeddings, archive, self.k, self.min_score)
+                if links is None:
+                    with self._lock:
+                        self._unusable.add(key)
+                    return
+                if path:
+                    links.save(path)
+                    self._prune()
+                print(f"Cross links: {len(qa_embeddings)} Q&A rows x {len(links.rel_paths)} satsangs")
+            with self._lock:
+                self._links[qa_version] = links
+                self._links.move_to_end(qa_version)
+                while len(self._links) > MAX_LINK_SETS:
+                    self._links.popitem(last=False)
+        except Exception as e:
+            print(f"Cross links build failed: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _prune(self):
+        files = [os.path.join(self.cache_dir, f) for f in os.listdir(self.cache_dir) if f.endswith(".npz")]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for path in files[MAX_CACHED_FILES:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,132 @@
+"""
+Near-duplicate detection for the Q&A corpus (MinHash + LSH over embed_text).
+
+The sheet is built from WhatsApp threads, so the same question shows up many
+times with small wording differences. Rows are grouped when the Jaccard
+similarity of their character shingles is >= NEAR_DUP_THRESHOLD:
+
+1. identical texts are collapsed first (no hashing needed);
+2. MinHash signatures (NUM_PERM permutations) for the remaining texts;
+3. texts are visited in sheet order; LSH banding finds the existing group
+   leaders that may match, and a match is confirmed with the exact Jaccard of
+   the shingle sets (a group never rests on an estimate). No match -> the
+   text leads a new group.
+
+The canonical row of a group is its leader, i.e. its first row in sheet
+order, so appending rows never changes existing canonicals.
+"""
+import zlib
+
+import numpy as np
+import pandas as pd
+
+SHINGLE_SIZE = 4            # characters
+NUM_PERM = 64
+LSH_BANDS = 16              # 16 bands x 4 rows: pairs at Jaccard 0.8 collide with p > 0.999
+NEAR_DUP_THRESHOLD = 0.8
+SIGNATURE_SLACK = 0.1       # ~2 std of a 64-permutation estimate at J=0.8
+MAX_VERIFY = 8              # exact Jaccard checks per text (best estimates first)
+
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> set[str]:
+    text = " ".join(text.lower().split())
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+def minhash_signatures(shingle_sets: list[set[str]], num_perm: int = NUM_PERM, seed: int = 1) -> np.ndarray:
+    """
+    [n, num_perm] uint64 signatures; permutation k is the splitmix64 finalizer
+    of (shingle hash XOR seed_k). The hash is CRC-32, not the built-in hash()
+    (salted per process): the groups found from these signatures are stored
+    with the prepared corpus and artifacts, so they must come out the same
+    every run.
+    """
+    n = len(shingle_sets)
+    if n == 0:
+        return np.zeros((0, num_perm), dtype=np.uint64)
+    lengths = np.fromiter((len(s) for s in shingle_sets), dtype=np.int64, count=n)
+    hashes = np.fromiter((zlib.crc32(sh.encode("utf-8")) for s in shingle_sets for sh in s),
+                         dtype=np.uint64, count=int(lengths.sum()))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    seeds = np.random.default_rng(seed).integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+    sigs = np.empty((n, num_perm), dtype=np.uint64)
+    for k in range(num_perm):
+        sigs[:, k] = np.minimum.reduceat(_mix64(hashes ^ seeds[k]), starts)
+    return sigs
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """
+    splitmix64 finalizer (wrapping uint64 arithmetic). A linear (a*x + b) mod p
+    with a < 2^31 barely wraps over 32-bit inputs, so every "permutation" kept
+    nearly the same order and the estimates were far too noisy for the slack.
+    """
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MIX1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+def band_keys(sigs: np.ndarray, bands: int = LSH_BANDS) -> np.ndarray:
+    """[n, bands] uint64 bucket key per band (rows of the band folded into one hash)."""
+    n, num_perm = sigs.shape
+    rows = num_perm // bands
+    mult = np.random.default_rng(7).integers(1, 1 << 63, size=rows, dtype=np.uint64) | np.uint64(1)
+    with np.errstate(over="ignore"):
+        return (sigs.reshape(n, bands, rows) * mult).sum(axis=2, dtype=np.uint64)
+
+def jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+def near_duplicate_groups(texts, threshold: float = NEAR_DUP_THRESHOLD) -> np.ndarray:
+    """
+    Canonical row index for every text (a canonical row maps to itself).
+    Canonical = lowest index in the group.
+    """
+    texts = pd.Series(texts, dtype=object).fillna("").astype(str)
+    n = len(texts)
+    # 1. exact duplicates
+    codes, uniques = pd.factorize(texts.str.lower().str.split().str.join(" "))
+    first_row = np.full(len(uniques), n, dtype=np.int64)
+    np.minimum.at(first_row, codes, np.arange(n))
+
+    # 2.-3. near duplicates among the unique texts, in sheet order. Each text
+    # is compared only with the group leaders it shares an LSH bucket with,
+    # best signature estimate first (at most MAX_VERIFY exact checks); no
+    # match -> it leads a new group. Leaders
+    # only (no chaining): every member is within threshold of its canonical.
+    order = np.argsort(first_row, kind="stable")
+    shingle_sets = [shingles(t) for t in uniques]
+    sigs = minhash_signatures(shingle_sets)
+    keys = band_keys(sigs)
+    tables = [{} for _ in range(keys.shape[1])]
+    leader_of = np.arange(len(uniques))
+    min_estimate = threshold - SIGNATURE_SLACK
+
+    for u in order.tolist():
+        cands = set()
+        for band, key in enumerate(keys[u].tolist()):
+            cands.update(tables[band].get(key, ()))
+        if cands:
+            cands = list(cands)
+            est = (sigs[cands] == sigs[u]).mean(axis=1)
+            for k in np.argsort(-est, kind="stable")[:MAX_VERIFY]:
+                if est[k] < min_estimate:
+                    break
+                a, b = shingle_sets[cands[k]], shingle_sets[u]
+                # |A & B| / |A | B| <= min/max size: skip pairs that cannot reach the threshold
+                if min(len(a), len(b)) >= threshold * max(len(a), len(b)) and jaccard(a, b) >= threshold:
+                    leader_of[u] = cands[k]
+                    break
+        if leader_of[u] == u:
+            for band, key in enumerate(keys[u].tolist()):
+                tables[band].setdefault(key, []).append(u)
+
+    return first_row[leader_of][codes]
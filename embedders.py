@@ -0,0 +1,109 @@
+"""
+Embedding models for the corpus and queries, shared by the app and
+build_artifacts.py. `provider` is the app's provider label.
+"""
+import time
+
+import numpy as np
+
+# Gemini (same library style as your original code)
+import google.generativeai as genai
+
+GEMINI_PROVIDER = "Google Gemini"
+LOCAL_PROVIDER = "SentenceTransformer (local)"
+GEMINI_EMBED_MODEL = "models/text-embedding-004"
+LOCAL_EMBED_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+class GoogleEmbedder:
+    """
+    Gemini embeddings using google.generativeai.
+    Robust parsing + retries; returns stable numpy arrays.
+    """
+    def __init__(self, api_key: str, model_name: str = GEMINI_EMBED_MODEL):
+        self.api_key = api_key
+        self.model_name = model_name
+        genai.configure(api_key=api_key)
+
+    @staticmethod
+    def _extract_embedding(result):
+        if isinstance(result, dict):
+            if "embedding" in result:
+                return result["embedding"]
+            if "embeddings" in result:
+                return result["embeddings"]
+        if hasattr(result, "embedding"):
+            return getattr(result, "embedding")
+        if hasattr(result, "embeddings"):
+            return getattr(result, "embeddings")
+        return None
+
+    def _embed_one(self, text: str, task_type: str, max_retries: int = 3):
+        last_err = None
+        for attempt in range(max_retries):
+            try:
+                r = genai.embed_content(
+                    model=self.model_name,
+                    content=text,
+                    task_type=task_type
+                )
+                emb = self._extract_embedding(r)
+
+                if isinstance(emb, list) and emb and isinstance(emb[0], (float, int)):
+                    return [float(x) for x in emb]
+
+                if isinstance(emb, dict) and "values" in emb:
+                    return [float(x) for x in emb["values"]]
+
+                if isinstance(emb, list) and emb and isinstance(emb[0], (list, tuple)):
+                    return [float(x) for x in emb[0]]
+
+                return None
+            except Exception as e:
+                last_err = e
+                time.sleep(0.6 * (2 ** attempt))
+
+        print(f"Gemini embedding failed for a text: {last_err}")
+        return None
+
+    def encode(self, texts: list[str], task_type: str = "retrieval_document",
+               max_retries: int = 3) -> np.ndarray:
+        vectors: list[list[float] | None] = []
+        dim: int | None = None
+
+        for t in texts:
+            v = self._embed_one(t, task_type=task_type, max_retries=max_retries)
+            if v is not None and dim is None:
+                dim = len(v)
+            vectors.append(v)
+
+        if dim is None:
+            return np.array([])
+
+        fixed = []
+        for v in vectors:
+            if v is None or len(v) != dim:
+                fixed.append([0.0] * dim)
+            else:
+                fixed.append(v)
+
+        return np.array(fixed, dtype=np.float32)
+
+    def encode_query(self, text: str) -> np.ndarray:
+        vec = self.encode([text], task_type="retrieval_query")
+        return vec if vec.size else np.array([])
+
+
+def embed_model_name(provider: str) -> str:
+    return GEMINI_EMBED_MODEL if provider == GEMINI_PROVIDER else LOCAL_EMBED_MODEL
+
+def load_embedder(provider: str, api_key: str):
+    if provider == GEMINI_PROVIDER:
+        return GoogleEmbedder(api_key=api_key, model_name=GEMINI_EMBED_MODEL)
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(LOCAL_EMBED_MODEL)
+
+def encode_corpus(model, provider: str, texts: list[str]) -> np.ndarray:
+    """Document embeddings as a float32 matrix (empty array on total failure)."""
+    if provider == GEMINI_PROVIDER:
+        return model.encode(texts, task_type="retrieval_document")
+    return np.asarray(model.encode(texts, show_progress_bar=False), dtype=np.float32)
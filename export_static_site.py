@@ -0,0 +1,213 @@
+"""
+Export the satsang archive as a static site (no Python needed to serve it).
+
+Usage:
+    python export_static_site.py [--out site] [--satsang-dir satsang_content]
+                                 [--catalog-cache .cache/satsang_catalog.json]
+
+Layout:
+
+    site/
+      index.html                 month list + client-side search; /?satsang=<filename>
+                                 redirects to the page (same links the app shares)
+      months/<YYYY-MM>.html      one index page per archive month, newest first
+      satsang/<rel_path>         every satsang page, minified, with a link back to its month
+      search.json                prebuilt search index (see below)
+
+search.json is {"docs": [{f, u, t, g}], "terms": {term: [doc, ...]}}: every
+term of a page's sections (archive_index.extract_sections, cleaned with
+clean_for_search, so Hindi and English match the app's tokens) maps to the
+pages containing it. index.html fetches it on the first search.
+
+The catalog is the app's (metadata is only parsed for new or changed files).
+The site is written to a temp directory and swapped in, so a server reading
+--out never sees a half-written export. Point the app's share base_url at
+the static host to serve shared links from it.
+"""
+import argparse
+import html
+import json
+import os
+import shutil
+import time
+import urllib.parse
+
+from archive_index import extract_sections
+from satsang_catalog import refresh_catalog, archive_listing
+from satsang_payload import minify_html
+from text_processing import clean_for_search
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Terms shorter than this are not indexed (the client skips them too)
+MIN_TERM_CHARS = 2
+
+PAGE_STYLE = """<style>
+body { font-family: 'Poppins', sans-serif; background: #FFF5E1; color: #333; margin: 0; padding: 15px; }
+.container { max-width: 900px; margin: 0 auto; }
+h1 { color: #8B0000; } a { color: #8B0000; }
+.card { background: #fff; border-radius: 12px; padding: 12px 16px; margin: 10px 0; box-shadow: 0 2px 6px rgba(0,0,0,0.08); }
+.card a { font-weight: 600; text-decoration: none; }
+#search { width: 100%; padding: 10px 14px; font-size: 1rem; border-radius: 10px; border: 1px solid #ddd; box-sizing: border-box; }
+</style>"""
+
+BACK_LINK = ('<div style="max-width:900px;margin:0 auto 10px;font-family:sans-serif;">'
+             '<a href="{href}" style="color:#8B0000;text-decoration:none;">&larr; {label}</a></div>')
+
+SEARCH_SCRIPT = """<script>
+var PAGES = %(pages)s;
+(function() {
+    // Links shared from the app: /?satsang=<filename>
+    var target = new URLSearchParams(location.search).get("satsang");
+    if (target && PAGES[target]) location.replace(PAGES[target]);
+})();
+var searchIndex = null;
+function clean(s) {
+    // Same idea as clean_for_search: NFKC, lower case, letters / digits / Devanagari only
+    return s.normalize("NFKC").replace(/[\\u200c\\u200d]/g, "").toLowerCase()
+        .replace(/[^\\p{L}\\p{N}_\\s\\u0900-\\u097F]/gu, " ").split(/\\s+/).filter(function(t) { return t.length >= %(min_term)d; });
+}
+function search(q) {
+    var scores = {};
+    clean(q).forEach(function(tok) {
+        var docs = searchIndex.terms[tok];
+        if (!docs && tok.length >= 3) {
+            // Partial word: union of the terms it starts
+            docs = [];
+            for (var term in searchIndex.terms) if (term.indexOf(tok) === 0) docs = docs.concat(searchIndex.terms[term]);
+        }
+        (docs || []).forEach(function(d) { scores[d] = (scores[d] || 0) + 1; });
+    });
+    return Object.keys(scores).sort(function(a, b) { return scores[b] - scores[a] || a - b; }).slice(0, 20)
+        .map(function(d) { return searchIndex.docs[d]; });
+}
+function render(q) {
+    var out = document.getElementById("results"), months = document.getElementById("months");
+    if (!q.trim()) { out.innerHTML = ""; months.style.display = ""; return; }
+    months.style.display = "none";
+    var hits = search(q);
+    out.innerHTML = hits.length ? hits.map(function(d) {
+        var card = document.createElement("div"), a = document.createElement("a"), g = document.createElement("div");
+        card.className = "card"; a.href = d.u; a.textContent = d.t;
+        g.style.cssText = "font-size:0.85em;color:#888;"; g.textContent = d.g;
+        card.appendChild(a); card.appendChild(g);
+        return card.outerHTML;
+    }).join("") : "<p>%(no_results)s</p>";
+}
+document.getElementById("search").addEventListener("input", function(e) {
+    var q = e.target.value;
+    if (searchIndex) return render(q);
+    fetch("search.json").then(function(r) { return r.json(); }).then(function(idx) { searchIndex = idx; render(document.getElementById("search").value); });
+});
+</script>"""
+
+
+def month_slug(group: str, files: list[dict]) -> str:
+    """'2025-12' for a dated month group; 'uncategorized' otherwise."""
+    date_obj = files[0]["date_obj"] if files else None
+    return date_obj.strftime("%Y-%m") if date_obj else "uncategorized"
+
+def page_url(rel_path: str) -> str:
+    """Site-relative URL of a satsang page."""
+    return "satsang/" + urllib.parse.quote(rel_path.replace(os.sep, "/"))
+
+def _page(title: str, body: str, lang: str = "hi") -> str:
+    return (f'<!DOCTYPE html><html lang="{lang}"><head><meta charset="UTF-8">'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+            f"<title>{html.escape(title)}</title>{PAGE_STYLE}</head>"
+            f'<body><div class="container">{body}</div></body></html>')
+
+def _file_list(files: list[dict], prefix: str) -> str:
+    return "".join(
+        f'<div class="card"><a href="{prefix}{page_url(f["rel_path"])}">{html.escape(f["full_title"])}</a></div>'
+        for f in files
+    )
+
+def search_index(files: list[dict]) -> dict:
+    docs, terms = [], {}
+    for doc_id, f in enumerate(files):
+        docs.append({"f": f["filename"], "u": page_url(f["rel_path"]), "t": f["full_title"], "g": f["group"]})
+        try:
+            with open(f["path"], "r", encoding="utf-8", errors="replace") as fh:
+                sections = extract_sections(fh.read())
+        except OSError:
+            sections = []
+        text = " ".join([f["full_title"]] + [f"{s['heading']} {s['text']}" for s in sections])
+        for term in set(clean_for_search(text).split()):
+            if len(term) >= MIN_TERM_CHARS:
+                terms.setdefault(term, []).append(doc_id)
+    return {"docs": docs, "terms": terms}
+
+def export_site(content_dir: str, out_dir: str, catalog_cache: str) -> dict:
+    t = time.perf_counter()
+    catalog = refresh_catalog(content_dir, catalog_cache)
+    listing = archive_listing(content_dir, catalog)
+    groups, files_by_group = listing["groups"], listing["files_by_group"]
+
+    tmp_dir = f"{out_dir.rstrip(os.sep)}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(os.path.join(tmp_dir, "months"))
+
+    slugs = {g: month_slug(g, files_by_group[g]) for g in groups}
+    for group in groups:
+        files = files_by_group[group]
+        body = f'<p><a href="../index.html">&larr; Archive</a></p><h1>{html.escape(group)}</h1>{_file_list(files, "../")}'
+        with open(os.path.join(tmp_dir, "months", slugs[group] + ".html"), "w", encoding="utf-8") as f:
+            f.write(_page(group, body))
+
+        for file in files:
+            with open(file["path"], "r", encoding="utf-8", errors="replace") as f:
+                page = f.read()
+            depth = file["rel_path"].count(os.sep) + 1   # under satsang/
+            back = BACK_LINK.format(href="../" * depth + f"months/{slugs[group]}.html", label=html.escape(group))
+            if "<body" in page:
+                start = page.index(">", page.index("<body")) + 1
+                page = page[:start] + back + page[start:]
+            target = os.path.join(tmp_dir, "satsang", file["rel_path"])
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(minify_html(page))
+
+    # Newest first, as the app lists them; the first page of a filename wins (as listing["locate"])
+    ordered = [f for g in groups for f in files_by_group[g]]
+    pages = {}
+    for f in ordered:
+        pages.setdefault(f["filename"], page_url(f["rel_path"]))
+    with open(os.path.join(tmp_dir, "search.json"), "w", encoding="utf-8") as f:
+        json.dump(search_index(ordered), f, ensure_ascii=False, separators=(",", ":"))
+
+    months = "".join(
+        f'<div class="card"><a href="months/{slugs[g]}.html">{html.escape(g)}</a> '
+        f'<span style="color:#888;">({len(files_by_group[g])})</span></div>'
+        for g in groups
+    )
+    script = SEARCH_SCRIPT % {
+        "pages": json.dumps(pages, ensure_ascii=False).replace("</", "<\\/"),
+        "min_term": MIN_TERM_CHARS,
+        "no_results": "No satsang matched your search.",
+    }
+    body = ('<h1>🙏 Satsang Archive</h1><input id="search" type="search" placeholder="🔎 Search all satsangs...">'
+            f'<div id="results"></div><div id="months">{months}</div>{script}')
+    with open(os.path.join(tmp_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(_page("Satsang Archive", body))
+
+    # Swap in: the old export stays complete until the rename
+    old_dir = f"{out_dir.rstrip(os.sep)}.old-{os.getpid()}"
+    if os.path.exists(out_dir):
+        os.rename(out_dir, old_dir)
+    os.rename(tmp_dir, out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    stats = {"pages": len(ordered), "months": len(groups), "seconds": time.perf_counter() - t}
+    print(f"Exported {stats['pages']} satsangs in {stats['months']} months to {out_dir} ({stats['seconds']:.1f}s)")
+    return stats
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", default=os.path.join(SCRIPT_DIR, "site"))
+    ap.add_argument("--satsang-dir", default=os.path.join(SCRIPT_DIR, "satsang_content"))
+    ap.add_argument("--catalog-cache", default=os.path.join(SCRIPT_DIR, ".cache", "satsang_catalog.json"),
+                    help="The app's catalog cache (shared, so unchanged files are not re-parsed)")
+    args = ap.parse_args()
+    export_site(args.satsang_dir, args.out, args.catalog_cache)
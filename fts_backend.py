@@ -0,0 +1,135 @@
+"""
+SQLite FTS5 lexical backend (alternative to search_core.LexicalIndex).
+
+The cleaned corpus lives in an on-disk FTS5 table, so lexical search needs
+little memory and several app processes can share one file. The table uses
+the trigram tokenizer: a MATCH on a quoted string is a substring match, which
+keeps the exact `tok in lex_text` semantics of the in-memory index (tokens
+shorter than 3 characters fall back to LIKE on the same table).
+
+Ranking is deliberately the same as LexicalIndex (token-hit ratio + phrase
+boost), not bm25: the backend is a storage choice, so switching it (or
+loading an artifact build) must not reorder results. FTS5 only answers
+"which rows contain this substring".
+
+Columns: the four display fields (for highlight()) + lex (what is scored).
+"""
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+MARK_OPEN = '<mark style="background: #FFEB3B; padding: 1px 3px; border-radius: 3px;">'
+MARK_CLOSE = "</mark>"
+
+DISPLAY_COLUMNS = {
+    "Question": "question",
+    "Translated Question": "translated_question",
+    "Answer": "answer",
+    "Translated Answer": "translated_answer",
+}
+
+
+def fts_phrase(term: str) -> str:
+    """Quote a term as an FTS5 string (substring match under trigram)."""
+    return '"' + term.replace('"', '""') + '"'
+
+def like_pattern(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class FtsLexicalIndex:
+    """
+    Same scores() interface as LexicalIndex, backed by one SQLite file per
+    corpus version. The file is built once (temp file + atomic rename) and
+    then opened read-only, one connection per thread.
+    """
+    def __init__(self, db_dir: str, version: str, corpus):
+        self.version = version
+        self.db_path = os.path.join(db_dir, f"lexical_{version}.sqlite")
+        self._n = len(corpus)
+        self._local = threading.local()
+        if not os.path.exists(self.db_path):
+            os.makedirs(db_dir, exist_ok=True)
+            self._build(corpus)
+
+    def __len__(self):
+        return self._n
+
+    def _build(self, corpus):
+        tmp = f"{self.db_path}.{os.getpid()}.tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        con = sqlite3.connect(tmp)
+        try:
+            con.execute(
+                "CREATE VIRTUAL TABLE qa USING fts5("
+                "question, translated_question, answer, translated_answer, lex, "
+                "tokenize='trigram')"
+            )
+            cols = [corpus[c] if c in corpus.columns else None for c in DISPLAY_COLUMNS]
+            lex = corpus["lex_text"]
+
+            def rows():
+                for i in range(self._n):
+                    yield (i + 1,) + tuple("" if c is None else c.iat[i] for c in cols) + (lex.iat[i].lower(),)
+
+            # rowid = row id + 1 (FTS5 rowids start at 1)
+            con.executemany("INSERT INTO qa(rowid, question, translated_question, answer, translated_answer, lex) "
+                            "VALUES (?, ?, ?, ?, ?, ?)", rows())
+            con.execute("INSERT INTO qa(qa) VALUES('optimize')")
+            con.commit()
+        finally:
+            con.close()
+        os.replace(tmp, self.db_path)
+
+    @property
+    def con(self) -> sqlite3.Connection:
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.con = con
+        return con
+
+    def _rows_containing(self, term: str) -> np.ndarray:
+        """Row ids whose lex text contains term (substring)."""
+        if len(term) >= 3:
+            cur = self.con.execute("SELECT rowid FROM qa WHERE qa MATCH ?", (f"lex : {fts_phrase(term)}",))
+        else:
+            cur = self.con.execute("SELECT rowid FROM qa WHERE lex LIKE ? ESCAPE '\\'", (like_pattern(term),))
+        return np.fromiter((r[0] - 1 for r in cur), dtype=np.int64)
+
+    def scores(self, toks: list[str], base_tok_count: int, q_clean: str, phrase_boost: bool = True) -> np.ndarray:
+        """Token-hit ratio per row + short-query phrase boost, exactly as LexicalIndex.scores."""
+        n = self._n
+        if not toks or n == 0:
+            return np.zeros(n, dtype=np.float64)
+
+        hits = np.zeros(n, dtype=np.float64)
+        for tok in toks:
+            np.add.at(hits, self._rows_containing(tok), 1.0)
+        score = hits / len(toks)
+
+        # Phrase boost for short queries
+        if phrase_boost and base_tok_count <= 2 and q_clean:
+            ids = self._rows_containing(q_clean)
+            score[ids] = np.minimum(1.0, score[ids] + 0.5)
+        return score
+
+    def highlight(self, row_id: int, terms: list[str]) -> dict[str, str] | None:
+        """
+        Display fields of one row with query terms wrapped in <mark> via FTS5
+        highlight(). Keys are the sheet column names. None if nothing matches.
+        """
+        terms = [t for t in terms if len(t) >= 3]
+        if not terms:
+            return None
+        expr = "{question translated_question answer translated_answer} : (" + " OR ".join(fts_phrase(t) for t in terms) + ")"
+        sel = ", ".join(f"highlight(qa, {k}, ?, ?)" for k in range(len(DISPLAY_COLUMNS)))
+        params = [MARK_OPEN, MARK_CLOSE] * len(DISPLAY_COLUMNS)
+        row = self.con.execute(f"SELECT {sel} FROM qa WHERE qa MATCH ? AND rowid = ?",
+                               (*params, expr, row_id + 1)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(DISPLAY_COLUMNS, row))
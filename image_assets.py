@@ -0,0 +1,134 @@
+"""
+Page images (static/*.jpg) as cached, resized assets instead of base64 read
+and inlined on every rerun.
+
+Per source image and display height, variants are made once per file
+version (path + mtime + size): WebP at 1x and 2x the display height and a
+2x JPEG fallback, written to static/_variants/ with the version in the file
+name. With Streamlit static file serving on (.streamlit/config.toml,
+server.enableStaticServing) the page only carries app/static/... URLs: the
+image bytes are fetched once, and the versioned names mean a changed image
+gets a new URL instead of a stale cached copy. Without static serving the 2x
+WebP is inlined as a data URI, encoded once per version and kept in memory.
+
+Pillow (installed with Streamlit) does the resizing; without it the original
+file is used as is.
+"""
+import base64
+import hashlib
+import os
+import threading
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+VARIANT_DIR = "_variants"
+SCALES = (1, 2)           # WebP densities; 2x covers most phones
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+MIME_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png", ".webp": "image/webp", ".gif": "image/gif"}
+
+
+def _version(path: str) -> tuple[tuple[int, int], str]:
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    return signature, hashlib.sha1(f"{signature[0]}:{signature[1]}".encode()).hexdigest()[:10]
+
+def _resized(img, height: int):
+    if img.height <= height:
+        return img
+    return img.resize((max(1, round(img.width * height / img.height)), height), Image.LANCZOS)
+
+def _write(path: str, save):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        save(f)
+    os.replace(tmp, path)
+
+def make_variants(path: str, variant_dir: str, height: int, version: str) -> dict[str, str] | None:
+    """
+    {"webp1x": file, "webp2x": file, "jpg": file} (names under variant_dir) for
+    the image at `path` shown `height` px tall; None without Pillow or for an
+    unreadable image. Existing files for this version are reused.
+    """
+    if Image is None:
+        return None
+    stem = os.path.splitext(os.path.basename(path))[0]
+    names = {f"webp{s}x": f"{stem}-{height * s}h-{version}.webp" for s in SCALES}
+    names["jpg"] = f"{stem}-{height * SCALES[-1]}h-{version}.jpg"
+    if all(os.path.exists(os.path.join(variant_dir, n)) for n in names.values()):
+        return names
+    try:
+        with Image.open(path) as img:
+            img.load()
+            os.makedirs(variant_dir, exist_ok=True)
+            rgb = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+            for s in SCALES:
+                out = _resized(rgb, height * s)
+                _write(os.path.join(variant_dir, names[f"webp{s}x"]),
+                       lambda f: out.save(f, "WEBP", quality=WEBP_QUALITY, method=6))
+            out = _resized(rgb.convert("RGB"), height * SCALES[-1])
+            _write(os.path.join(variant_dir, names["jpg"]),
+                   lambda f: out.save(f, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True))
+    except (OSError, ValueError) as e:
+        print(f"Image variants failed for {path}: {e}")
+        return None
+    # Older versions of this image at this height are no longer referenced
+    prefixes = tuple(f"{stem}-{height * s}h-" for s in SCALES)
+    for old in os.listdir(variant_dir):
+        if old.startswith(prefixes) and f"-{version}." not in old:
+            try:
+                os.remove(os.path.join(variant_dir, old))
+            except OSError:
+                pass
+    return names
+
+
+class ImageAssets:
+    def __init__(self, static_dir: str, static_url: str | None):
+        """static_url: URL prefix static_dir is served at (e.g. "app/static"); None inlines data URIs."""
+        self.static_dir = static_dir
+        self.static_url = static_url
+        self.variant_dir = os.path.join(static_dir, VARIANT_DIR)
+        self._html: dict[tuple, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def img(self, name: str, height: int, style: str = "") -> str:
+        """<img> / <picture> HTML for static_dir/name shown `height` px tall; "" if the file is missing."""
+        path = os.path.join(self.static_dir, name)
+        try:
+            signature, version = _version(path)
+        except OSError:
+            return ""
+        key = (name, height, style)
+        with self._lock:
+            cached = self._html.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        html = self._build(path, name, height, style, version)
+        with self._lock:
+            self._html[key] = (signature, html)
+        return html
+
+    def _build(self, path: str, name: str, height: int, style: str, version: str) -> str:
+        variants = make_variants(path, self.variant_dir, height, version)
+        img_style = f"height: {height}px; {style}".strip()
+        if self.static_url is not None:
+            if variants is None:
+                return f'<img src="{self.static_url}/{name}?v={version}" style="{img_style}">'
+            url = lambda n: f"{self.static_url}/{VARIANT_DIR}/{n}"
+            srcset = ", ".join(f"{url(variants[f'webp{s}x'])} {s}x" for s in SCALES)
+            return (f'<picture><source type="image/webp" srcset="{srcset}">'
+                    f'<img src="{url(variants["jpg"])}" style="{img_style}"></picture>')
+        # Inline: one small WebP (or the original without Pillow)
+        if variants is not None:
+            src_path, mime = os.path.join(self.variant_dir, variants[f"webp{SCALES[-1]}x"]), "image/webp"
+        else:
+            src_path = path
+            mime = MIME_TYPES.get(os.path.splitext(name)[1].lower(), "image/jpeg")
+        with open(src_path, "rb") as f:
+            data = base64.b64encode(f.read()).decode()
+        return f'<img src="data:{mime};base64,{data}" style="{img_style}">'
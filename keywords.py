@@ -0,0 +1,140 @@
+"""
+Keyword-chip ("slicer") extraction, shared by the app and build_artifacts.py:
+stopword lists + frequency-ranked English / Hindi keywords from the corpus.
+"""
+import re
+
+import pandas as pd
+
+from text_processing import clean_for_search
+
+# English stopwords (prevents false lexical matches for English queries)
+EN_STOPWORDS = {
+    "a","an","and","are","as","at","be","but","by","for","from","has","have","he","her",
+    "his","i","if","in","into","is","it","its","me","my","not","of","on","or","our",
+    "she","so","that","the","their","them","then","there","these","they","this","to",
+    "was","we","were","what","when","where","which","who","will","with","you","your",
+    "am","able","can","cant","cannot","could","couldnt","do","does","doesnt","did","didnt",
+    "been","being","im","ive","id","ill","wont","dont","isnt","arent","wasnt","werent"
+}
+
+# ============================================================
+# SLICER STOPWORDS (strong filtering for UI only)
+# ============================================================
+SLICER_STOPWORDS = {
+    # generic English glue
+    "should", "how", "why", "when", "where", "which", "who",
+    "during", "since", "only", "also", "down", "up", "into",
+    "from", "about", "after", "before", "over", "under", "within",
+
+    # devotional / names (not search intents)
+    "radheshyam", "radhe", "shyam", "shri",
+    "baba", "babaji", "gurudev", "guru", "ji",
+    "lord", "prabhu", "dev",
+    "babashri", "maharaj",
+
+    # politeness / structure
+    "please", "kindly", "guide", "guidance",
+    "salutations", "bow", "feet", "ground",
+    "question",
+
+    # weak verbs / fillers
+    "do", "does", "did", "done", "make", "made",
+    "use", "using", "used", "get", "got",
+    "day", "month", "year", "time",
+    "want", "show", "everything", "full"
+}
+
+# Common Hindi stopwords to ignore in slicers
+HI_STOPWORDS = {
+    "के", "का", "एक", "में", "की", "है", "यह", "और", "से", "हैं", "को", "पर", "इस", "होता", "कि", "जो",
+    "कर", "मे", "गया", "करने", "किया", "लिये", "अपने", "ने", "बनी", "नहीं", "तो", "ही", "या", "एवं", "दिया",
+    "हो", "इसका", "था", "द्वारा", "हुआ", "तक", "साथ", "करना", "वाले", "बाद", "लिए", "आप", "कुछ", "सकते",
+    "किसी", "ये", "इसके", "सबसे", "इसमें", "थे", "दो", "मगर", "वह", "भी", "सकता", "हर", "जाने", "अपना",
+    "वे", "जिसे", "गई", "ऐसे", "जिसके", "लिए", "जाता", "बहुत", "कहा", "वर्ग", "कई", "करें", "होती", "वाले",
+    "कम", "से", "थी", "हुई", "जा", "न", "जिस", "किस", "तथा", "हूँ", "मै", "मैं", "मेरा", "मेरी", "मेरे",
+    "मुझे", "हम", "हमारा", "हमारे", "हमें", "तुम", "तुम्हारा", "तुम्हारे", "तुम्हें", "आपका", "आपकी", "आपके",
+    "क्या", "क्यों", "कैसे", "कब", "कहाँ", "कौन", "जी", "साहब", "सर", "श्री", "श्रीमती", "कुमार", "कुमारी",
+    "सवाल", "प्रश्न", "उत्तर", "जवाब", "चाहिए", "चाहता", "चाहती", "चाहते", "रहा", "रही", "रहे",
+    "बारे", "पास", "दूर", "सब", "सभी", "सारा", "पूरी", "पूरा",
+    # Specific removals requested
+    "जैसे", "बाबा", "राधे", "श्याम", "राधेश्याम", "कोई", "कृपया",
+    "मिल", "करते", "कल", "बताया", "लेना", "समय", "उसमें", "जय", "भगवान", "देव",
+    "गुरु",
+    # Additional removals
+    "कृपा", "मार्गदर्शन", "jae", "जाए", "जाएं", "वो", "करे", "करें", "कभी", "अगर",
+    "उसके", "उसकी", "उसे", "उनका", "उनकी", "उनके", "उन्हें",
+    "यहाँ", "वहाँ", "जहां", "अब", "जब", "तब"
+}
+
+def pick_english_source_column(df: pd.DataFrame) -> str | None:
+    # Preferred: English Text
+    for col in ["English Text", "English", "Translated Question", "Translated Answer"]:
+        if col in df.columns:
+            return col
+    return None
+
+def extract_top_keywords(df: pd.DataFrame, col: str, top_n: int = 30) -> list[str]:
+    """
+    Extract intent-worthy English keywords for slicers.
+    Rules:
+    - English alphabetic words only
+    - length >= 4
+    - remove EN_STOPWORDS + SLICER_STOPWORDS
+    - frequency-based ranking
+    """
+    freq = {}
+    series = df[col].fillna("").astype(str)
+
+    for text in series:
+        text = clean_for_search(text).lower()
+
+        # Only alphabetic English words, min length 4
+        tokens = re.findall(r"[a-z]{4,}", text)
+
+        for t in tokens:
+            if t in EN_STOPWORDS:
+                continue
+            if t in SLICER_STOPWORDS:
+                continue
+            freq[t] = freq.get(t, 0) + 1
+
+    ranked = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
+    return [k for k, _ in ranked[:top_n]]
+
+def extract_hindi_keywords(df: pd.DataFrame, top_n: int = 30) -> list[str]:
+    """
+    Extract useful Hindi keywords for slicers.
+    Rules:
+    - Tokenize using whitespace
+    - Remove HI_STOPWORDS
+    - Min length 2
+    - Frequency ranking
+    """
+    freq = {}
+    # Use "Question" column for source
+    series = df["Question"].fillna("").astype(str)
+
+    for text in series:
+        # Simple split by whitespace
+        # (For better Devanagari tokenization, we can use clean_for_search first)
+        text = clean_for_search(text)
+        tokens = text.split()
+
+        for t in tokens:
+            # Check if likely Devanagari
+            if not any("\u0900" <= ch <= "\u097F" for ch in t):
+                continue
+            
+            # Stopword filter
+            if t in HI_STOPWORDS:
+                continue
+            
+            # Length filter
+            if len(t) < 2:
+                continue
+                
+            freq[t] = freq.get(t, 0) + 1
+
+    ranked = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
+    return [k for k, _ in ranked[:top_n]]
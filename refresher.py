@@ -0,0 +1,88 @@
+"""
+Background refresh with single-flight builds and atomic swap.
+
+A BackgroundRefresher owns one value (for the app: corpus + indexes for one
+corpus version). Requests read the current value without waiting; once it is
+older than `interval_s` a rebuild starts in a daemon thread. Any number of
+concurrent triggers share that one build (single-flight), and the finished
+value replaces the old one with a single reference assignment, so readers
+see either the old state or the new one, never a mix.
+
+Only the very first request (nothing built yet) waits, and concurrent first
+requests all wait on the same build.
+"""
+import threading
+import time
+from concurrent.futures import Future
+
+
+class BackgroundRefresher:
+    def __init__(self, build, interval_s: float = 600, retry_s: float = 60, name: str = "refresher"):
+        """
+        build(previous) -> new value. `previous` is the value being served (or
+        None); returning it unchanged is a cheap "nothing changed". Raising
+        keeps serving the previous value and retries after retry_s.
+        """
+        self._build = build
+        self.interval_s = interval_s
+        self.retry_s = retry_s
+        self.name = name
+        self._value = None
+        self._built_at = 0.0
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+        self._inflight: Future | None = None
+        self.last_error: Exception | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once a value has been built (get() will not block)."""
+        return self._value is not None
+
+    @property
+    def refreshing(self) -> bool:
+        return self._inflight is not None
+
+    def _run(self, fut: Future):
+        try:
+            value = self._build(self._value)
+            self._value = value            # atomic swap
+            self._built_at = time.time()
+            self.last_error = None
+            fut.set_result(value)
+        except Exception as e:
+            self.last_error = e
+            self._failed_at = time.time()
+            if self._value is not None:
+                print(f"{self.name}: refresh failed, still serving the previous value: {e}")
+            fut.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight = None
+
+    def trigger(self) -> Future:
+        """Start a rebuild unless one is already running; returns the in-flight build."""
+        with self._lock:
+            if self._inflight is None:
+                self._inflight = Future()
+                threading.Thread(target=self._run, args=(self._inflight,), daemon=True, name=self.name).start()
+            return self._inflight
+
+    def is_stale(self) -> bool:
+        now = time.time()
+        if self.last_error is not None and now - self._failed_at < self.retry_s:
+            return False
+        return now - self._built_at >= self.interval_s
+
+    def peek(self):
+        """Current value (None before the first build); never starts a build."""
+        return self._value
+
+    def get(self):
+        """Current value; never waits once something has been built."""
+        if not self.ready:
+            # Cold start: nothing to serve yet, wait for the (shared) first build
+            return self.trigger().result()
+        if self.is_stale():
+            self.trigger()
+        return self._value
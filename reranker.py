@@ -0,0 +1,99 @@
+"""
+Optional second-stage reranking with a small multilingual cross-encoder (CPU).
+
+The first stage (search_core.rank_candidates) produces a fused ranking; this
+re-scores the head of that list pair-by-pair, in batches, until a time budget
+is spent. Rows that were not reached keep their fused order below the
+reranked ones, so a slow CPU degrades to a partial rerank, never to a stall.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_RERANK_MODEL = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"
+
+
+class CrossEncoderReranker:
+    """
+    Lazily loaded sentence-transformers CrossEncoder bound to one corpus
+    (row id -> text), with an LRU score cache keyed by (query, row id).
+    Build one per index version so row ids stay valid. Shared by every
+    session thread: the cache and the model load are guarded by a lock.
+    """
+    def __init__(self, texts, model_name: str = DEFAULT_RERANK_MODEL, batch_size: int = 16,
+                 max_length: int = 256, cache_size: int = 20000):
+        self.texts = texts
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self._model = None
+        self._cache: OrderedDict[tuple[str, int], float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:  # loaded once, even with concurrent first queries
+                    from sentence_transformers import CrossEncoder
+                    self._model = CrossEncoder(self.model_name, max_length=self.max_length, device="cpu")
+        return self._model
+
+    def _cache_get(self, key):
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key, value: float):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def score(self, query: str, row_ids: list[int],
+              time_budget_s: float | None = None) -> dict[int, float]:
+        """
+        Cross-encoder score per row id, walking row_ids in order.
+        Stops starting new batches once time_budget_s has elapsed (None = no limit).
+        Returns only the rows that were scored (cached or fresh).
+        """
+        t0 = time.perf_counter()
+        scored: dict[int, float] = {}
+        pending: list[int] = []
+
+        for rid in row_ids:
+            cached = self._cache_get((query, rid))
+            if cached is not None:
+                scored[rid] = cached
+            else:
+                pending.append(rid)
+
+        for b in range(0, len(pending), self.batch_size):
+            if time_budget_s is not None and (time.perf_counter() - t0) >= time_budget_s:
+                break
+            batch = pending[b:b + self.batch_size]
+            pairs = [(query, self.texts[rid]) for rid in batch]
+            out = self.model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False)
+            for rid, s in zip(batch, out):
+                s = float(s)
+                scored[rid] = s
+                self._cache_put((query, rid), s)
+
+        return scored
+
+    def rerank(self, query: str, row_ids: list[int],
+               time_budget_s: float | None = None) -> tuple[list[int], dict[int, float]]:
+        """
+        Reorder row_ids (given in fused order) by cross-encoder score.
+        Unscored rows (budget ran out) keep their fused order after the scored ones.
+        Returns (new_order, scores).
+        """
+        scores = self.score(query, row_ids, time_budget_s=time_budget_s)
+        head = sorted((rid for rid in row_ids if rid in scores), key=lambda r: -scores[r])
+        tail = [rid for rid in row_ids if rid not in scores]
+        return head + tail, scores
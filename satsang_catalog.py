@@ -0,0 +1,369 @@
+"""
+Satsang archive catalog: per-file metadata (date, title) for the HTML files
+under satsang_content/, shared by the app and build_artifacts.py. Metadata
+comes from a bounded prefix of each file (read_satsang_metadata); the share
+helpers below need the whole page and run with its payload (satsang_payload).
+
+A catalog is {rel_path: entry} with JSON-safe entries; each entry records the
+file's mtime/size so it can be reused for as long as the file is unchanged.
+The app keeps one on disk (refresh_catalog), so a restart re-parses only new
+or changed files.
+"""
+import datetime
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Bytes read per file by read_satsang_metadata(). og:title sits in <head>; in
+# the older template the विषय line / <h1> come right after the inline CSS (~7 KB)
+HEAD_BYTES = 16 * 1024
+# Files parsed concurrently by scan_catalog() (the work is mostly file I/O)
+SCAN_WORKERS = 8
+
+# patterns: 11-DEC-2025, 11-Dec-2025, 11/12/2025, 11-12-2025
+DATE_TEXT_RE = re.compile(r"(\d{1,2})-(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)-(\d{4})", re.IGNORECASE)
+DATE_NUM_RE = re.compile(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})")
+VISHAY_RE = re.compile(r"विषय\s*[:|-]\s*(.*?)<")
+VISHAY_LINE_RE = re.compile(r"विषय\s*[:|-]\s*(.*)")
+H1_RE = re.compile(r"<h1[^>]*>(.*?)</h1>", re.DOTALL | re.IGNORECASE)
+OG_TITLE_RE = re.compile(r"""og:title["']\s+content=["']([^"']*)["']""", re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
+SHARE_HEADER_RE = re.compile(r"<h[23][^>]*>(.*?)</h[23]>")
+SHARE_QUESTION_RE = re.compile(r"<p[^>]*>(.*?\?)</p>")
+
+# Placeholder for the deep link in an entry's share_text (the app knows its own URL)
+SHARE_LINK = "{share_link}"
+SHARE_HIGHLIGHTS = 5
+
+def parse_satsang_date(content: str):
+    """(date_obj | None, date_str) from the first DD-MMM-YYYY date, else the first DD-MM-YYYY one."""
+    date_obj = None
+    date_str = ""
+
+    # Regex for DD-MMM-YYYY (e.g., 11-DEC-2025)
+    match_date_text = DATE_TEXT_RE.search(content)
+    if match_date_text:
+        d, m, y = match_date_text.groups()
+        date_str = f"{d}-{m.upper()}-{y}"
+        try:
+            date_obj = datetime.datetime.strptime(date_str, "%d-%b-%Y").date()
+        except ValueError:
+            pass
+
+    # Fallback date regex: DD-MM-YYYY
+    if not date_obj:
+        match_date_num = DATE_NUM_RE.search(content)
+        if match_date_num:
+            d, m, y = match_date_num.groups()
+            date_str = f"{d}-{m}-{y}"
+            try:
+                date_obj = datetime.datetime.strptime(date_str, "%d-%m-%Y").date()
+            except ValueError:
+                pass
+    return date_obj, date_str
+
+def parse_satsang_title(content: str) -> str | None:
+    """'विषय :' line, else the first <h1>; None if neither is present."""
+    # Priority 1: Line containing "विषय :" (Vishay :); try without < at end if just raw text
+    match_vishay = VISHAY_RE.search(content) or VISHAY_LINE_RE.search(content)
+    if match_vishay:
+        # remove HTML tags if any slipped in
+        return TAG_RE.sub("", match_vishay.group(1).strip()).strip()
+    # Priority 2: content of first <h1>
+    match_h1 = H1_RE.search(content)
+    if match_h1:
+        return TAG_RE.sub("", match_h1.group(1)).strip()
+    return None
+
+def satsang_metadata(date_obj, date_str: str, title: str) -> dict:
+    # Final formatting: "Title | DD, MMM, YYYY"
+    display_date = date_obj.strftime("%d, %b, %Y") if date_obj else date_str
+    full_title = f"{title} | {display_date}" if display_date else title
+    return {
+        "date_obj": date_obj,
+        "date_str": display_date,
+        "title": title,
+        "full_title": full_title
+    }
+
+def content_metadata(content: str) -> dict:
+    date_obj, date_str = parse_satsang_date(content)
+    return satsang_metadata(date_obj, date_str, parse_satsang_title(content) or "Daily Satsang")
+
+def extract_satsang_metadata(file_path):
+    """
+    Parses HTML file to find:
+    1. Date (DD-MMM-YYYY or DD-MM-YYYY)
+    2. Strings like 'विषय :' or the main <h1> title to use as 'Vishay'
+    Returns dict: { 'date_obj': date|None, 'date_str': str, 'title': str, 'full_title': str }
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return content_metadata(f.read())
+    except Exception as e:
+        print(f"Metadata parsing error for {file_path}: {e}")
+        return {"date_obj": None, "date_str": "", "title": "Satsang", "full_title": "Satsang"}
+
+def read_satsang_metadata(file_path: str, head_bytes: int = HEAD_BYTES) -> dict:
+    """
+    extract_satsang_metadata() from the first head_bytes of the file (see
+    head_metadata). Reads the whole file only when the prefix has no date or
+    no title.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(head_bytes)
+            complete = not f.read(1)
+    except OSError:
+        return extract_satsang_metadata(file_path)
+    # the cut may split a character
+    return head_metadata(head.decode("utf-8", errors="ignore"), complete) or extract_satsang_metadata(file_path)
+
+def head_metadata(content: str, complete: bool) -> dict | None:
+    """
+    Metadata from a file prefix: og:title ("Title | date") if present, else
+    the date / विषय / <h1> rules on the prefix (a date in <head> wins). None
+    when the prefix has no date or no title and is not the whole file.
+    """
+    match_og = OG_TITLE_RE.search(content)
+    if match_og:
+        title, sep, date_part = match_og.group(1).rpartition(" | ")
+        if sep and title.strip():
+            date_obj, date_str = parse_satsang_date(date_part)
+            if date_obj:
+                return satsang_metadata(date_obj, date_str, title.strip())
+
+    # Date: <title>/<head> first (a DD-MMM-YYYY scan of the whole prefix is the slow part)
+    head_end = content.find("</head>")
+    date_obj, date_str = parse_satsang_date(content[:head_end]) if head_end > 0 else (None, "")
+    if not date_str:
+        date_obj, date_str = parse_satsang_date(content)
+    title = parse_satsang_title(content)
+    if complete or (date_str and title is not None):
+        return satsang_metadata(date_obj, date_str, title if title is not None else "Daily Satsang")
+    return None
+
+def share_highlights(content: str, limit: int = SHARE_HIGHLIGHTS) -> list[str]:
+    """Headers (<h2>/<h3>) then questions (<p>...?</p>) of a page, tags stripped, for sharing."""
+    cleaned = []
+    seen = set()
+    # Prioritize headers then questions
+    for item in SHARE_HEADER_RE.findall(content) + SHARE_QUESTION_RE.findall(content):
+        text = TAG_RE.sub("", item).strip()
+        if text and len(text) > 5 and text not in seen:
+            cleaned.append(text)
+            seen.add(text)
+            if len(cleaned) == limit:
+                break
+    return cleaned
+
+def share_text(full_title: str, date_str: str, highlights: list[str]) -> str:
+    """WhatsApp share message; SHARE_LINK marks where the deep link goes."""
+    highlights_text = "\n".join([f"✨ {h}" for h in highlights])
+    return f"""🙏 *{full_title}*
+
+📅 {date_str}
+📍 प्रियाकुंज आश्रम, बरसाना
+
+🔍 *मुख्य अंश / Highlights:*
+{highlights_text}
+
+🔗 *पूरा सत्संग पढ़ें / Read Full:*
+{SHARE_LINK}
+
+🕉️ जय श्री राधे""".strip()
+
+
+def file_signature(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+# Every entry has these; older entries missing any are re-parsed
+ENTRY_KEYS = frozenset((
+    "filename", "rel_path", "mtime_ns", "size", "date", "date_str", "title", "full_title", "group", "sort_key",
+))
+
+def archive_group(date_obj) -> str:
+    """Archive section of a file: 'Month YYYY', or 'Uncategorized' without a parsed date."""
+    return date_obj.strftime("%B %Y") if date_obj else "Uncategorized"
+
+def catalog_entry(content_dir: str, rel_path: str) -> dict:
+    full_path = os.path.join(content_dir, rel_path)
+    mtime_ns, size = file_signature(full_path)
+    meta = read_satsang_metadata(full_path)
+    filename = os.path.basename(rel_path)
+    # Sort key: Date object > Date string > Filename
+    sort_key = meta["date_obj"].isoformat() if meta["date_obj"] else (meta["date_str"] or filename)
+    return {
+        "filename": filename,
+        "rel_path": rel_path,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "date": meta["date_obj"].isoformat() if meta["date_obj"] else None,
+        "date_str": meta["date_str"],
+        "title": meta["title"],
+        "full_title": meta["full_title"],
+        "group": archive_group(meta["date_obj"]),
+        "sort_key": sort_key,
+    }
+
+def entry_metadata(entry: dict) -> dict:
+    """Catalog entry -> the dict extract_satsang_metadata() returns."""
+    return {
+        "date_obj": datetime.date.fromisoformat(entry["date"]) if entry.get("date") else None,
+        "date_str": entry["date_str"],
+        "title": entry["title"],
+        "full_title": entry["full_title"],
+    }
+
+def _try_entry(content_dir: str, rel_path: str) -> dict | None:
+    try:
+        return catalog_entry(content_dir, rel_path)
+    except OSError:
+        return None  # vanished between walk and stat
+
+def scan_catalog(content_dir: str, previous: dict | None = None) -> dict:
+    """
+    Catalog of every .html under content_dir. Entries from `previous` whose
+    mtime/size still match are reused; only new or changed files are parsed,
+    SCAN_WORKERS at a time.
+    """
+    previous = previous or {}
+    catalog = {}
+    todo = []
+    for root, _dirs, files in os.walk(content_dir):
+        for file in files:
+            if not file.endswith(".html"):
+                continue
+            rel_path = os.path.relpath(os.path.join(root, file), content_dir)
+            catalog[rel_path] = None
+            old = previous.get(rel_path)
+            if old is not None and ENTRY_KEYS <= old.keys():
+                try:
+                    if (old["mtime_ns"], old["size"]) == file_signature(os.path.join(content_dir, rel_path)):
+                        catalog[rel_path] = old
+                        continue
+                except OSError:
+                    del catalog[rel_path]
+                    continue
+            todo.append(rel_path)
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(todo)), thread_name_prefix="catalog-scan") as pool:
+            for rel_path, entry in zip(todo, pool.map(lambda r: _try_entry(content_dir, r), todo)):
+                catalog[rel_path] = entry
+    return {rel_path: entry for rel_path, entry in catalog.items() if entry is not None}
+
+def save_catalog(path: str, catalog: dict):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+def load_catalog(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def refresh_catalog(content_dir: str, cache_path: str, previous: dict | None = None,
+                    seed: dict | None = None) -> dict:
+    """
+    Rescan content_dir against `previous` (on the first call: the catalog
+    saved at cache_path, over `seed`, e.g. a prebuilt artifact catalog) and
+    save it back if anything changed. Returns `previous` itself when nothing did.
+    """
+    base = previous if previous is not None else {**(seed or {}), **load_catalog(cache_path)}
+    catalog = scan_catalog(content_dir, base)
+    if catalog == base:
+        return previous if previous is not None else base
+    save_catalog(cache_path, catalog)
+    return catalog
+
+def archive_file(content_dir: str, entry: dict) -> dict:
+    """One archive-page file: {path, rel_path, filename, title, full_title, date_obj, date_str, group, sort_key}."""
+    meta = entry_metadata(entry)
+    return {
+        "path": os.path.join(content_dir, entry["rel_path"]),
+        "rel_path": entry["rel_path"],
+        "filename": entry["filename"],
+        "title": meta["title"],
+        "full_title": meta["full_title"],
+        "date_obj": meta["date_obj"],
+        "date_str": meta["date_str"],
+        "group": entry["group"],
+        "sort_key": entry["sort_key"],
+    }
+
+def _group_order(files_by_group: dict) -> list[str]:
+    # Newest group first (its files are sorted, so the first one is its newest)
+    return sorted(files_by_group, key=lambda g: files_by_group[g][0]["sort_key"], reverse=True)
+
+def archive_listing(content_dir: str, catalog: dict) -> dict:
+    """
+    What the archive page shows, newest first: {'groups': [...],
+    'files_by_group': {group: [file, ...]}, 'locate': {filename: group}}.
+    Files are archive_file() dicts.
+    """
+    files = [archive_file(content_dir, entry) for entry in catalog.values()]
+    files.sort(key=lambda x: x["sort_key"], reverse=True)
+
+    files_by_group = {}
+    for f in files:
+        files_by_group.setdefault(f["group"], []).append(f)
+    locate = {}
+    for f in files:
+        locate.setdefault(f["filename"], f["group"])
+    return {"groups": _group_order(files_by_group), "files_by_group": files_by_group, "locate": locate}
+
+def update_listing(listing: dict, content_dir: str, removed: list[dict], added: list[dict]) -> dict:
+    """
+    New listing with catalog entries `removed` taken out and `added` put in.
+    Only the groups touched are copied; `listing` itself is left as is, so
+    readers holding it keep a consistent view.
+    """
+    files_by_group = dict(listing["files_by_group"])
+    locate = dict(listing["locate"])
+    copied = set()
+    # Filenames whose deep-link group may change (another file of that name can remain)
+    names = {entry["filename"] for entry in removed + added}
+
+    def group_files(g: str) -> list:
+        if g not in copied:
+            files_by_group[g] = list(files_by_group.get(g, ()))
+            copied.add(g)
+        return files_by_group[g]
+
+    for entry in removed:
+        files = group_files(entry["group"])
+        files[:] = [f for f in files if f["rel_path"] != entry["rel_path"]]
+    for entry in added:
+        f = archive_file(content_dir, entry)
+        files = group_files(f["group"])
+        # After any equal keys, as the stable full sort would place it
+        pos = next((k for k, other in enumerate(files) if other["sort_key"] < f["sort_key"]), len(files))
+        files.insert(pos, f)
+
+    # As archive_listing: a filename links to its newest file (equal keys share a
+    # group, where the first one listed wins)
+    newest = {}
+    if names:
+        for files in files_by_group.values():
+            for f in files:
+                if f["filename"] in names:
+                    best = newest.get(f["filename"])
+                    if best is None or f["sort_key"] > best["sort_key"]:
+                        newest[f["filename"]] = f
+    for filename in names:
+        if filename in newest:
+            locate[filename] = newest[filename]["group"]
+        else:
+            locate.pop(filename, None)
+
+    for g in copied:
+        if not files_by_group[g]:
+            del files_by_group[g]
+    return {"groups": _group_order(files_by_group), "files_by_group": files_by_group, "locate": locate}
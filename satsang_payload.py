@@ -0,0 +1,343 @@
+"""
+Ready-to-render iframe payload of each satsang page.
+
+A payload is the page HTML with the auto-resize script injected before
+</body>, whitespace minified and the iframe height estimated up front. It is
+built once per file version (path + mtime + size) and kept in a size-bounded
+in-memory LRU backed by one JSON file per page under cache_dir, so a page
+view is a dict lookup plus one stat() of the file.
+
+Pages rendered from a `contentData` block carry every length variant (and,
+for multi-language blocks, every language) and hide all but one with JS.
+Such pages are also split into one fragment per variant / language: the
+block keeps only that variant and the other names are aliased to it, so the
+page's own render code shows the selected one and its toggle is hidden (the
+app offers the choice instead). Only the selected fragment is sent; the
+others are built alongside it and served from the cache when chosen.
+
+Minification only collapses whitespace runs outside <pre>/<textarea> (a run
+holding a newline becomes one newline, anything else one space), so the
+rendered page is unchanged; <script> bodies only lose line indentation and
+blank lines, which keeps JS line breaks (ASI) intact.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from satsang_catalog import file_signature, share_highlights
+from archive_index import parse_content_data, content_languages
+
+# Bump when the payload format (script, minification, height formula) changes
+PAYLOAD_VERSION = 3
+
+# Height estimate: tag-stripped text length x factor, clamped (600px keeps images visible)
+HEIGHT_PER_CHAR = 0.15
+MIN_HEIGHT = 600
+MAX_HEIGHT = 2500
+
+# ENHANCED resize script - aggressively monitors for content changes
+# This ensures minimal white space for both Short and Long options
+AUTO_RESIZE_SCRIPT = """
+<script>
+(function() {
+    var lastHeight = 0;
+    var resizeAttempts = 0;
+    var maxAttempts = 15;
+
+    function notifyResize() {
+        // Ensure body/html allow expansion
+        document.body.style.height = 'auto';
+        document.documentElement.style.height = 'auto';
+
+        // Get actual content height with generous padding
+        var body = document.body;
+        var html = document.documentElement;
+        var height = Math.max(
+            body.scrollHeight,
+            body.offsetHeight,
+            html.clientHeight,
+            html.scrollHeight,
+            html.offsetHeight
+        ) + 100;  // Extra padding to prevent cutoff
+
+        // Only notify if height changed significantly
+        if (Math.abs(height - lastHeight) > 10) {
+            lastHeight = height;
+            window.parent.postMessage({
+                type: "streamlit:setFrameHeight",
+                height: height
+            }, "*");
+            console.log("Resized to:", height);
+        }
+
+        resizeAttempts++;
+    }
+
+    // MutationObserver to detect DOM changes (Short/Long toggle)
+    var observer = new MutationObserver(function(mutations) {
+        // Reset attempts counter on mutation
+        resizeAttempts = 0;
+        setTimeout(notifyResize, 100);
+        setTimeout(notifyResize, 400);
+        setTimeout(notifyResize, 800);
+    });
+
+    // Observe entire body for changes including subtrees
+    observer.observe(document.body, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true
+    });
+
+    // Click handler for toggle buttons
+    document.addEventListener('click', function(e) {
+        resizeAttempts = 0;
+        setTimeout(notifyResize, 200);
+        setTimeout(notifyResize, 500);
+        setTimeout(notifyResize, 1000);
+    }, true);
+
+    // Window resize handler
+    window.addEventListener('resize', function() {
+        setTimeout(notifyResize, 100);
+    });
+
+    // Force initial resize
+    notifyResize();
+    setTimeout(notifyResize, 500);
+    setTimeout(notifyResize, 1500);
+    setTimeout(notifyResize, 3000);
+
+    // Periodic check (backup)
+    var periodicCheck = setInterval(function() {
+        if (resizeAttempts < maxAttempts) {
+            notifyResize();
+        } else {
+            clearInterval(periodicCheck);
+        }
+    }, 1000);
+})();
+</script>
+</body>
+"""
+
+VARIANTS = ("short", "long")
+
+# Fragment pages: the app's selector replaces the in-page short/long toggle
+HIDE_TOGGLE_STYLE = "<style>.toggle-container { display: none !important; }</style>\n</head>"
+
+# Runs right after the reduced contentData literal: names of the dropped variant
+# (card.short, qa.shortAns, meta.shortSubtitle) and languages point at the kept ones
+ALIAS_SCRIPT = """;
+(function alias(o, keep, drop) {
+    if (!keep) return;
+    if (Array.isArray(o)) { o.forEach(function(v) { alias(v, keep, drop); }); return; }
+    if (!o || typeof o !== "object") return;
+    Object.keys(o).forEach(function(k) {
+        if (k === keep) o[drop] = o[k];
+        else if (k.indexOf(keep) === 0 && /^[A-Z]/.test(k.slice(keep.length))) o[drop + k.slice(keep.length)] = o[k];
+        alias(o[k], keep, drop);
+    });
+})(contentData, %(keep)s, %(drop)s);
+%(languages)s.forEach(function(l) { if (l !== %(lang)s) contentData[l] = contentData[%(lang)s]; });
+"""
+
+TAG_RE = re.compile(r"<[^>]+>")
+# Elements whose body is kept apart from the markup around it
+RAW_BLOCK_RE = re.compile(r"(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)", re.IGNORECASE | re.DOTALL)
+WS_NEWLINE_RE = re.compile(r"\s*\n\s*")
+WS_RUN_RE = re.compile(r"[ \t\f\v]{2,}")
+
+
+# ============================================================
+# BUILD
+# ============================================================
+def _minify_markup(text: str) -> str:
+    return WS_RUN_RE.sub(" ", WS_NEWLINE_RE.sub("\n", text))
+
+def _minify_script(text: str) -> str:
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+def minify_html(html: str) -> str:
+    out, pos = [], 0
+    for m in RAW_BLOCK_RE.finditer(html):
+        out.append(_minify_markup(html[pos:m.start()]))
+        open_tag, tag, body, close_tag = m.groups()
+        tag = tag.lower()
+        if tag == "script":
+            body = _minify_script(body)
+        elif tag == "style":
+            body = _minify_markup(body)
+        out.append(f"{_minify_markup(open_tag)}{body}{close_tag}")
+        pos = m.end()
+    out.append(_minify_markup(html[pos:]))
+    return "".join(out).strip()
+
+def estimate_height(html: str) -> int:
+    """Initial iframe height in px; the injected script corrects it once the page has laid out."""
+    return max(MIN_HEIGHT, min(MAX_HEIGHT, int(len(TAG_RE.sub("", html)) * HEIGHT_PER_CHAR)))
+
+def build_payload(raw_html: str) -> dict:
+    """{html, height}: resize script injected before </body>, minified."""
+    # Inject script before closing body tag
+    if "</body>" in raw_html:
+        raw_html = raw_html.replace("</body>", AUTO_RESIZE_SCRIPT)
+    height = estimate_height(raw_html)
+    return {"html": minify_html(raw_html), "height": height}
+
+def _is_variant_key(key: str, variant: str) -> bool:
+    """`long` itself, or a `longAns` / `longSubtitle` style field."""
+    return key == variant or (key.startswith(variant) and key[len(variant):][:1].isupper())
+
+def _has_variant(value, variant: str) -> bool:
+    if isinstance(value, list):
+        return any(_has_variant(v, variant) for v in value)
+    if isinstance(value, dict):
+        return any(_is_variant_key(k, variant) or _has_variant(v, variant) for k, v in value.items())
+    return False
+
+def _drop_variant(value, drop: str):
+    if isinstance(value, list):
+        return [_drop_variant(v, drop) for v in value]
+    if isinstance(value, dict):
+        return {k: _drop_variant(v, drop) for k, v in value.items() if not _is_variant_key(k, drop)}
+    return value
+
+def fragment_key(lang: str, variant: str) -> str:
+    """'long', 'hi/short', 'en' ..."""
+    return "/".join(part for part in (lang, variant) if part)
+
+def parse_fragment_key(key: str) -> tuple[str, str]:
+    """(lang, variant) of a fragment key."""
+    lang, _, variant = key.rpartition("/")
+    if not lang and variant not in VARIANTS:
+        return variant, ""
+    return lang, variant
+
+def split_fragments(raw_html: str) -> dict[str, str]:
+    """{fragment key: page html} of a contentData page with variants or several languages; {} otherwise."""
+    parsed = parse_content_data(raw_html)
+    if parsed is None:
+        return {}
+    start, stop, data = parsed
+    languages = content_languages(data)
+    variants = [v for v in VARIANTS if _has_variant(data, v)]
+    if len(variants) < 2:
+        variants = [""]
+    if len(languages) < 2 and variants == [""]:
+        return {}
+    fragments = {}
+    for lang in languages:
+        # Multi-language block: keep this language (and any shared keys)
+        lang_data = {k: v for k, v in data.items() if k == lang or k not in languages} if lang else data
+        for variant in variants:
+            drop = next((v for v in VARIANTS if v != variant), "") if variant else ""
+            reduced = _drop_variant(lang_data, drop) if drop else lang_data
+            alias = ALIAS_SCRIPT % {
+                "keep": json.dumps(variant), "drop": json.dumps(drop),
+                "languages": json.dumps([l for l in languages if l]), "lang": json.dumps(lang),
+            }
+            page = raw_html[:start] + json.dumps(reduced, ensure_ascii=False).replace("</", "<\\/") + alias + raw_html[stop:]
+            fragments[fragment_key(lang, variant)] = page.replace("</head>", HIDE_TOGGLE_STYLE, 1)
+    return fragments
+
+def build_payloads(raw_html: str) -> dict[str, dict]:
+    """
+    {"": whole page, fragment key: fragment}; the whole page's payload also
+    lists the fragment keys and the page's share highlights.
+    """
+    fragments = split_fragments(raw_html)
+    payloads = {key: build_payload(page) for key, page in fragments.items()}
+    payloads[""] = {**build_payload(raw_html), "fragments": list(fragments), "highlights": share_highlights(raw_html)}
+    return payloads
+
+
+# ============================================================
+# CACHE (memory LRU + disk)
+# ============================================================
+class PayloadCache:
+    def __init__(self, cache_dir: str | None, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # (path, fragment) -> (signature, payload, bytes)
+        self._lru: OrderedDict[tuple[str, str], tuple[tuple, dict, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, fragment: str = "") -> dict:
+        """
+        Payload of the file at `path` ({html, height}, plus `fragments` and
+        `highlights` for the whole page ""); rebuilt only when the file changed.
+        An unknown fragment falls back to the whole page.
+        """
+        signature = (*file_signature(path), PAYLOAD_VERSION)
+        key = (path, fragment)
+        with self._lock:
+            item = self._lru.get(key)
+            if item is not None and item[0] == signature:
+                self._lru.move_to_end(key)
+                return item[1]
+        payload = self._load(path, fragment, signature)
+        if payload is None:
+            # Build every fragment of the page at once; the ones not asked for go to disk only
+            with open(path, "r", encoding="utf-8") as f:
+                payloads = build_payloads(f.read())
+            for name, built in payloads.items():
+                self._save(path, name, signature, built)
+            payload = payloads.get(fragment)
+            if payload is None:
+                return self.get(path)
+        self._put(key, signature, payload)
+        return payload
+
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    def _put(self, key: tuple[str, str], signature: tuple, payload: dict):
+        size = len(payload["html"].encode("utf-8"))
+        with self._lock:
+            old = self._lru.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.max_bytes:
+                return   # larger than the whole budget: served from disk every time
+            self._lru[key] = (signature, payload, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _key, (_sig, _payload, evicted) = self._lru.popitem(last=False)
+                self._bytes -= evicted
+
+    def _disk_path(self, path: str, fragment: str) -> str:
+        key = hashlib.sha1(f"{os.path.abspath(path)}\0{fragment}".encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _load(self, path: str, fragment: str, signature: tuple) -> dict | None:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(path, fragment), "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (cached.pop("path", None) != os.path.abspath(path) or cached.pop("fragment", None) != fragment
+                    or tuple(cached.pop("signature", ())) != signature):
+                return None
+            return cached
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, path: str, fragment: str, signature: tuple, payload: dict):
+        if not self.cache_dir:
+            return
+        # One file per page fragment: a new version overwrites the old one
+        disk_path = self._disk_path(path, fragment)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(disk_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"path": os.path.abspath(path), "fragment": fragment, "signature": list(signature),
+                           **payload}, f, ensure_ascii=False)
+            os.replace(disk_path + ".tmp", disk_path)
+        except OSError as e:
+            print(f"Satsang payload cache: could not write {disk_path} ({e})")
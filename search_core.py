@@ -0,0 +1,282 @@
+"""
+Vectorized ranking primitives for the Q/A search.
+
+Everything here works on whole-corpus NumPy arrays (one score per row) so the
+app never loops over candidates in Python. Text cleaning / tokenization stays
+in app.py; callers pass already-expanded query tokens in.
+"""
+import numpy as np
+import pandas as pd
+
+from corpus_store import STRING_DTYPE
+
+
+# ============================================================
+# RESULT SETS (compact, stored in session state)
+# ============================================================
+METHOD_NAMES = ("Browse", "Literal", "Semantic", "Hybrid")
+METHOD_CODES = {name: code for code, name in enumerate(METHOD_NAMES)}
+
+class ResultSet:
+    """
+    Ranked results as parallel arrays: int32 row ids, float32 scores and uint8
+    method codes (see METHOD_NAMES). Slicing returns a view (no copies), and
+    iterating yields the (i, final, sem, lex, method) tuples the UI renders.
+    """
+    __slots__ = ("ids", "final", "sem", "lex", "methods")
+
+    def __init__(self, ids, final, sem, lex, methods):
+        self.ids = np.asarray(ids, dtype=np.int32)
+        self.final = np.asarray(final, dtype=np.float32)
+        self.sem = np.asarray(sem, dtype=np.float32)
+        self.lex = np.asarray(lex, dtype=np.float32)
+        self.methods = np.asarray(methods, dtype=np.uint8)
+
+    @classmethod
+    def empty(cls):
+        return cls([], [], [], [], [])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ResultSet(self.ids[key], self.final[key], self.sem[key], self.lex[key], self.methods[key])
+        return (int(self.ids[key]), float(self.final[key]), float(self.sem[key]),
+                float(self.lex[key]), METHOD_NAMES[self.methods[key]])
+
+    def __iter__(self):
+        for k in range(len(self.ids)):
+            yield self[k]
+
+    def take(self, positions) -> "ResultSet":
+        """New ResultSet with rows reordered/selected by position."""
+        positions = np.asarray(positions, dtype=np.int64)
+        return ResultSet(self.ids[positions], self.final[positions], self.sem[positions],
+                         self.lex[positions], self.methods[positions])
+
+class BrowseResults:
+    """
+    Lazy "all rows" view for Browse mode: stores only a range, so session
+    memory does not grow with the corpus. Same interface as ResultSet.
+    """
+    __slots__ = ("rows",)
+
+    def __init__(self, n_rows: int | range):
+        self.rows = n_rows if isinstance(n_rows, range) else range(n_rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return np.arange(self.rows.start, self.rows.stop, self.rows.step, dtype=np.int32)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return BrowseResults(self.rows[key])
+        return (self.rows[key], 0.0, 0.0, 0.0, "Browse")
+
+    def __iter__(self):
+        for i in self.rows:
+            yield (i, 0.0, 0.0, 0.0, "Browse")
+
+class MergedResults:
+    """
+    Results gathered from several collections: one ResultSet over all of them
+    plus, per result, the position (in .collections) of the collection whose
+    row ids it refers to. Same interface as ResultSet.
+    """
+    __slots__ = ("results", "sources", "collections")
+
+    def __init__(self, results: ResultSet, sources, collections: tuple[str, ...]):
+        self.results = results
+        self.sources = np.asarray(sources, dtype=np.uint8)
+        self.collections = collections
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.results.ids
+
+    def collection_of(self, k: int) -> str:
+        return self.collections[self.sources[k]]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return MergedResults(self.results[key], self.sources[key], self.collections)
+        return self.results[key]
+
+    def __iter__(self):
+        return iter(self.results)
+
+def merge_results(parts: dict[str, ResultSet], limit: int | None = None) -> MergedResults:
+    """Gather per-collection rankings into one, by final score (ties keep collection order)."""
+    names = tuple(parts)
+    if not names:
+        return MergedResults(ResultSet.empty(), [], ())
+    merged = ResultSet(
+        np.concatenate([r.ids for r in parts.values()]),
+        np.concatenate([r.final for r in parts.values()]),
+        np.concatenate([r.sem for r in parts.values()]),
+        np.concatenate([r.lex for r in parts.values()]),
+        np.concatenate([r.methods for r in parts.values()]),
+    )
+    sources = np.repeat(np.arange(len(names), dtype=np.uint8), [len(r) for r in parts.values()])
+    order = np.argsort(-merged.final, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    return MergedResults(merged.take(order), sources[order], names)
+
+
+# ============================================================
+# LEXICAL INDEX
+# ============================================================
+class LexicalIndex:
+    """
+    Lower-cased lexical corpus (question + translated question + answer),
+    held as an Arrow-backed string column so substring scans run in C++.
+    Scores every row at once: the share of query tokens found as substrings,
+    +0.5 (capped at 1) when a short query occurs as a phrase.
+    """
+    def __init__(self, lex_texts):
+        # Lower-case with Python str.lower (as the query tokens are), then store compactly
+        self.texts = pd.Series([(t or "").lower() for t in lex_texts], dtype=STRING_DTYPE)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def shard(self, start: int, stop: int) -> "LexicalIndex":
+        """Index over rows [start, stop) sharing this one's Arrow buffers (no copy); row ids restart at 0."""
+        part = object.__new__(LexicalIndex)
+        part.texts = self.texts.iloc[start:stop].reset_index(drop=True)
+        return part
+
+    def scores(self, toks: list[str], base_tok_count: int, q_clean: str, phrase_boost: bool = True) -> np.ndarray:
+        """Token-hit ratio per row, plus the short-query phrase boost."""
+        n = len(self.texts)
+        if not toks or n == 0:
+            return np.zeros(n, dtype=np.float64)
+
+        hits = np.zeros(n, dtype=np.float64)
+        for tok in toks:
+            hits += self.texts.str.contains(tok, regex=False).to_numpy(dtype=np.float64)
+        score = hits / len(toks)
+
+        # Phrase boost for short queries
+        if phrase_boost and base_tok_count <= 2 and q_clean:
+            phrase = self.texts.str.contains(q_clean, regex=False).to_numpy(dtype=bool)
+            score = np.where(phrase, np.minimum(1.0, score + 0.5), score)
+
+        return score
+
+
+# ============================================================
+# CANDIDATE GENERATION + FUSION
+# ============================================================
+def top_n(scores: np.ndarray, n: int, positive_only: bool = False) -> np.ndarray:
+    """
+    Indices of the n highest scores (unordered), optionally only scores > 0.
+    Ties at the cut go to the lowest indices, so the pick is deterministic
+    (and a sharded index picks the same rows, see shard_candidates).
+    """
+    idx = np.flatnonzero(scores > 0) if positive_only else np.arange(len(scores))
+    if n <= 0 or idx.size == 0:
+        return idx[:0]
+    if idx.size > n:
+        vals = scores[idx]
+        cut = -np.partition(-vals, n - 1)[n - 1]
+        above = idx[vals > cut]
+        idx = np.concatenate((above, idx[vals == cut][:n - len(above)]))
+    return idx
+
+def shard_candidates(sim, lex: np.ndarray, search_mode: str,
+                     sem_top_n: int = 40, lex_top_n: int = 40) -> np.ndarray:
+    """
+    Sorted row ids one shard must report so that rank_candidates() over the
+    rows gathered from all shards equals rank_candidates() over the whole
+    corpus: every global top-N row is in its own shard's top-N.
+    """
+    if search_mode == "Literal Only":
+        return np.flatnonzero(lex > 0)
+    ids = np.arange(0)
+    if search_mode != "Semantic Only":
+        ids = top_n(lex, lex_top_n, positive_only=True)
+    if sim is not None:
+        ids = np.union1d(ids, top_n(np.asarray(sim), sem_top_n))
+    return np.sort(ids)
+
+def rank_positions(values: np.ndarray) -> np.ndarray:
+    """1-based rank of each value (highest = 1)."""
+    order = np.argsort(-values, kind="stable")
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[order] = np.arange(1, len(values) + 1)
+    return ranks
+
+def fuse_scores(sem: np.ndarray, lex: np.ndarray, sem_w: float, lex_w: float,
+                fusion: str = "weighted", rrf_k: int = 60) -> np.ndarray:
+    """
+    Combine candidate scores.
+      - 'weighted': sem_w * sem + lex_w * lex (the original blend)
+      - 'rrf': weighted reciprocal rank fusion, rescaled so a row ranked
+               first on both lists scores 1.0 (keeps the % display sensible)
+    """
+    if fusion != "rrf":
+        return sem_w * sem + lex_w * lex
+
+    rrf = sem_w / (rrf_k + rank_positions(sem))
+    # Rows without any lexical hit get no lexical contribution
+    rrf = rrf + np.where(lex > 0, lex_w / (rrf_k + rank_positions(lex)), 0.0)
+    best = (sem_w + lex_w) / (rrf_k + 1)
+    return rrf / best if best > 0 else rrf
+
+def rank_candidates(sim, lex: np.ndarray, search_mode: str, q_tok_count: int,
+                    sem_w: float, lex_w: float,
+                    sem_top_n: int = 40, lex_top_n: int = 40,
+                    short_query_requires_lex: bool = True, high_sem_override: float = 0.62,
+                    fusion: str = "weighted"):
+    """
+    Rank one query against the corpus.
+    sim: cosine similarity per row (or None), lex: lexical score per row.
+    Returns a ResultSet sorted by final score desc.
+    """
+    n = len(lex)
+    sem_all = np.zeros(n, dtype=np.float64) if sim is None else np.asarray(sim, dtype=np.float64)
+
+    if search_mode == "Literal Only":
+        ids = np.flatnonzero(lex > 0)
+        final = lex[ids]
+        sem = np.zeros(len(ids), dtype=np.float64)
+        methods = np.full(len(ids), METHOD_CODES["Literal"], dtype=np.uint8)
+
+    else:
+        if search_mode == "Semantic Only":
+            if sim is None:
+                ids = np.arange(0)
+            else:
+                ids = top_n(sem_all, sem_top_n)
+        else:
+            # Hybrid: union of semantic top-N and lexical top-N
+            sem_ids = top_n(sem_all, sem_top_n) if sim is not None else np.arange(0)
+            ids = np.union1d(sem_ids, top_n(lex, lex_top_n, positive_only=True))
+
+        sem = sem_all[ids]
+        cand_lex = lex[ids]
+
+        # Short query: require lexical grounding unless semantic is very high
+        if short_query_requires_lex and q_tok_count <= 2:
+            keep = (cand_lex > 0) | (sem >= high_sem_override)
+            ids, sem, cand_lex = ids[keep], sem[keep], cand_lex[keep]
+
+        if search_mode == "Semantic Only":
+            final = sem
+            methods = np.full(len(ids), METHOD_CODES["Semantic"], dtype=np.uint8)
+        else:
+            final = fuse_scores(sem, cand_lex, sem_w, lex_w, fusion=fusion)
+            methods = np.where(cand_lex > 0, METHOD_CODES["Hybrid"], METHOD_CODES["Semantic"]).astype(np.uint8)
+
+    lex_out = lex[ids]
+    order = np.argsort(-final, kind="stable")
+    return ResultSet(ids[order], final[order], sem[order], lex_out[order], methods[order])
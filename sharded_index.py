@@ -0,0 +1,72 @@
+"""
+Sharded search index: rows are split into contiguous shards, each with its
+own embedding block and lexical index, and a query is scored on all shards
+in parallel. Each shard reports only its candidates (search_core.
+shard_candidates); the gathered candidates are ranked once, so the result is
+the same as ranking the unsharded corpus.
+
+Shards run on a thread pool: the heavy parts (the embedding matmul in NumPy,
+Arrow substring kernels) release the GIL, so shards use separate cores
+without copying the corpus into worker processes. Embedding blocks are views
+of the full matrix (memory-mapped artifacts stay mapped) and lexical shards
+share the full index's Arrow buffers.
+
+See bench_sharding.py for throughput by shard count.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+from search_core import LexicalIndex, ResultSet, shard_candidates
+
+
+class IndexShard:
+    __slots__ = ("start", "stop", "embeddings", "lex_index")
+
+    def __init__(self, start: int, stop: int, embeddings, lex_index: LexicalIndex):
+        self.start = start
+        self.stop = stop
+        self.embeddings = embeddings
+        self.lex_index = lex_index
+
+    def __len__(self):
+        return self.stop - self.start
+
+
+class ShardedIndex:
+    def __init__(self, doc_embeddings, lex_index: LexicalIndex, num_shards: int, workers: int | None = None):
+        n = len(lex_index)
+        num_shards = max(1, min(num_shards, n or 1))
+        bounds = np.linspace(0, n, num_shards + 1).astype(np.int64).tolist()
+        has_embeddings = doc_embeddings is not None and len(doc_embeddings) == n
+        self.shards = [
+            IndexShard(lo, hi, doc_embeddings[lo:hi] if has_embeddings else None, lex_index.shard(lo, hi))
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
+        self.workers = workers or min(num_shards, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="index-shard")
+
+    def __len__(self):
+        return self.shards[-1].stop if self.shards else 0
+
+    def search(self, score: Callable[[IndexShard], tuple], rank: Callable[[object, np.ndarray], ResultSet],
+               search_mode: str, sem_top_n: int = 40, lex_top_n: int = 40) -> ResultSet:
+        """
+        score(shard) -> (sim or None, lex) over the shard's rows, run on every
+        shard in parallel; rank(sim, lex) ranks the gathered candidates (e.g.
+        a rank_candidates() call). Returns the ResultSet in corpus row ids.
+        """
+        def scatter(shard: IndexShard):
+            sim, lex = score(shard)
+            local = shard_candidates(sim, lex, search_mode, sem_top_n, lex_top_n)
+            return local + shard.start, None if sim is None else np.asarray(sim)[local], lex[local]
+
+        parts = list(self._pool.map(scatter, self.shards))
+        ids = np.concatenate([p[0] for p in parts])
+        lex = np.concatenate([p[2] for p in parts])
+        sim = None if any(p[1] is None for p in parts) else np.concatenate([p[1] for p in parts])
+
+        ranked = rank(sim, lex)
+        return ResultSet(ids[ranked.ids], ranked.final, ranked.sem, ranked.lex, ranked.methods)
@@ -0,0 +1,142 @@
+"""
+Conditional fetch of the Google Sheet CSV export, with the last good corpus
+kept on disk as a Parquet snapshot.
+
+- Sends If-None-Match / If-Modified-Since when the previous response had them
+  (304 -> serve the snapshot, no parsing or cleaning).
+- Otherwise compares a SHA-1 of the body with the snapshot's; same content ->
+  serve the snapshot.
+- Any fetch/parse failure serves the snapshot instead of raising, if one exists.
+
+The URL is a parameter, so a local HTTP server can stand in for the sheet.
+"""
+import hashlib
+import io
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+
+import pandas as pd
+
+SNAPSHOT_FILE = "corpus.parquet"
+META_FILE = "meta.json"
+
+# fetch_sheet() sources
+FETCHED = "fetched"              # new content, parsed + cleaned + snapshotted
+NOT_MODIFIED = "not-modified"    # server answered 304
+UNCHANGED = "unchanged"          # 200, but same content hash as the snapshot
+STALE = "stale-snapshot"         # fetch failed, served last good snapshot
+
+
+class SheetSchemaError(ValueError):
+    """Raised by a prepare() callback when the sheet is missing required columns."""
+
+
+class SheetSnapshot:
+    """Last good prepared corpus (Parquet) + fetch metadata (JSON) in one directory."""
+    def __init__(self, snapshot_dir: str):
+        self.dir = snapshot_dir
+        self.data_path = os.path.join(snapshot_dir, SNAPSHOT_FILE)
+        self.meta_path = os.path.join(snapshot_dir, META_FILE)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.data_path) and os.path.exists(self.meta_path)
+
+    def load_meta(self) -> dict:
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self) -> pd.DataFrame:
+        return pd.read_parquet(self.data_path)
+
+    def save(self, df: pd.DataFrame, meta: dict):
+        """Write data then meta, each via temp file + os.replace (readers never see a half file)."""
+        os.makedirs(self.dir, exist_ok=True)
+        tmp = self.data_path + ".tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, self.data_path)
+        self.save_meta(meta)
+
+    def save_meta(self, meta: dict):
+        os.makedirs(self.dir, exist_ok=True)
+        tmp = self.meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.meta_path)
+
+
+def parse_sheet_csv(body: bytes) -> pd.DataFrame:
+    # All columns as text: keeps Parquet columns single-typed and matches what the cards display
+    return pd.read_csv(io.BytesIO(body), dtype=str).fillna("")
+
+def fetch_sheet(url: str, snapshot_dir: str, prepare, prepare_version: str = "1",
+                timeout: float = 20.0, reuse=None) -> tuple[pd.DataFrame, str]:
+    """
+    Return (prepared_df, source). `prepare(raw_df) -> df` does the cleaning and
+    is only called when the sheet content actually changed; bump
+    prepare_version when the cleaning rules change to invalidate the snapshot.
+    Raises only when the fetch (or prepare) fails AND there is no snapshot to
+    fall back on.
+
+    `reuse`: what the caller is already serving; returned as-is instead of
+    re-reading the snapshot whenever the source is not FETCHED.
+    """
+    snap = SheetSnapshot(snapshot_dir)
+
+    def snapshot():
+        return reuse if reuse is not None else snap.load()
+
+    meta = snap.load_meta() if snap.exists() else {}
+    reusable = bool(meta) and meta.get("url") == url and meta.get("prepare_version") == prepare_version
+
+    headers = {}
+    if reusable:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and reusable:
+                meta["checked_at"] = time.time()
+                snap.save_meta(meta)
+                return snapshot(), NOT_MODIFIED
+            raise
+
+        content_hash = hashlib.sha1(body).hexdigest()
+        new_meta = {
+            "url": url,
+            "prepare_version": prepare_version,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_sha1": content_hash,
+            "checked_at": time.time(),
+        }
+
+        if reusable and meta.get("content_sha1") == content_hash:
+            new_meta["fetched_at"] = meta.get("fetched_at")
+            snap.save_meta(new_meta)
+            return snapshot(), UNCHANGED
+
+        df = prepare(parse_sheet_csv(body))
+        new_meta["fetched_at"] = time.time()
+        new_meta["rows"] = len(df)
+        snap.save(df, new_meta)
+        return df, FETCHED
+
+    except Exception:
+        if reuse is not None or snap.exists():
+            return snapshot(), STALE
+        raise
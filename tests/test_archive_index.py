@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+
+from archive_index import ArchiveIndex, FileBlock, build_archive_index, load_block, save_block
+
+PAGE = """<html><body>
+<div class="card"><h2>Naam jap</h2><p>Naam jap se man shuddh hota hai aur bhakti badhti hai.</p></div>
+<div class="card"><h2>Seva</h2><p>Nishkaam seva hi sabse badi sadhana hai, aisa Baba kehte hain.</p></div>
+</body></html>"""
+
+
+def write_page(content_dir, name="1Dec2025.html"):
+    path = os.path.join(content_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(PAGE)
+    st = os.stat(path)
+    return {name: {"rel_path": name, "mtime_ns": st.st_mtime_ns, "size": st.st_size}}
+
+
+def failed_embed(texts):
+    return np.array([])  # what GoogleEmbedder.encode returns when every call fails
+
+
+def working_embed(texts):
+    return np.ones((len(texts), 4), dtype=np.float32)
+
+
+def test_failed_embeddings_are_not_cached(tmp_path):
+    content_dir, cache_dir = str(tmp_path / "content"), str(tmp_path / "cache")
+    os.makedirs(content_dir)
+    catalog = write_page(content_dir)
+
+    index = build_archive_index(content_dir, cache_dir, catalog, failed_embed)
+    assert len(index) == 0
+    assert not os.path.exists(cache_dir) or not os.listdir(cache_dir)
+
+    # The embedder recovers: the file is indexed on the next build
+    index = build_archive_index(content_dir, cache_dir, catalog, working_embed, index)
+    assert len(index) > 0
+    assert index.embeddings.shape == (len(index), 4)
+
+
+def test_malformed_cached_block_is_rebuilt(tmp_path):
+    content_dir, cache_dir = str(tmp_path / "content"), str(tmp_path / "cache")
+    os.makedirs(content_dir)
+    catalog = write_page(content_dir)
+    entry = catalog["1Dec2025.html"]
+    signature = (entry["mtime_ns"], entry["size"])
+
+    # A block cached by an earlier version from a failed embedding run
+    bad = FileBlock("1Dec2025.html", signature, [{"heading": "", "text": "x", "clean": "x"}], np.array([]))
+    save_block(cache_dir, bad)
+    assert load_block(cache_dir, "1Dec2025.html", signature) is None
+
+    index = build_archive_index(content_dir, cache_dir, catalog, working_embed)
+    assert index.embeddings.shape == (len(index), 4)
+    assert load_block(cache_dir, "1Dec2025.html", signature) is not None
+
+
+def test_index_drops_malformed_blocks():
+    good = FileBlock("a.html", (1, 1), [{"heading": "", "text": "a", "clean": "naam jap"}], np.ones((1, 4), np.float32))
+    bad = FileBlock("b.html", (1, 1), [{"heading": "", "text": "b", "clean": "seva"}], np.array([]))
+    index = ArchiveIndex({"a.html": good, "b.html": bad}, {})
+    assert list(index.blocks) == ["a.html"]
+    assert index.embeddings.shape == (1, 4)
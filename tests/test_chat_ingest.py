@@ -0,0 +1,39 @@
+import csv
+
+from chat_ingest import SHEET_COLUMNS, ingest_chat, iter_messages, iter_qa_rows
+
+CHAT = [
+    "\ufeff1/10/25, 7:11 PM - Ram: Naam jap kaise karna chahiye baba?\n",
+    "1/10/25, 7:12 PM - Ram: Subah ya shaam?\n",
+    "1/10/25, 7:20 PM - Babaji: Jab bhi man kare, prem se karo.\n",
+    "Har saans ke saath.\n",
+    "1/10/25, 7:25 PM - Shyam: Radhe Radhe 🙏\n",
+    "1/10/25, 7:26 PM - Babaji: Radhe Radhe\n",
+    "[2/10/25, 8:01:05 AM] Shyam: Seva ka sahi arth kya hai?\n",
+    "[2/10/25, 8:05:00 AM] Babaji: <Media omitted>\n",
+    "[2/10/25, 8:06:00 AM] Babaji: Nishkaam seva hi seva hai.\n",
+]
+
+
+def test_first_message_after_byte_order_mark():
+    messages = list(iter_messages(CHAT))
+    assert messages[0] == ("1/10/25", "Ram", "Naam jap kaise karna chahiye baba?")
+
+
+def test_pairs_questions_with_responder_answers():
+    rows = list(iter_qa_rows(CHAT, ["Babaji"]))
+    assert [(r["Question"], r["Answer"]) for r in rows] == [
+        ("Naam jap kaise karna chahiye baba?\nSubah ya shaam?", "Jab bhi man kare, prem se karo.\nHar saans ke saath."),
+        ("Seva ka sahi arth kya hai?", "Nishkaam seva hi seva hai."),
+    ]
+    assert rows[0]["Date"] == "1/10/25"
+
+
+def test_csv_has_sheet_columns_and_date_on_request(tmp_path):
+    chat = tmp_path / "chat.txt"
+    chat.write_text("".join(CHAT), encoding="utf-8")
+    for with_date, columns in ((False, list(SHEET_COLUMNS)), (True, list(SHEET_COLUMNS) + ["Date"])):
+        out = tmp_path / "rows.csv"
+        assert ingest_chat(str(chat), ["Babaji"], str(out), with_date=with_date) == 2
+        with open(out, newline="", encoding="utf-8") as f:
+            assert next(csv.reader(f)) == columns
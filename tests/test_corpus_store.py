@@ -0,0 +1,25 @@
+import pandas as pd
+
+from corpus_store import CorpusStore, prepare_corpus
+from search_core import LexicalIndex
+
+QUESTION = "naam jap kaise kare aur man kaise lagaye"
+
+
+def test_near_duplicates_stay_findable_by_literal_search(tmp_path):
+    df = pd.DataFrame({
+        "Question": [QUESTION, QUESTION, "seva ka sahi arth kya hai"],
+        "Answer": ["roz subah jap karo", "radha naam ka kirtan karo", "nishkaam seva"],
+    })
+    corpus = CorpusStore.from_frame(prepare_corpus(df))
+    assert len(corpus) == 2
+    assert corpus.similar_counts.tolist() == [1, 0]
+
+    # Only the duplicate's answer mentions "kirtan": its canonical row is the hit
+    scores = LexicalIndex(corpus["lex_text"]).scores(["kirtan"], 1, "kirtan")
+    assert scores.tolist() == [1.0, 0.0]
+
+    # Stored and loaded again, the lexical text is not appended twice
+    path = str(tmp_path / "corpus.parquet")
+    corpus.to_parquet(path)
+    assert CorpusStore.from_parquet(path)["lex_text"].tolist() == corpus["lex_text"].tolist()
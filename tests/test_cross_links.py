@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import cross_links
+from archive_index import ArchiveIndex, FileBlock
+from cross_links import CrossLinks, build_cross_links
+
+
+def make_archive(rng, sizes, dim):
+    blocks = {}
+    for f, size in enumerate(sizes):
+        rel_path = f"{f}.html"
+        frags = [{"heading": "", "text": "", "clean": f"fragment {f} {i}"} for i in range(size)]
+        blocks[rel_path] = FileBlock(rel_path, (f, size), frags, rng.standard_normal((size, dim)).astype(np.float32))
+    return ArchiveIndex(blocks, {})
+
+
+def brute_force(qa, archive, k, min_score):
+    norm = lambda m: m / np.linalg.norm(m, axis=1, keepdims=True)
+    sim = norm(qa) @ norm(archive.embeddings).T
+    rel_paths = list(archive.blocks)
+    file_of = np.array([rel_paths.index(p) for p in archive.rel_paths])
+    per_file = np.stack([sim[:, file_of == f].max(axis=1) for f in range(len(rel_paths))], axis=1)
+    satsangs = [[rel_paths[f] for f in np.argsort(-row, kind="stable")[:k] if row[f] >= min_score]
+                for row in per_file]
+    questions = {rel_paths[f]: [int(r) for r in np.argsort(-col, kind="stable")[:k] if col[r] >= min_score]
+                 for f, col in enumerate(per_file.T)}
+    return satsangs, questions
+
+
+@pytest.mark.parametrize("block_rows", [7, 64, 512])
+def test_blocked_links_match_brute_force(monkeypatch, block_rows):
+    monkeypatch.setattr(cross_links, "BLOCK_ROWS", block_rows)
+    rng = np.random.default_rng(0)
+    archive = make_archive(rng, [3, 1, 5, 2, 4], dim=8)
+    qa = rng.standard_normal((150, 8)).astype(np.float32)
+
+    links = build_cross_links("v1", qa, archive, k=3, min_score=0.2)
+    satsangs, questions = brute_force(qa, archive, k=3, min_score=0.2)
+    assert [[p for p, _s, _sc in links.satsangs_for(r)] for r in range(len(qa))] == satsangs
+    assert {p: [r for r, _sc in links.questions_for(p)] for p in archive.blocks} == questions
+
+    # The best section of a linked file is its highest-scoring fragment
+    rel_path, section, score = links.satsangs_for(0)[0]
+    frags = archive.blocks[rel_path].embeddings
+    cos = frags @ qa[0] / (np.linalg.norm(frags, axis=1) * np.linalg.norm(qa[0]))
+    assert section == int(np.argmax(cos)) and score == pytest.approx(cos.max(), abs=1e-3)
+
+
+def test_links_round_trip_and_reject_other_keys(tmp_path):
+    rng = np.random.default_rng(1)
+    archive = make_archive(rng, [2, 2], dim=4)
+    links = build_cross_links("v1", rng.standard_normal((5, 4)).astype(np.float32), archive, min_score=-1)
+    path = str(tmp_path / "links.npz")
+    links.save(path)
+    loaded = CrossLinks.load(path, links.key)
+    assert [loaded.satsangs_for(r) for r in range(5)] == [links.satsangs_for(r) for r in range(5)]
+    assert CrossLinks.load(path, "other") is None
+
+
+def test_no_links_across_models():
+    rng = np.random.default_rng(2)
+    archive = make_archive(rng, [2], dim=4)
+    assert build_cross_links("v1", rng.standard_normal((3, 6)).astype(np.float32), archive) is None
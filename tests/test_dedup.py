@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from dedup import NEAR_DUP_THRESHOLD, jaccard, minhash_signatures, near_duplicate_groups, shingles
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEXTS = [
+    "naam jap kaise kare aur man kaise lagaye",
+    "Naam jap kaise kare, aur man kaise lagaye?",
+    "seva ka sahi arth kya hai",
+    "naam jap kaise kare aur man kaise lagaye",
+    "naam jap kaise karen aur man kaise lagayen",
+    "guru kripa kaise prapt hoti hai",
+    "seva ka sahi arth kya hai baba",
+    "satsang mein baithne se man shant kyon hota hai",
+    "satsang mein baithne se man shant kyon nahi hota hai",
+    "bhagwan ka naam jap karte samay man bhatakta hai to kya karna chahiye maharaj ji",
+    "bhagwan ka naam jap karte samay man bhatakta hai to kya karen maharaj ji",
+]
+
+
+def test_groups_point_at_first_row():
+    canonical = near_duplicate_groups(TEXTS)
+    assert canonical[0] == 0
+    assert canonical[3] == 0                      # exact duplicate
+    assert canonical[2] == 2 and canonical[5] == 5
+    assert all(canonical[canonical] == canonical)  # canonicals map to themselves
+    assert all(canonical <= np.arange(len(TEXTS)))
+
+
+def test_reworded_pair_above_threshold_is_grouped():
+    assert jaccard(shingles(TEXTS[7]), shingles(TEXTS[8])) > NEAR_DUP_THRESHOLD
+    canonical = near_duplicate_groups(TEXTS)
+    assert canonical[7] == 7 and canonical[8] == 7
+
+
+def test_pairs_below_threshold_stay_separate():
+    for a, b in ((9, 10), (0, 1), (0, 4)):
+        assert jaccard(shingles(TEXTS[a]), shingles(TEXTS[b])) < NEAR_DUP_THRESHOLD
+    canonical = near_duplicate_groups(TEXTS)
+    assert canonical[9] == 9 and canonical[10] == 10
+    assert canonical[1] == 1 and canonical[4] == 4
+
+
+def test_signatures_do_not_depend_on_hash_seed():
+    # Groups are stored with the prepared corpus, so they must be the same in every process
+    script = ("import json, sys; from dedup import minhash_signatures, near_duplicate_groups, shingles; "
+              "texts = json.load(sys.stdin); "
+              "print(json.dumps([minhash_signatures([shingles(t) for t in texts]).tolist(), "
+              "near_duplicate_groups(texts).tolist()]))")
+    runs = set()
+    for seed in ("1", "2", "3"):
+        out = subprocess.run([sys.executable, "-c", script], input=json.dumps(TEXTS), capture_output=True,
+                             text=True, check=True, cwd=ROOT, env={**os.environ, "PYTHONHASHSEED": seed})
+        runs.add(out.stdout)
+    assert len(runs) == 1
+    sigs, groups = json.loads(runs.pop())
+    assert sigs == minhash_signatures([shingles(t) for t in TEXTS]).tolist()
+    assert groups == near_duplicate_groups(TEXTS).tolist()
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from corpus_store import CorpusStore, prepare_corpus
+from fts_backend import FtsLexicalIndex
+from search_core import LexicalIndex
+
+
+def test_scores_match_in_memory_index(tmp_path):
+    df = pd.DataFrame({
+        "Question": ["Naam jap kaise kare?", "नाम जप कैसे करें", "seva ka sahi arth", "man kaise lagaye",
+                     "guru kripa aur naam jap"],
+        "Answer": ["roz subah jap karo", "प्रतिदिन नाम जप करो", "nishkaam seva", "naam jap se", "kripa se hi"],
+    })
+    corpus = CorpusStore.from_frame(prepare_corpus(df))
+    fts = FtsLexicalIndex(str(tmp_path), "v1", corpus)
+    mem = LexicalIndex(corpus["lex_text"])
+    queries = [
+        (["naam", "jap"], 2, "naam jap"),
+        (["नाम", "जप"], 2, "नाम जप"),
+        (["seva", "kripa", "se"], 3, "seva kripa se"),
+        (["man"], 1, "man"),
+        (["zzz"], 1, "zzz"),
+    ]
+    for toks, base, q_clean in queries:
+        assert fts.scores(toks, base, q_clean).tolist() == mem.scores(toks, base, q_clean).tolist()
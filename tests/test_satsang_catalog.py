@@ -0,0 +1,44 @@
+import os
+
+from satsang_catalog import archive_listing, scan_catalog, update_listing
+
+PAGE = """<html><head><title>{title} | {date}</title></head><body><h1>{title}</h1></body></html>"""
+
+
+def write(content_dir, rel_path, title, date):
+    path = os.path.join(content_dir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(PAGE.format(title=title, date=date))
+
+
+def test_update_listing_matches_full_build_for_same_name_files(tmp_path):
+    content_dir = str(tmp_path)
+    write(content_dir, os.path.join("Hindi", "12Dec2025.html"), "Naam jap", "12-DEC-2025")
+    write(content_dir, os.path.join("English", "12Dec2025.html"), "Chanting", "12-DEC-2025")
+    write(content_dir, os.path.join("Hindi", "5Nov2025.html"), "Seva", "05-NOV-2025")
+    catalog = scan_catalog(content_dir)
+    listing = archive_listing(content_dir, catalog)
+    assert listing["locate"]["12Dec2025.html"] == "December 2025"
+
+    for rel_path in list(catalog):
+        if not rel_path.endswith("12Dec2025.html"):
+            continue
+        # Remove one of the two same-name files: the other keeps the deep link
+        entry = catalog[rel_path]
+        remaining = {k: v for k, v in catalog.items() if k != rel_path}
+        after_remove = update_listing(listing, content_dir, [entry], [])
+        assert after_remove == archive_listing(content_dir, remaining)
+        assert after_remove["locate"]["12Dec2025.html"] == "December 2025"
+
+        # And add it back (a re-added file goes last in the catalog)
+        restored = {**remaining, rel_path: entry}
+        assert update_listing(after_remove, content_dir, [], [entry]) == archive_listing(content_dir, restored)
+
+
+def test_update_listing_drops_link_of_last_file(tmp_path):
+    content_dir = str(tmp_path)
+    write(content_dir, "5Nov2025.html", "Seva", "05-NOV-2025")
+    catalog = scan_catalog(content_dir)
+    listing = update_listing(archive_listing(content_dir, catalog), content_dir, list(catalog.values()), [])
+    assert listing == archive_listing(content_dir, {})
@@ -0,0 +1,43 @@
+import os
+
+from satsang_catalog import scan_catalog
+from satsang_payload import PayloadCache, build_payloads, parse_fragment_key, fragment_key
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VARIANT_PAGE = os.path.join(ROOT, "satsang_content", "Hindi", "12Dec2025.html")
+
+PAGE = """<html><head><title>Satsang</title></head><body>
+<h2>Naam ki mahima</h2>
+<p>Naam jap kaise kare?</p>
+<p>Prem se, roz.</p>
+</body></html>"""
+
+
+def test_whole_page_payload_has_highlights_and_fragments():
+    payload = build_payloads(PAGE)[""]
+    assert payload["fragments"] == []
+    assert payload["highlights"] == ["Naam ki mahima", "Naam jap kaise kare?"]
+    assert "notifyResize" in payload["html"]  # resize script injected
+
+
+def test_variant_page_splits_into_smaller_fragments(tmp_path):
+    cache = PayloadCache(str(tmp_path), max_bytes=1 << 20)
+    whole = cache.get(VARIANT_PAGE)
+    assert whole["fragments"] == ["short", "long"]
+    for key in whole["fragments"]:
+        assert len(cache.get(VARIANT_PAGE, key)["html"]) < len(whole["html"])
+    # Unknown fragment: the whole page
+    assert cache.get(VARIANT_PAGE, "fr/short") is whole
+    # Served from disk by a fresh cache
+    assert PayloadCache(str(tmp_path), max_bytes=1 << 20).get(VARIANT_PAGE, "short") == cache.get(VARIANT_PAGE, "short")
+
+
+def test_fragment_keys_round_trip():
+    for lang, variant in (("", "long"), ("hi", "short"), ("en", "")):
+        assert parse_fragment_key(fragment_key(lang, variant)) == (lang, variant)
+
+
+def test_catalog_entries_do_not_carry_page_text():
+    catalog = scan_catalog(os.path.join(ROOT, "satsang_content"))
+    assert catalog
+    assert all("highlights" not in e and "share_text" not in e for e in catalog.values())
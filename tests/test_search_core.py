@@ -0,0 +1,49 @@
+import numpy as np
+
+from search_core import LexicalIndex, ResultSet, merge_results
+
+
+def result_set(ids, final):
+    n = len(ids)
+    return ResultSet(np.array(ids), np.array(final, dtype=np.float64), np.zeros(n), np.zeros(n), np.zeros(n, dtype=np.uint8))
+
+
+def test_merge_orders_by_score_and_keeps_sources():
+    merged = merge_results({
+        "satsang": result_set([4, 1], [0.9, 0.5]),
+        "qa": result_set([7, 2, 3], [0.95, 0.5, 0.1]),
+    }, limit=4)
+    assert merged.ids.tolist() == [7, 4, 1, 2]
+    # Ties keep collection order: satsang's 0.5 before qa's
+    assert [merged.collection_of(k) for k in range(len(merged))] == ["qa", "satsang", "satsang", "qa"]
+
+
+def test_merge_nothing():
+    assert len(merge_results({})) == 0
+
+
+def lexical_score(toks, base_tok_count, q_clean, text, phrase_boost=True):
+    # Row-at-a-time reference for LexicalIndex.scores
+    t = (text or "").lower()
+    if not toks:
+        return 0.0
+    score = sum(1 for tok in toks if tok in t) / len(toks)
+    if phrase_boost and base_tok_count <= 2 and q_clean and q_clean in t:
+        score = min(1.0, score + 0.5)
+    return score
+
+
+def test_lexical_index_matches_row_scoring():
+    texts = ["Naam Jap kaise kare", "नाम जप कैसे करें", "seva aur naam", None, "", "İstanbul naam", "NAAM JAP"]
+    index = LexicalIndex(texts)
+    queries = [
+        (["naam", "jap"], 2, "naam jap"),
+        (["नाम", "जप", "naam"], 2, "नाम जप"),
+        (["seva", "naam", "kaise"], 3, "seva naam kaise"),
+        (["i̇stanbul"], 1, "i̇stanbul"),
+        ([], 0, ""),
+    ]
+    for toks, base, q_clean in queries:
+        for boost in (True, False):
+            expected = [lexical_score(toks, base, q_clean, t, boost) for t in texts]
+            assert index.scores(toks, base, q_clean, boost).tolist() == expected
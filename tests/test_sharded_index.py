@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from search_core import LexicalIndex, rank_candidates, top_n
+from sharded_index import ShardedIndex
+
+WORDS = ["naam", "jap", "seva", "guru", "kripa", "man", "bhakti", "prem", "नाम", "सेवा"]
+QUERIES = ["naam jap", "seva", "guru kripa prem", "नाम", "bhakti man seva jap"]
+MODES = ["Hybrid (Recommended)", "Semantic Only", "Literal Only"]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = np.random.default_rng(0)
+    # Few distinct words: many rows tie on lexical score, the hard case for a sharded top-n
+    texts = [" ".join(rng.choice(WORDS, size=rng.integers(2, 6))) for _ in range(997)]
+    embeddings = rng.standard_normal((len(texts), 16)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    queries = [(q, rng.standard_normal(16).astype(np.float32)) for q in QUERIES]
+    return LexicalIndex(texts), embeddings, queries
+
+
+def lexical(lex_index, q):
+    toks = q.lower().split()
+    return lex_index.scores(toks, len(toks), q.lower())
+
+
+@pytest.mark.parametrize("num_shards", [1, 2, 3, 7])
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("fusion", ["weighted", "rrf"])
+def test_sharded_ranking_equals_unsharded(corpus, num_shards, mode, fusion):
+    lex_index, embeddings, queries = corpus
+    index = ShardedIndex(embeddings, lex_index, num_shards)
+    for q, emb in queries:
+        rank = lambda sim, lex: rank_candidates(sim, lex, mode, len(q.split()), 0.75, 0.25, fusion=fusion)
+        expected = rank(embeddings @ emb, lexical(lex_index, q))
+        got = index.search(lambda shard: (shard.embeddings @ emb, lexical(shard.lex_index, q)), rank, mode)
+        assert np.array_equal(got.ids, expected.ids), (q, mode)
+        assert np.allclose(got.final, expected.final)
+
+
+def test_top_n_breaks_ties_by_lowest_index():
+    scores = np.array([1.0, 2.0, 2.0, 0.0, 2.0, 1.0])
+    assert sorted(top_n(scores, 2).tolist()) == [1, 2]
+    assert sorted(top_n(scores, 4).tolist()) == [0, 1, 2, 4]
+    assert sorted(top_n(scores, 10, positive_only=True).tolist()) == [0, 1, 2, 4, 5]
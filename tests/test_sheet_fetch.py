@@ -0,0 +1,80 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sheet_fetch import FETCHED, NOT_MODIFIED, STALE, UNCHANGED, fetch_sheet
+
+
+class Sheet:
+    body = b"Question,Answer\nnaam jap kaise kare,prem se\n"
+    etag = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if Sheet.etag and self.headers.get("If-None-Match") == Sheet.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if Sheet.etag:
+            self.send_header("ETag", Sheet.etag)
+        self.send_header("Content-Length", str(len(Sheet.body)))
+        self.end_headers()
+        self.wfile.write(Sheet.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def sheet_url():
+    Sheet.body, Sheet.etag = b"Question,Answer\nnaam jap kaise kare,prem se\n", '"v1"'
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/sheet.csv"
+    server.shutdown()
+    server.server_close()
+
+
+def test_conditional_fetch(sheet_url, tmp_path):
+    server, url = sheet_url
+    prepared = []
+
+    def prepare(df):
+        prepared.append(len(df))
+        return df
+
+    snap_dir = str(tmp_path / "snapshot")
+    df, source = fetch_sheet(url, snap_dir, prepare)
+    assert source == FETCHED and df["Question"].tolist() == ["naam jap kaise kare"]
+
+    # Same ETag: 304, served from the snapshot without preparing again
+    df, source = fetch_sheet(url, snap_dir, prepare)
+    assert source == NOT_MODIFIED and len(df) == 1 and prepared == [1]
+
+    # No validators, same body: content hash matches
+    Sheet.etag = None
+    _df, source = fetch_sheet(url, snap_dir, prepare)
+    assert source == UNCHANGED and prepared == [1]
+
+    # New content is prepared and snapshotted
+    Sheet.body += b"seva kya hai,nishkaam seva\n"
+    df, source = fetch_sheet(url, snap_dir, prepare)
+    assert source == FETCHED and len(df) == 2 and prepared == [1, 2]
+
+    # A changed prepare_version invalidates the snapshot
+    _df, source = fetch_sheet(url, snap_dir, prepare, prepare_version="2")
+    assert source == FETCHED and prepared == [1, 2, 2]
+
+    # Sheet unreachable: last good snapshot
+    server.shutdown()
+    server.server_close()
+    df, source = fetch_sheet(url, snap_dir, prepare, prepare_version="2", timeout=2)
+    assert source == STALE and len(df) == 2
+
+
+def test_no_snapshot_no_sheet_raises(tmp_path):
+    with pytest.raises(Exception):
+        fetch_sheet("http://127.0.0.1:9/sheet.csv", str(tmp_path / "snapshot"), lambda df: df, timeout=2)
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from text_processing import clean_for_search, clean_series_for_search, clean_series_parallel
+
+TEXTS = [
+    "",
+    None,
+    "   ",
+    "Naam jap kaise kare?",
+    "नाम जप कैसे करें? दंडवत प्रणाम 🙏",
+    "1/10/25, 7:11 PM - +91 98765 43210: Radhe Radhe! guru ji, man nahi lagta",
+    "7:11 PM जय गुरुदेव। सेवा का सही अर्थ क्या है",
+    "Ramesh added Suresh",
+    "प्रणामजी,प्रभु जी। क्या ध्यान‌में नाम जप करें",
+    "ﬁrst Ｆｕｌｌｗｉｄｔｈ  text\twith\nnewlines -- and___underscores",
+    "Hari Bol!! nitai gaur hari bol... JAI GURUDEV 12:05 am",
+    "प्रणाम",
+]
+
+
+def test_series_cleaning_matches_scalar():
+    got = clean_series_for_search(pd.Series(TEXTS, dtype=object))
+    assert got.tolist() == [clean_for_search(t) for t in TEXTS]
+
+
+def test_series_cleaning_keeps_index():
+    series = pd.Series(TEXTS, index=range(100, 100 + len(TEXTS)), dtype=object)
+    got = clean_series_for_search(series)
+    assert got.index.equals(series.index)
+
+
+def test_parallel_cleaning_matches_scalar():
+    got = clean_series_parallel(pd.Series(TEXTS * 3, dtype=object), workers=2, chunk_size=5)
+    assert got.tolist() == [clean_for_search(t) for t in TEXTS * 3]
@@ -0,0 +1,139 @@
+"""
+Text normalization / cleaning shared by the app, the sheet loader and the
+benchmark scripts (importable without starting the Streamlit page).
+
+clean_for_search() is the reference, one string at a time.
+clean_series_for_search() is the vectorized equivalent for whole columns:
+same steps, same order, precompiled patterns, byte-identical output for
+string input.
+"""
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+WHATSAPP_PATTERNS = [
+    r"\b\d{1,2}/\d{1,2}/\d{2,4},\s*\d{1,2}:\d{2}\s*(AM|PM)\s*-\s*",  # "1/10/25, 7:11 PM -"
+    r"\b\d{1,2}:\d{2}\s*(AM|PM)\b",                                # "7:11 PM"
+]
+
+DEVOTIONAL_PHRASES_HI = [
+    "दंडवत प्रणाम", "दण्डवत प्रणाम", "दंडवत", "दण्डवत",
+    "प्रणाम", "प्रणाम जी", "प्रणामजी",
+    "जय गुरु", "जय गुरु।", "जय गुरुजी", "जय गुरुदेव",
+    "प्रभु जी", "प्रभुजी", "प्रभु जी।",
+    "राधे राधे", "जय श्री राधे", "श्री राधे",
+    "हरी बोल", "हरि बोल", "गौर हरि बोल", "निताई गौर हरि बोल",
+]
+
+DEVOTIONAL_PHRASES_ROMAN = [
+    "dandavat pranam", "dandavat", "pranam",
+    "jai guru", "jai gurudev",
+    "prabhu ji", "prabhuji",
+    "radhe radhe", "hari bol",
+    "nitai gaur hari bol", "gaur hari bol",
+]
+
+def normalize_text(s: str) -> str:
+    s = "" if s is None else str(s)
+    s = unicodedata.normalize("NFKC", s)
+    s = s.replace("\u200c", "").replace("\u200d", "")  # ZWNJ/ZWJ
+    return s
+
+def remove_devotional_boilerplate(s: str) -> str:
+    s = normalize_text(s)
+    low = s.lower()
+
+    for p in DEVOTIONAL_PHRASES_ROMAN:
+        low = low.replace(p, " ")
+
+    for p in DEVOTIONAL_PHRASES_HI:
+        low = low.replace(p.lower(), " ")
+        low = re.sub(rf"\b{re.escape(p.lower())}\b[।.!?,;:]*", " ", low)
+
+    low = re.sub(r"\s+", " ", low).strip()
+    return low
+
+def clean_for_search(s: str) -> str:
+    s = normalize_text(s)
+
+    # Remove phone numbers
+    s = re.sub(r"\+?\d[\d\s\-]{8,}\d", " ", s)
+
+    # Remove WhatsApp timestamps
+    for pat in WHATSAPP_PATTERNS:
+        s = re.sub(pat, " ", s, flags=re.IGNORECASE)
+
+    # Remove WhatsApp system fragments
+    s = re.sub(r"\badded\b.*", " ", s, flags=re.IGNORECASE)
+
+    # Remove devotional boilerplate
+    s = remove_devotional_boilerplate(s)
+
+    # Keep letters/numbers/underscore/space + Devanagari
+    s = re.sub(r"[^\w\s\u0900-\u097F]", " ", s)
+
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+# ============================================================
+# VECTORIZED CLEANING (whole columns)
+# ============================================================
+PHONE_RE = re.compile(r"\+?\d[\d\s\-]{8,}\d")
+WHATSAPP_RES = [re.compile(pat, re.IGNORECASE) for pat in WHATSAPP_PATTERNS]
+ADDED_RE = re.compile(r"\badded\b.*", re.IGNORECASE)
+DEVOTIONAL_HI_RES = [
+    (p.lower(), re.compile(rf"\b{re.escape(p.lower())}\b[।.!?,;:]*")) for p in DEVOTIONAL_PHRASES_HI
+]
+NON_WORD_RE = re.compile(r"[^\w\s\u0900-\u097F]")
+SPACES_RE = re.compile(r"\s+")
+
+# Above this many rows prepare_corpus fans cleaning out over processes
+PARALLEL_CLEAN_MIN_ROWS = 50000
+
+def _normalize_series(s: pd.Series) -> pd.Series:
+    s = s.str.normalize("NFKC")
+    return s.str.replace("\u200c", "", regex=False).str.replace("\u200d", "", regex=False)
+
+def clean_series_for_search(series) -> pd.Series:
+    """
+    Vectorized clean_for_search over a column. Each step of the scalar version
+    runs as one pandas .str pass (object dtype, so Python `re` semantics are
+    kept exactly). Missing values are treated as "".
+    """
+    series = pd.Series(series, copy=False).fillna("")
+    s = pd.Series(series.astype(str).to_numpy(dtype=object), index=series.index, dtype=object)
+
+    s = _normalize_series(s)
+    s = s.str.replace(PHONE_RE, " ", regex=True)
+    for pat in WHATSAPP_RES:
+        s = s.str.replace(pat, " ", regex=True)
+    s = s.str.replace(ADDED_RE, " ", regex=True)
+
+    # remove_devotional_boilerplate
+    low = _normalize_series(s).str.lower()
+    for p in DEVOTIONAL_PHRASES_ROMAN:
+        low = low.str.replace(p, " ", regex=False)
+    for p_low, pat in DEVOTIONAL_HI_RES:
+        low = low.str.replace(p_low, " ", regex=False)
+        # The bounded regex can only match where the literal still occurs
+        hit = low.str.contains(p_low, regex=False)
+        if hit.any():
+            low[hit] = low[hit].str.replace(pat, " ", regex=True)
+    low = low.str.replace(SPACES_RE, " ", regex=True).str.strip()
+
+    s = low.str.replace(NON_WORD_RE, " ", regex=True)
+    s = s.str.replace(SPACES_RE, " ", regex=True).str.strip()
+    return s
+
+def clean_series_parallel(series, workers: int | None = None, chunk_size: int = 20000) -> pd.Series:
+    """clean_series_for_search over row chunks in a process pool (for very large sheets)."""
+    series = pd.Series(series, copy=False)
+    if len(series) <= chunk_size:
+        return clean_series_for_search(series)
+    chunks = [series.iloc[i:i + chunk_size] for i in range(0, len(series), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(clean_series_for_search, chunks))
+    return pd.concat(parts)